@@ -0,0 +1,61 @@
+"""add headline title hash and dedupe indexes
+
+Revision ID: 20261019_000003
+Revises: 20251004_000002
+Create Date: 2026-10-19 00:00:03.000000
+
+"""
+import hashlib
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "20261019_000003"
+down_revision = "20251004_000002"
+branch_labels = None
+depends_on = None
+
+
+_BACKFILL_BATCH = 5000
+
+
+def upgrade() -> None:
+    op.add_column("headlines", sa.Column("title_hash", sa.String(length=64), nullable=True))
+
+    # Backfill in Python so the same migration works on Postgres and SQLite
+    bind = op.get_bind()
+    headlines = sa.table(
+        "headlines",
+        sa.column("id", sa.Integer()),
+        sa.column("title", sa.Text()),
+        sa.column("title_hash", sa.String(length=64)),
+    )
+    last_id = 0
+    while True:
+        rows = bind.execute(
+            sa.select(headlines.c.id, headlines.c.title)
+            .where(headlines.c.id > last_id)
+            .order_by(headlines.c.id)
+            .limit(_BACKFILL_BATCH)
+        ).all()
+        if not rows:
+            break
+        bind.execute(
+            headlines.update().where(headlines.c.id == sa.bindparam("_id")).values(title_hash=sa.bindparam("_hash")),
+            [
+                {"_id": r[0], "_hash": hashlib.sha256(str(r[1] or "").strip().encode("utf-8")).hexdigest()}
+                for r in rows
+            ],
+        )
+        last_id = rows[-1][0]
+
+    op.create_index("ix_headlines_title_hash", "headlines", ["title_hash"], unique=False)
+    op.create_index("ix_headlines_url", "headlines", ["url"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_headlines_url", table_name="headlines")
+    op.drop_index("ix_headlines_title_hash", table_name="headlines")
+    op.drop_column("headlines", "title_hash")
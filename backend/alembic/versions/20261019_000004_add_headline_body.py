@@ -0,0 +1,24 @@
+"""add headline body
+
+Revision ID: 20261019_000004
+Revises: 20261019_000003
+Create Date: 2026-10-19 00:00:04.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "20261019_000004"
+down_revision = "20261019_000003"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("headlines", sa.Column("body", sa.Text(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("headlines", "body")
@@ -0,0 +1,51 @@
+"""add headline processing state
+
+Revision ID: 20261019_000005
+Revises: 20261019_000004
+Create Date: 2026-10-19 00:00:05.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "20261019_000005"
+down_revision = "20261019_000004"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "headlines", sa.Column("status", sa.String(length=16), nullable=False, server_default="pending")
+    )
+    op.add_column("headlines", sa.Column("claimed_at", sa.DateTime(timezone=True), nullable=True))
+    op.add_column("headlines", sa.Column("attempts", sa.Integer(), nullable=False, server_default="0"))
+    op.add_column("headlines", sa.Column("processed_at", sa.DateTime(timezone=True), nullable=True))
+
+    # Headlines that already produced mentions or scores were processed under the old anti-join scheme
+    op.execute(
+        """
+        UPDATE headlines SET status = 'done', processed_at = CURRENT_TIMESTAMP
+        WHERE EXISTS (SELECT 1 FROM mentions m WHERE m.headline_id = headlines.id)
+           OR EXISTS (SELECT 1 FROM risk_scores r WHERE r.headline_id = headlines.id)
+        """
+    )
+
+    op.create_index(
+        "ix_headlines_unprocessed",
+        "headlines",
+        ["id"],
+        unique=False,
+        postgresql_where=sa.text("status IN ('pending', 'claimed')"),
+        sqlite_where=sa.text("status IN ('pending', 'claimed')"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_headlines_unprocessed", table_name="headlines")
+    op.drop_column("headlines", "processed_at")
+    op.drop_column("headlines", "attempts")
+    op.drop_column("headlines", "claimed_at")
+    op.drop_column("headlines", "status")
@@ -0,0 +1,58 @@
+"""add explicit headline outcomes, retry backoff and dead-lettering
+
+Revision ID: 20261019_000006
+Revises: 20261019_000005
+Create Date: 2026-10-19 00:00:06.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "20261019_000006"
+down_revision = "20261019_000005"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("headlines", sa.Column("next_retry_at", sa.DateTime(timezone=True), nullable=True))
+    op.add_column("headlines", sa.Column("last_error", sa.String(length=512), nullable=True))
+
+    # Split the old catch-all 'done' state into scored / no_entities
+    op.execute(
+        """
+        UPDATE headlines SET status = CASE
+            WHEN EXISTS (SELECT 1 FROM mentions m WHERE m.headline_id = headlines.id) THEN 'scored'
+            ELSE 'no_entities'
+        END
+        WHERE status = 'done'
+        """
+    )
+
+    op.drop_index("ix_headlines_unprocessed", table_name="headlines")
+    op.create_index(
+        "ix_headlines_unprocessed",
+        "headlines",
+        ["id"],
+        unique=False,
+        postgresql_where=sa.text("status IN ('pending', 'claimed', 'failed')"),
+        sqlite_where=sa.text("status IN ('pending', 'claimed', 'failed')"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_headlines_unprocessed", table_name="headlines")
+    op.create_index(
+        "ix_headlines_unprocessed",
+        "headlines",
+        ["id"],
+        unique=False,
+        postgresql_where=sa.text("status IN ('pending', 'claimed')"),
+        sqlite_where=sa.text("status IN ('pending', 'claimed')"),
+    )
+    op.execute("UPDATE headlines SET status = 'done' WHERE status IN ('scored', 'no_entities', 'dead')")
+    op.execute("UPDATE headlines SET status = 'pending' WHERE status = 'failed'")
+    op.drop_column("headlines", "last_error")
+    op.drop_column("headlines", "next_retry_at")
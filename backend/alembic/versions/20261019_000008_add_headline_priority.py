@@ -0,0 +1,45 @@
+"""add headline priority for watchlist-first claims
+
+Revision ID: 20261019_000008
+Revises: 20261019_000007
+Create Date: 2026-10-19 00:00:08.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "20261019_000008"
+down_revision = "20261019_000007"
+branch_labels = None
+depends_on = None
+
+
+_UNPROCESSED = "status IN ('pending', 'claimed', 'failed')"
+
+
+def upgrade() -> None:
+    op.add_column("headlines", sa.Column("priority", sa.SmallInteger(), nullable=False, server_default="0"))
+    op.drop_index("ix_headlines_unprocessed", table_name="headlines")
+    op.create_index(
+        "ix_headlines_unprocessed",
+        "headlines",
+        ["priority", "id"],
+        unique=False,
+        postgresql_where=sa.text(_UNPROCESSED),
+        sqlite_where=sa.text(_UNPROCESSED),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_headlines_unprocessed", table_name="headlines")
+    op.create_index(
+        "ix_headlines_unprocessed",
+        "headlines",
+        ["id"],
+        unique=False,
+        postgresql_where=sa.text(_UNPROCESSED),
+        sqlite_where=sa.text(_UNPROCESSED),
+    )
+    op.drop_column("headlines", "priority")
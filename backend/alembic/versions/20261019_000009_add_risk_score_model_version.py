@@ -0,0 +1,24 @@
+"""add risk score model version
+
+Revision ID: 20261019_000009
+Revises: 20261019_000008
+Create Date: 2026-10-19 00:00:09.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "20261019_000009"
+down_revision = "20261019_000008"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("risk_scores", sa.Column("model_version", sa.String(length=64), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("risk_scores", "model_version")
@@ -0,0 +1,41 @@
+"""add headline feed indexes and backfill risk composite
+
+Revision ID: 20261019_000010
+Revises: 20261019_000009
+Create Date: 2026-10-19 00:00:10.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "20261019_000010"
+down_revision = "20261019_000009"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_headlines_published_at_id", "headlines", ["published_at", "id"], unique=False)
+    op.create_index("ix_headlines_source_published_at_id", "headlines", ["source", "published_at", "id"], unique=False)
+    op.create_index("ix_mentions_ticker_id_headline_id", "mentions", ["ticker_id", "headline_id"], unique=False)
+    # Same formula as app.utils.risk.score_risk_percent with default weights; unrounded
+    op.execute(
+        """
+        UPDATE risk_scores
+        SET composite =
+            0.6 * (1 - COALESCE(sentiment, 0)) * 50
+            + 0.3 * COALESCE(urgency, 0) * 100
+            + 0.1 * 100 * CASE
+                WHEN 0.5 * ABS(COALESCE(sentiment, 0)) + 0.5 * COALESCE(urgency, 0) > 1 THEN 1
+                ELSE 0.5 * ABS(COALESCE(sentiment, 0)) + 0.5 * COALESCE(urgency, 0)
+            END
+        WHERE composite IS NULL AND (sentiment IS NOT NULL OR urgency IS NOT NULL)
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_mentions_ticker_id_headline_id", table_name="mentions")
+    op.drop_index("ix_headlines_source_published_at_id", table_name="headlines")
+    op.drop_index("ix_headlines_published_at_id", table_name="headlines")
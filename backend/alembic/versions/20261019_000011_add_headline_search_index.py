@@ -0,0 +1,51 @@
+"""add full-text search index on headline titles
+
+Revision ID: 20261019_000011
+Revises: 20261019_000010
+Create Date: 2026-10-19 00:00:11.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "20261019_000011"
+down_revision = "20261019_000010"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    if dialect == "postgresql":
+        op.execute("CREATE INDEX IF NOT EXISTS ix_headlines_title_tsv ON headlines USING gin (to_tsvector('english', title))")
+    elif dialect == "sqlite":
+        op.execute(
+            "CREATE VIRTUAL TABLE IF NOT EXISTS headlines_fts USING fts5("
+            "title, content='headlines', content_rowid='id', tokenize='porter unicode61')"
+        )
+        op.execute(
+            "CREATE TRIGGER IF NOT EXISTS headlines_fts_ai AFTER INSERT ON headlines BEGIN "
+            "INSERT INTO headlines_fts(rowid, title) VALUES (new.id, new.title); END"
+        )
+        op.execute(
+            "CREATE TRIGGER IF NOT EXISTS headlines_fts_ad AFTER DELETE ON headlines BEGIN "
+            "INSERT INTO headlines_fts(headlines_fts, rowid, title) VALUES ('delete', old.id, old.title); END"
+        )
+        op.execute(
+            "CREATE TRIGGER IF NOT EXISTS headlines_fts_au AFTER UPDATE OF title ON headlines BEGIN "
+            "INSERT INTO headlines_fts(headlines_fts, rowid, title) VALUES ('delete', old.id, old.title); "
+            "INSERT INTO headlines_fts(rowid, title) VALUES (new.id, new.title); END"
+        )
+        # Index the rows that already exist
+        op.execute("INSERT INTO headlines_fts(headlines_fts) VALUES ('rebuild')")
+
+
+def downgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    if dialect == "postgresql":
+        op.execute("DROP INDEX IF EXISTS ix_headlines_title_tsv")
+    elif dialect == "sqlite":
+        for trigger in ("headlines_fts_ai", "headlines_fts_ad", "headlines_fts_au"):
+            op.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+        op.execute("DROP TABLE IF EXISTS headlines_fts")
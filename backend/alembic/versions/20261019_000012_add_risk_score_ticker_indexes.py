@@ -0,0 +1,25 @@
+"""add per-ticker risk score indexes
+
+Revision ID: 20261019_000012
+Revises: 20261019_000011
+Create Date: 2026-10-19 00:00:12.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "20261019_000012"
+down_revision = "20261019_000011"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_risk_scores_ticker_id_id", "risk_scores", ["ticker_id", "id"], unique=False)
+    op.create_index("ix_risk_scores_ticker_id_created_at", "risk_scores", ["ticker_id", "created_at"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_risk_scores_ticker_id_created_at", table_name="risk_scores")
+    op.drop_index("ix_risk_scores_ticker_id_id", table_name="risk_scores")
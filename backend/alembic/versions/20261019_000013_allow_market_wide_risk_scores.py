@@ -0,0 +1,27 @@
+"""allow market-wide risk scores (NULL ticker_id)
+
+Revision ID: 20261019_000013
+Revises: 20261019_000012
+Create Date: 2026-10-19 00:00:13.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "20261019_000013"
+down_revision = "20261019_000012"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("risk_scores") as batch:
+        batch.alter_column("ticker_id", existing_type=sa.Integer(), nullable=True)
+
+
+def downgrade() -> None:
+    op.execute("DELETE FROM risk_scores WHERE ticker_id IS NULL")
+    with op.batch_alter_table("risk_scores") as batch:
+        batch.alter_column("ticker_id", existing_type=sa.Integer(), nullable=False)
@@ -0,0 +1,49 @@
+"""Largest-Triangle-Three-Buckets downsampling for chart series.
+
+LTTB keeps the first and last points and, from each of `n_out - 2` equal-count buckets in
+between, the point forming the largest triangle with the previously kept point and the average
+of the next bucket. Spikes and dips survive (unlike averaging or striding) while the payload is
+bounded by `n_out`. The bucket loop is in Python; the per-bucket work is vectorised NumPy, so the
+cost is O(n) array work plus O(n_out) interpreter steps.
+"""
+
+from datetime import datetime, timezone
+from typing import Sequence
+
+import numpy as np
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """Indices of the points to keep, ascending. `x` must be sorted."""
+    n = len(x)
+    if n_out >= n or n <= 2:
+        return np.arange(n)
+    if n_out < 3:
+        return np.array([0, n - 1])
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+
+    # Bucket i spans [edges[i], edges[i + 1]); the first and last points sit outside all buckets
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = n - 1
+    a = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        next_end = edges[i + 2] if i + 2 < len(edges) else n
+        avg_x = x[end:next_end].mean()
+        avg_y = y[end:next_end].mean()
+        # Twice the triangle area; the constant factor does not change the argmax
+        area = np.abs((x[a] - avg_x) * (y[start:end] - y[a]) - (x[a] - x[start:end]) * (avg_y - y[a]))
+        a = start + int(np.argmax(area))
+        selected[i + 1] = a
+    return selected
+
+
+def epoch_seconds(timestamps: Sequence[datetime]) -> np.ndarray:
+    """Timestamps as float seconds; naive values are taken as UTC (how SQLite returns them)."""
+    return np.array(
+        [(t if t.tzinfo else t.replace(tzinfo=timezone.utc)).timestamp() for t in timestamps],
+        dtype=np.float64,
+    )
@@ -4,6 +4,11 @@ from .status import router as status_router
 from .analyze import router as analyze_router
 from .auth import router as auth_router
 from .watchlist import router as watchlist_router
+from .headlines import router as headlines_router
+from .search import router as search_router
+from .tickers import router as tickers_router
+from .risk import router as risk_router
+from .stream import router as stream_router
 
 
 api_v1_router = APIRouter()
@@ -11,5 +16,8 @@ api_v1_router.include_router(status_router)
 api_v1_router.include_router(analyze_router)
 api_v1_router.include_router(auth_router)
 api_v1_router.include_router(watchlist_router)
-
-
+api_v1_router.include_router(headlines_router)
+api_v1_router.include_router(search_router)
+api_v1_router.include_router(tickers_router)
+api_v1_router.include_router(risk_router)
+api_v1_router.include_router(stream_router)
@@ -1,12 +1,14 @@
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel, Field
 from sqlalchemy.orm import Session
 
 from app.db.session import get_db
 from app.nlp import processor
-from app.utils.risk import compute_risk_score
+from app.utils.admission import AdmissionController
+from app.utils.risk import compute_risk_score, estimate_volatility
 
 
 class AnalyzeEntity(BaseModel):
@@ -29,26 +31,22 @@ class AnalyzeResponse(BaseModel):
 
 router = APIRouter(prefix="/v1")
 
+# Inference is CPU-bound: cap concurrent work and shed excess load (ANALYZE_* env vars)
+admission = AdmissionController("analyze", "ANALYZE")
 
-def _estimate_volatility(sentiment: float, urgency: float) -> float:
-    """Lightweight volatility heuristic in [0,1].
 
-    Combines magnitude of sentiment with urgency. Keeps computation local and fast.
-    """
-    s_mag = abs(float(sentiment))
-    u_val = float(urgency)
-    vol = 0.5 * s_mag + 0.5 * u_val
-    if vol < 0.0:
-        return 0.0
-    if vol > 1.0:
-        return 1.0
-    return float(vol)
+@router.post(
+    "/analyze",
+    response_model=AnalyzeResponse,
+    responses={429: {"description": "Client rate limit exceeded"}, 503: {"description": "Inference queue full"}},
+)
+async def analyze_text(payload: AnalyzeRequest, request: Request, db: Session = Depends(get_db)) -> AnalyzeResponse:
+    async with admission.admit(request):
+        # Off the event loop, so queued requests and other routes stay responsive
+        return await run_in_threadpool(_analyze, payload.text, db)
 
 
-@router.post("/analyze", response_model=AnalyzeResponse)
-async def analyze_text(payload: AnalyzeRequest, db: Session = Depends(get_db)) -> AnalyzeResponse:
-    text = payload.text
-
+def _analyze(text: str, db: Session) -> AnalyzeResponse:
     # Entity detection
     entity_strings = processor.detect_entities(text)
 
@@ -74,7 +72,7 @@ async def analyze_text(payload: AnalyzeRequest, db: Session = Depends(get_db)) -
     # Scores
     sentiment = float(processor.sentiment_score(text) or 0.0)
     urgency = float(processor.urgency_score(text))
-    volatility = _estimate_volatility(sentiment, urgency)
+    volatility = estimate_volatility(sentiment, urgency)
 
     composite = compute_risk_score(
         sentiment_score=sentiment,
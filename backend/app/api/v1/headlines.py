@@ -0,0 +1,260 @@
+import logging
+import os
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, status
+from pydantic import BaseModel, Field
+from sqlalchemy import and_, exists, or_, select
+from sqlalchemy.orm import Session
+
+from app.api.v1.pagination import decode_cursor, encode_cursor
+from app.db.session import SessionLocal, get_async_db, get_db
+from app.ingest.news_fetcher import insert_headlines
+from app.models.headline import Headline
+from app.models.mention import Mention
+from app.models.risk_score import RiskScore
+from app.models.ticker import Ticker
+from app.nlp import processor
+from app.utils.security import get_current_superuser
+from app.workers.claims import claim_ids, record_failure
+
+
+logger = logging.getLogger("api.headlines")
+
+router = APIRouter(prefix="/v1/headlines", tags=["headlines"])
+
+
+BULK_MAX_ITEMS = int(os.getenv("HEADLINES_BULK_MAX_ITEMS", "1000"))
+# Enforced by `BodySizeLimitMiddleware` before the body is parsed; the item cap applies after
+BULK_MAX_BYTES = int(os.getenv("HEADLINES_BULK_MAX_BYTES", str(4 * 1024 * 1024)))
+FEED_MAX_LIMIT = int(os.getenv("HEADLINES_FEED_MAX_LIMIT", "200"))
+
+
+class HeadlineIn(BaseModel):
+    text: str = Field(..., min_length=1)
+    url: Optional[str] = None
+    source: Optional[str] = Field(None, max_length=255)
+    published_at: Optional[datetime] = None
+
+
+class BulkHeadlinesRequest(BaseModel):
+    items: List[HeadlineIn]
+    process: bool = False
+
+
+class BulkHeadlinesResponse(BaseModel):
+    received: int
+    inserted: int
+    duplicates: int
+    ids: List[int]
+    queued: bool
+
+
+class HeadlineScoreOut(BaseModel):
+    ticker: str
+    sentiment: Optional[float] = None
+    urgency: Optional[float] = None
+    risk_percent: Optional[float] = None
+    model: Optional[str] = None
+
+
+class HeadlineOut(BaseModel):
+    id: int
+    title: str
+    url: Optional[str] = None
+    source: Optional[str] = None
+    published_at: Optional[datetime] = None
+    status: str
+    scores: List[HeadlineScoreOut] = []
+
+
+class HeadlineFeedResponse(BaseModel):
+    items: List[HeadlineOut]
+    next_cursor: Optional[str] = None
+
+
+def _feed_position(cursor: str) -> Tuple[Optional[datetime], int]:
+    position = decode_cursor(cursor)
+    try:
+        published = datetime.fromisoformat(position["p"]) if position["p"] else None
+        return published, int(position["i"])
+    except (KeyError, TypeError, ValueError):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+
+
+def headline_filters(ticker: Optional[str], source: Optional[str], min_risk: Optional[float]) -> List[Any]:
+    filters: List[Any] = []
+    ticker_id = None
+    if ticker:
+        ticker_id = select(Ticker.id).where(Ticker.symbol == ticker.upper()).scalar_subquery()
+        filters.append(exists().where(Mention.headline_id == Headline.id, Mention.ticker_id == ticker_id))
+    if source:
+        filters.append(Headline.source == source)
+    if min_risk is not None:
+        risky = [RiskScore.headline_id == Headline.id, RiskScore.composite >= min_risk]
+        if ticker_id is not None:
+            risky.append(RiskScore.ticker_id == ticker_id)
+        filters.append(exists().where(*risky))
+    return filters
+
+
+async def _feed_page(
+    db: Any, filters: List[Any], after: Optional[Tuple[Optional[datetime], int]], limit: int
+) -> List[Any]:
+    """Up to `limit` headlines after the cursor: dated ones newest first, then undated by id.
+
+    Each phase is a plain descending range scan on (published_at, id) or the primary key, so a
+    page costs the same at any depth; OFFSET would re-read every skipped row.
+    """
+    rows: List[Any] = []
+    undated_after: Optional[int] = None
+    if after is None or after[0] is not None:
+        dated = [Headline.published_at.is_not(None)]
+        if after is not None:
+            published, last_id = after
+            dated.append(
+                or_(
+                    Headline.published_at < published,
+                    and_(Headline.published_at == published, Headline.id < last_id),
+                )
+            )
+        stmt = (
+            select(Headline)
+            .where(*dated, *filters)
+            .order_by(Headline.published_at.desc(), Headline.id.desc())
+            .limit(limit)
+        )
+        rows = list((await db.execute(stmt)).scalars().all())
+    else:
+        undated_after = after[1]
+    if len(rows) < limit:
+        undated = [Headline.published_at.is_(None)]
+        if undated_after is not None:
+            undated.append(Headline.id < undated_after)
+        stmt = select(Headline).where(*undated, *filters).order_by(Headline.id.desc()).limit(limit - len(rows))
+        rows.extend((await db.execute(stmt)).scalars().all())
+    return rows
+
+
+async def scores_by_headline(db: Any, headline_ids: List[int]) -> Dict[int, List[HeadlineScoreOut]]:
+    """Mentions with their scores for a whole page in one query."""
+    stmt = (
+        select(
+            Mention.headline_id,
+            Ticker.symbol,
+            RiskScore.sentiment,
+            RiskScore.urgency,
+            RiskScore.composite,
+            RiskScore.model,
+        )
+        .join(Ticker, Ticker.id == Mention.ticker_id)
+        .outerjoin(
+            RiskScore,
+            and_(RiskScore.headline_id == Mention.headline_id, RiskScore.ticker_id == Mention.ticker_id),
+        )
+        .where(Mention.headline_id.in_(headline_ids))
+        .order_by(Mention.headline_id, Ticker.symbol)
+    )
+    scores: Dict[int, List[HeadlineScoreOut]] = {}
+    for r in (await db.execute(stmt)).all():
+        scores.setdefault(r.headline_id, []).append(
+            HeadlineScoreOut(
+                ticker=r.symbol,
+                sentiment=r.sentiment,
+                urgency=r.urgency,
+                risk_percent=r.composite,
+                model=r.model,
+            )
+        )
+    return scores
+
+
+@router.get("", response_model=HeadlineFeedResponse)
+async def list_headlines(
+    cursor: Optional[str] = Query(None, description="`next_cursor` from the previous page"),
+    limit: int = Query(50, ge=1),
+    ticker: Optional[str] = Query(None, max_length=32),
+    source: Optional[str] = Query(None, max_length=255),
+    min_risk: Optional[float] = Query(None, ge=0, le=100, description="Minimum risk percent of any score"),
+    db=Depends(get_async_db),
+):
+    """Stored headlines with their scores, newest first, paginated by an opaque keyset cursor."""
+    limit = min(limit, FEED_MAX_LIMIT)
+    after = _feed_position(cursor) if cursor else None
+    rows = await _feed_page(db, headline_filters(ticker, source, min_risk), after, limit)
+    scores = await scores_by_headline(db, [h.id for h in rows]) if rows else {}
+    items = [
+        HeadlineOut(
+            id=h.id,
+            title=h.title,
+            url=h.url,
+            source=h.source,
+            published_at=h.published_at,
+            status=h.status,
+            scores=scores.get(h.id, []),
+        )
+        for h in rows
+    ]
+    next_cursor = None
+    if len(rows) == limit:
+        last = rows[-1]
+        next_cursor = encode_cursor({"p": last.published_at.isoformat() if last.published_at else None, "i": last.id})
+    return HeadlineFeedResponse(items=items, next_cursor=next_cursor)
+
+
+def _process_inline(headline_ids: List[int]) -> None:
+    with SessionLocal() as db:
+        try:
+            processor.process_headlines(db, headline_ids)
+        except Exception as exc:
+            logger.exception("inline processing failed for %d pushed headlines", len(headline_ids))
+            db.rollback()
+            record_failure(db, headline_ids, repr(exc))
+
+
+def _enqueue_processing(background_tasks: BackgroundTasks, headline_ids: List[int], claimed_at: datetime) -> None:
+    """Hand claimed ids to NLP now: Celery when NLP_QUEUE_BACKEND=celery, else after the response."""
+    if os.getenv("NLP_QUEUE_BACKEND", "inline") == "celery":
+        from app.workers.tasks import task_process_headlines
+
+        task_process_headlines.delay(headline_ids, claimed_at=claimed_at.isoformat())
+        return
+    background_tasks.add_task(_process_inline, headline_ids)
+
+
+@router.post("/bulk", response_model=BulkHeadlinesResponse, status_code=status.HTTP_202_ACCEPTED)
+def push_headlines_bulk(
+    payload: BulkHeadlinesRequest,
+    background_tasks: BackgroundTasks,
+    db: Session = Depends(get_db),
+    user=Depends(get_current_superuser),
+):
+    if len(payload.items) > BULK_MAX_ITEMS:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"At most {BULK_MAX_ITEMS} items per request",
+        )
+
+    items = [
+        {"text": i.text, "url": i.url, "source": i.source, "published_at": i.published_at}
+        for i in payload.items
+    ]
+    ids = insert_headlines(db, items)
+
+    queued = False
+    if payload.process and ids:
+        # Process only the ids we claim; the event trigger may already own some of them
+        token = datetime.now(timezone.utc)
+        owned = claim_ids(db, ids, claimed_at=token)
+        if owned:
+            _enqueue_processing(background_tasks, owned, token)
+        queued = bool(owned)
+
+    return BulkHeadlinesResponse(
+        received=len(items),
+        inserted=len(ids),
+        duplicates=len(items) - len(ids),
+        ids=ids,
+        queued=queued,
+    )
@@ -0,0 +1,165 @@
+import os
+from datetime import datetime
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from pydantic import BaseModel
+from sqlalchemy import and_, func, select
+
+from app.analysis.downsample import epoch_seconds, lttb_indices
+from app.db.session import get_async_db
+from app.models.headline import Headline
+from app.models.mention import Mention
+from app.models.risk_score import RiskScore
+from app.models.ticker import Ticker
+from app.utils.http_cache import (
+    FastJSONResponse,
+    cache_headers,
+    is_not_modified,
+    make_etag,
+    not_modified_response,
+)
+
+
+router = APIRouter(prefix="/v1/risk", tags=["risk"])
+
+
+DEFAULT_MAX_POINTS = int(os.getenv("RISK_TIMESERIES_MAX_POINTS", "500"))
+
+
+class RiskNow(BaseModel):
+    risk_percent: Optional[float] = None
+    scored_at: Optional[datetime] = None
+
+
+class RiskPoint(BaseModel):
+    ts: datetime
+    risk_percent: float
+
+
+class RiskHeadline(BaseModel):
+    id: int
+    title: str
+    url: Optional[str] = None
+    source: Optional[str] = None
+    published_at: Optional[datetime] = None
+    sentiment: Optional[float] = None
+    urgency: Optional[float] = None
+    risk_percent: Optional[float] = None
+
+
+class TickerRiskResponse(BaseModel):
+    symbol: str
+    name: Optional[str] = None
+    risk: RiskNow
+    timeseries: List[RiskPoint]
+    # Scores in the range before downsampling
+    total_points: int
+    headlines: List[RiskHeadline]
+
+
+@router.get("/{symbol}", response_model=TickerRiskResponse, response_class=FastJSONResponse)
+async def ticker_risk(
+    request: Request,
+    symbol: str,
+    start: Optional[datetime] = Query(None, description="Scores created at or after"),
+    end: Optional[datetime] = Query(None, description="Scores created before"),
+    max_points: int = Query(DEFAULT_MAX_POINTS, ge=3, le=10000, description="Downsample the series to this size"),
+    headlines: int = Query(10, ge=0, le=50),
+    db=Depends(get_async_db),
+):
+    """Current risk, the risk timeseries and recent headlines for one ticker.
+
+    The series is reduced to `max_points` with LTTB (app.analysis.downsample), which keeps
+    the visual peaks and troughs of a multi-year range at a bounded payload size. The newest
+    score row is the cache validator: revalidations answer 304 after two indexed lookups.
+    """
+    ticker = (
+        await db.execute(select(Ticker.id, Ticker.symbol, Ticker.name).where(Ticker.symbol == symbol.upper()))
+    ).first()
+    if ticker is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Ticker not found")
+
+    watermark = (
+        await db.execute(
+            select(RiskScore.id, RiskScore.created_at)
+            .where(RiskScore.ticker_id == ticker.id)
+            .order_by(RiskScore.id.desc())
+            .limit(1)
+        )
+    ).first()
+    last_id, last_modified = watermark if watermark else (None, None)
+    etag = make_etag("risk", ticker.id, ticker.symbol, last_id, start, end, max_points, headlines)
+    headers = cache_headers(etag, last_modified)
+    if is_not_modified(request, etag, last_modified):
+        return not_modified_response(headers)
+
+    scored = [RiskScore.ticker_id == ticker.id, RiskScore.composite.is_not(None)]
+    latest = (
+        await db.execute(
+            select(RiskScore.composite, RiskScore.created_at)
+            .where(*scored)
+            .order_by(RiskScore.created_at.desc(), RiskScore.id.desc())
+            .limit(1)
+        )
+    ).first()
+
+    series = select(RiskScore.created_at, RiskScore.composite).where(*scored)
+    if start is not None:
+        series = series.where(RiskScore.created_at >= start)
+    if end is not None:
+        series = series.where(RiskScore.created_at < end)
+    rows = (await db.execute(series.order_by(RiskScore.created_at, RiskScore.id))).all()
+    if len(rows) > max_points:
+        keep = lttb_indices(epoch_seconds([r[0] for r in rows]), [float(r[1]) for r in rows], max_points)
+        points = [rows[i] for i in keep]
+    else:
+        points = rows
+
+    recent: List[dict] = []
+    if headlines:
+        published = func.coalesce(Headline.published_at, Headline.created_at)
+        stmt = (
+            select(
+                Headline.id,
+                Headline.title,
+                Headline.url,
+                Headline.source,
+                Headline.published_at,
+                RiskScore.sentiment,
+                RiskScore.urgency,
+                RiskScore.composite,
+            )
+            .join(Mention, Mention.headline_id == Headline.id)
+            .outerjoin(
+                RiskScore,
+                and_(RiskScore.headline_id == Headline.id, RiskScore.ticker_id == Mention.ticker_id),
+            )
+            .where(Mention.ticker_id == ticker.id)
+            .order_by(published.desc(), Headline.id.desc())
+            .limit(headlines)
+        )
+        for r in (await db.execute(stmt)).all():
+            recent.append(
+                {
+                    "id": r.id,
+                    "title": r.title,
+                    "url": r.url,
+                    "source": r.source,
+                    "published_at": r.published_at,
+                    "sentiment": r.sentiment,
+                    "urgency": r.urgency,
+                    "risk_percent": r.composite,
+                }
+            )
+
+    # Plain dicts straight to orjson: thousands of points skip per-item model validation
+    payload = {
+        "symbol": ticker.symbol,
+        "name": ticker.name,
+        "risk": {"risk_percent": latest[0] if latest else None, "scored_at": latest[1] if latest else None},
+        "timeseries": [{"ts": ts, "risk_percent": float(value)} for ts, value in points],
+        "total_points": len(rows),
+        "headlines": recent,
+    }
+    return FastJSONResponse(content=payload, headers=headers)
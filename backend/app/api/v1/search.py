@@ -0,0 +1,132 @@
+import os
+import re
+from datetime import datetime
+from typing import Any, List, Optional, Tuple
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from pydantic import BaseModel
+from sqlalchemy import and_, column, func, literal_column, or_, select, table
+
+from app.api.v1.headlines import HeadlineOut, headline_filters, scores_by_headline
+from app.api.v1.pagination import decode_cursor, encode_cursor
+from app.db.session import engine, get_async_db
+from app.models.headline import Headline
+from app.models.headline_search import SQLITE_FTS_TABLE, TS_CONFIG, title_tsvector
+
+
+router = APIRouter(prefix="/v1", tags=["search"])
+
+
+SEARCH_MAX_LIMIT = int(os.getenv("SEARCH_MAX_LIMIT", "100"))
+# Only the newest N matches are ranked; bounds latency for common terms (0 = rank every match)
+SEARCH_CANDIDATES = int(os.getenv("SEARCH_CANDIDATES", "2000"))
+
+_fts = table(SQLITE_FTS_TABLE, column("rowid"))
+_WORD_RE = re.compile(r"\w+", re.UNICODE)
+
+
+class SearchHit(HeadlineOut):
+    rank: float
+
+
+class SearchResponse(BaseModel):
+    items: List[SearchHit]
+    next_cursor: Optional[str] = None
+
+
+def _sqlite_match(q: str) -> Optional[str]:
+    """FTS5 query matching every word of `q`; quoting keeps operators and punctuation literal."""
+    words = _WORD_RE.findall(q)
+    return " ".join(f'"{w}"' for w in words) or None
+
+
+def _ranked_matches(q: str, filters: List[Any]) -> Any:
+    """(id, rank) of the newest matching headlines; rank is higher-is-better on both backends.
+
+    Ranking scores each candidate row, so a common word over millions of headlines would score
+    every one of them; capping candidates by recency keeps the cost bounded by SEARCH_CANDIDATES.
+    """
+    if engine.dialect.name == "postgresql":
+        query = func.websearch_to_tsquery(literal_column(f"'{TS_CONFIG}'"), q)
+        vector = title_tsvector()
+        stmt = (
+            select(Headline.id.label("id"), func.ts_rank_cd(vector, query).label("rank"))
+            .where(vector.op("@@")(query), *filters)
+            .order_by(Headline.id.desc())
+        )
+    else:
+        match = _sqlite_match(q)
+        if match is None:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail="Query has no searchable words"
+            )
+        # bm25() is lower-is-better; FTS5 walks rowids newest first natively
+        stmt = (
+            select(_fts.c.rowid.label("id"), (-func.bm25(literal_column(SQLITE_FTS_TABLE))).label("rank"))
+            .select_from(_fts)
+            .join(Headline, Headline.id == _fts.c.rowid)
+            .where(literal_column(SQLITE_FTS_TABLE).op("MATCH")(match), *filters)
+            .order_by(_fts.c.rowid.desc())
+        )
+    if SEARCH_CANDIDATES > 0:
+        stmt = stmt.limit(SEARCH_CANDIDATES)
+    return stmt
+
+
+def _search_position(cursor: str) -> Tuple[float, int]:
+    position = decode_cursor(cursor)
+    try:
+        return float(position["r"]), int(position["i"])
+    except (KeyError, TypeError, ValueError):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+
+
+@router.get("/search", response_model=SearchResponse)
+async def search_headlines(
+    q: str = Query(..., min_length=1, max_length=256),
+    ticker: Optional[str] = Query(None, max_length=32),
+    since: Optional[datetime] = Query(None, description="Published at or after"),
+    until: Optional[datetime] = Query(None, description="Published before"),
+    cursor: Optional[str] = Query(None, description="`next_cursor` from the previous page"),
+    limit: int = Query(20, ge=1),
+    db=Depends(get_async_db),
+):
+    """Full-text search over headline titles, best match first.
+
+    Matching runs on the full-text index (see app.models.headline_search), never on a LIKE scan.
+    The newest SEARCH_CANDIDATES matches are ranked; pages continue from the last (rank, id)
+    seen instead of re-reading earlier pages through OFFSET.
+    """
+    limit = min(limit, SEARCH_MAX_LIMIT)
+    filters = headline_filters(ticker, None, None)
+    if since is not None:
+        filters.append(Headline.published_at >= since)
+    if until is not None:
+        filters.append(Headline.published_at < until)
+    ranked = _ranked_matches(q, filters).subquery()
+
+    stmt = select(Headline, ranked.c.rank).join(ranked, ranked.c.id == Headline.id)
+    if cursor:
+        rank, last_id = _search_position(cursor)
+        stmt = stmt.where(or_(ranked.c.rank < rank, and_(ranked.c.rank == rank, ranked.c.id < last_id)))
+    stmt = stmt.order_by(ranked.c.rank.desc(), ranked.c.id.desc()).limit(limit)
+    rows = (await db.execute(stmt)).all()
+
+    scores = await scores_by_headline(db, [h.id for h, _ in rows]) if rows else {}
+    items = [
+        SearchHit(
+            id=h.id,
+            title=h.title,
+            url=h.url,
+            source=h.source,
+            published_at=h.published_at,
+            status=h.status,
+            scores=scores.get(h.id, []),
+            rank=float(rank),
+        )
+        for h, rank in rows
+    ]
+    next_cursor = None
+    if len(rows) == limit:
+        next_cursor = encode_cursor({"r": float(rows[-1][1]), "i": rows[-1][0].id})
+    return SearchResponse(items=items, next_cursor=next_cursor)
@@ -0,0 +1,96 @@
+import asyncio
+import contextlib
+import json
+import os
+from typing import Any, AsyncIterator, Dict, List
+
+from fastapi import APIRouter, HTTPException, Query, Request, WebSocket, WebSocketDisconnect, status
+from fastapi.responses import StreamingResponse
+
+from app.realtime.hub import hub
+
+
+router = APIRouter(prefix="/v1/stream", tags=["stream"])
+
+
+STREAM_MAX_SYMBOLS = int(os.getenv("RISK_STREAM_MAX_SYMBOLS", "50"))
+HEARTBEAT_SECONDS = float(os.getenv("RISK_STREAM_HEARTBEAT_SECONDS", "15"))
+
+
+def parse_symbols(raw: str) -> List[str]:
+    symbols = list(dict.fromkeys(s.strip().upper() for s in raw.split(",") if s.strip()))
+    if not symbols:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="symbols is required")
+    if len(symbols) > STREAM_MAX_SYMBOLS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail=f"At most {STREAM_MAX_SYMBOLS} symbols per stream"
+        )
+    if any(len(s) > 32 for s in symbols):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid symbol")
+    return symbols
+
+
+def format_sse(event: Dict[str, Any]) -> str:
+    return f"event: {event.get('type', 'message')}\ndata: {json.dumps(event, separators=(',', ':'))}\n\n"
+
+
+async def sse_events(request: Request, symbols: List[str]) -> AsyncIterator[str]:
+    sub = hub.subscribe(symbols)
+    try:
+        # Client reconnect delay; after a reconnect it should resync over REST
+        yield "retry: 3000\n\n"
+        while not await request.is_disconnected():
+            event = await sub.next_event(HEARTBEAT_SECONDS)
+            # Comment lines keep proxies from closing an idle connection
+            yield ": keepalive\n\n" if event is None else format_sse(event)
+    finally:
+        hub.unsubscribe(sub)
+
+
+@router.get("/risk")
+async def stream_risk(request: Request, symbols: str = Query(..., description="Comma-separated tickers")):
+    """Server-Sent Events: a `risk` event per new score for the given tickers as workers write them.
+
+    Each connection buffers at most RISK_STREAM_BUFFER events; a client that falls behind gets a
+    `lagged` event with the number dropped and should refetch `/v1/risk/{symbol}`.
+    """
+    return StreamingResponse(
+        sse_events(request, parse_symbols(symbols)),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+async def _wait_for_close(websocket: WebSocket) -> None:
+    # Client messages are not part of the protocol; reading them surfaces the disconnect
+    while True:
+        await websocket.receive_text()
+
+
+@router.websocket("/risk")
+async def stream_risk_ws(websocket: WebSocket, symbols: str = Query(...)):
+    """WebSocket variant of `GET /v1/stream/risk`: the same events as JSON text frames."""
+    try:
+        symbol_list = parse_symbols(symbols)
+    except HTTPException as exc:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION, reason=str(exc.detail))
+        return
+    await websocket.accept()
+    sub = hub.subscribe(symbol_list)
+    closed = asyncio.ensure_future(_wait_for_close(websocket))
+    try:
+        while True:
+            getter = asyncio.ensure_future(sub.next_event(HEARTBEAT_SECONDS))
+            done, _ = await asyncio.wait({getter, closed}, return_when=asyncio.FIRST_COMPLETED)
+            if closed in done:
+                getter.cancel()
+                break
+            event = getter.result()
+            await websocket.send_json(event if event is not None else {"type": "ping"})
+    except WebSocketDisconnect:
+        pass
+    finally:
+        closed.cancel()
+        with contextlib.suppress(asyncio.CancelledError, WebSocketDisconnect):
+            await closed
+        hub.unsubscribe(sub)
@@ -0,0 +1,44 @@
+from typing import Any, Dict, List, Optional
+
+from fastapi import APIRouter, Query
+from pydantic import BaseModel
+from starlette.concurrency import run_in_threadpool
+
+from app.db.session import SessionLocal
+from app.nlp import processor
+
+
+router = APIRouter(prefix="/v1/tickers", tags=["tickers"])
+
+
+class TickerSuggestion(BaseModel):
+    symbol: str
+    name: Optional[str] = None
+
+
+def _refresh_index() -> Dict[str, Any]:
+    with SessionLocal() as db:
+        return processor.get_ticker_index(db)
+
+
+@router.get("/suggest", response_model=List[TickerSuggestion])
+async def suggest_tickers(
+    q: str = Query(..., min_length=1, max_length=64),
+    limit: int = Query(10, ge=1, le=50),
+):
+    """Typeahead over symbols and company names from the processor's in-memory ticker index.
+
+    Served on the event loop with no database access. When the index is stale the request
+    refreshes it in the threadpool; `get_ticker_index` lets one refresh run at a time and hands
+    everyone else the previous index meanwhile.
+    """
+    index = processor.peek_ticker_index()
+    if index is None:
+        index = await run_in_threadpool(_refresh_index)
+    id_to_ticker = index["id_to_ticker"]
+    suggestions: List[TickerSuggestion] = []
+    for tid in index["prefix"].search(q, limit):
+        symbol, name = id_to_ticker[tid]
+        if symbol:
+            suggestions.append(TickerSuggestion(symbol=symbol, name=name))
+    return suggestions
@@ -1,11 +1,20 @@
-from typing import List
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from pydantic import BaseModel, Field
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 
-from app.db.session import get_db
+from app.db.session import get_async_db, get_db
+from app.ingest.priority import invalidate_watch_index
+from app.models.headline import Headline
+from app.models.mention import Mention
+from app.models.risk_score import RiskScore
+from app.models.ticker import Ticker
 from app.models.watchlist_item import WatchlistItem
+from app.utils.http_cache import cache_headers, is_not_modified, make_etag, not_modified_response
+from app.utils.risk import score_risk_percent
 from app.utils.security import get_current_user
 
 
@@ -24,10 +33,155 @@ class WatchlistCreate(BaseModel):
     symbol: str = Field(..., min_length=1, max_length=32)
 
 
+class OverviewHeadline(BaseModel):
+    id: int
+    title: str
+    url: Optional[str] = None
+    source: Optional[str] = None
+    published_at: Optional[datetime] = None
+    risk_percent: Optional[float] = None
+
+
+class WatchlistOverviewItem(BaseModel):
+    id: int
+    symbol: str
+    name: Optional[str] = None
+    risk_percent: Optional[float] = None
+    change_24h: Optional[float] = None
+    scored_at: Optional[datetime] = None
+    headlines: List[OverviewHeadline] = []
+
+
+def _latest_scores(ticker_ids: List[int], before: Optional[datetime] = None) -> Any:
+    """Newest RiskScore per ticker (optionally as of `before`), as one windowed query."""
+    ranked = select(
+        RiskScore.id,
+        RiskScore.ticker_id,
+        RiskScore.sentiment,
+        RiskScore.urgency,
+        RiskScore.volatility,
+        RiskScore.created_at,
+        func.row_number()
+        .over(partition_by=RiskScore.ticker_id, order_by=(RiskScore.created_at.desc(), RiskScore.id.desc()))
+        .label("rn"),
+    ).where(RiskScore.ticker_id.in_(ticker_ids))
+    if before is not None:
+        ranked = ranked.where(RiskScore.created_at <= before)
+    sub = ranked.subquery()
+    return select(sub).where(sub.c.rn == 1)
+
+
+def _recent_headlines(ticker_ids: List[int], per_ticker: int) -> Any:
+    """The `per_ticker` newest headlines mentioning each ticker, with that ticker's score."""
+    published = func.coalesce(Headline.published_at, Headline.created_at)
+    ranked = (
+        select(
+            Mention.ticker_id,
+            Headline.id,
+            Headline.title,
+            Headline.url,
+            Headline.source,
+            Headline.published_at,
+            RiskScore.sentiment,
+            RiskScore.urgency,
+            RiskScore.volatility,
+            func.row_number()
+            .over(partition_by=Mention.ticker_id, order_by=(published.desc(), Headline.id.desc()))
+            .label("rn"),
+        )
+        .join(Headline, Headline.id == Mention.headline_id)
+        .outerjoin(
+            RiskScore,
+            (RiskScore.headline_id == Mention.headline_id) & (RiskScore.ticker_id == Mention.ticker_id),
+        )
+        .where(Mention.ticker_id.in_(ticker_ids))
+    )
+    sub = ranked.subquery()
+    return select(sub).where(sub.c.rn <= per_ticker).order_by(sub.c.ticker_id, sub.c.rn)
+
+
 @router.get("/", response_model=List[WatchlistItemOut])
-def list_watchlist(db: Session = Depends(get_db), user=Depends(get_current_user)):
-    items = db.query(WatchlistItem).filter(WatchlistItem.user_id == user.id).order_by(WatchlistItem.id.desc()).all()
-    return items
+async def list_watchlist(db=Depends(get_async_db), user=Depends(get_current_user)):
+    result = await db.execute(
+        select(WatchlistItem).where(WatchlistItem.user_id == user.id).order_by(WatchlistItem.id.desc())
+    )
+    return result.scalars().all()
+
+
+@router.get("/overview", response_model=List[WatchlistOverviewItem])
+async def watchlist_overview(
+    request: Request,
+    response: Response,
+    headlines: int = Query(3, ge=0, le=10, description="Recent headlines per symbol"),
+    db=Depends(get_async_db),
+    user=Depends(get_current_user),
+):
+    """Latest risk, 24h change and recent headlines for every watched symbol.
+
+    Set-based queries however long the watchlist is: items joined to tickers by symbol, the
+    newest score id across them and the newest score per ticker as of 24h ago (together the
+    cache validator, since the 24h baseline moves with the clock; a revalidation stops here with
+    304), the newest score per ticker, and the newest headlines per ticker.
+    """
+    rows = (
+        await db.execute(
+            select(WatchlistItem.id, WatchlistItem.symbol, Ticker.id, Ticker.name)
+            .outerjoin(Ticker, Ticker.symbol == WatchlistItem.symbol)
+            .where(WatchlistItem.user_id == user.id)
+            .order_by(WatchlistItem.id.desc())
+        )
+    ).all()
+    ticker_ids = [tid for _, _, tid, _ in rows if tid is not None]
+
+    last_id = None
+    previous: Dict[int, Any] = {}
+    if ticker_ids:
+        last_id = (await db.execute(select(func.max(RiskScore.id)).where(RiskScore.ticker_id.in_(ticker_ids)))).scalar()
+        cutoff = datetime.now(timezone.utc) - timedelta(hours=24)
+        previous = {r.ticker_id: r for r in (await db.execute(_latest_scores(ticker_ids, cutoff))).all()}
+    baseline_ids = sorted(r.id for r in previous.values())
+    etag = make_etag("overview", user.id, [tuple(r) for r in rows], last_id, baseline_ids, headlines)
+    headers = cache_headers(etag, private=True)
+    if is_not_modified(request, etag):
+        return not_modified_response(headers)
+    response.headers.update(headers)
+
+    latest: Dict[int, Any] = {}
+    recent: Dict[int, List[OverviewHeadline]] = {}
+    if ticker_ids:
+        latest = {r.ticker_id: r for r in (await db.execute(_latest_scores(ticker_ids))).all()}
+        if headlines:
+            for r in (await db.execute(_recent_headlines(ticker_ids, headlines))).all():
+                recent.setdefault(r.ticker_id, []).append(
+                    OverviewHeadline(
+                        id=r.id,
+                        title=r.title,
+                        url=r.url,
+                        source=r.source,
+                        published_at=r.published_at,
+                        risk_percent=score_risk_percent(r.sentiment, r.urgency, r.volatility),
+                    )
+                )
+
+    overview: List[WatchlistOverviewItem] = []
+    for item_id, symbol, tid, name in rows:
+        now_row = latest.get(tid)
+        then_row = previous.get(tid)
+        risk = score_risk_percent(now_row.sentiment, now_row.urgency, now_row.volatility) if now_row else None
+        risk_then = score_risk_percent(then_row.sentiment, then_row.urgency, then_row.volatility) if then_row else None
+        change = round(risk - risk_then, 2) if risk is not None and risk_then is not None else None
+        overview.append(
+            WatchlistOverviewItem(
+                id=item_id,
+                symbol=symbol,
+                name=name,
+                risk_percent=risk,
+                change_24h=change,
+                scored_at=now_row.created_at if now_row else None,
+                headlines=recent.get(tid, []),
+            )
+        )
+    return overview
 
 
 @router.post("/", response_model=WatchlistItemOut, status_code=status.HTTP_201_CREATED)
@@ -44,6 +198,7 @@ def add_to_watchlist(payload: WatchlistCreate, db: Session = Depends(get_db), us
     db.add(item)
     db.commit()
     db.refresh(item)
+    invalidate_watch_index()
     return item
 
 
@@ -54,6 +209,7 @@ def remove_from_watchlist(item_id: int, db: Session = Depends(get_db), user=Depe
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Item not found")
     db.delete(item)
     db.commit()
+    invalidate_watch_index()
     return None
 
 
@@ -0,0 +1,255 @@
+"""Optional article body enrichment for stored headlines.
+
+Bodies are fetched concurrently with aiohttp under a global and a per-host concurrency limit,
+honouring robots.txt, a per-request timeout and a maximum response size. Extracted main text is
+cached on disk keyed by canonical URL, and HTML parsing runs in worker threads so the event loop
+only ever waits on I/O.
+"""
+
+import asyncio
+import gzip
+import hashlib
+import logging
+import os
+from collections import defaultdict
+from typing import Callable, Dict, Iterable, List, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+from urllib.robotparser import RobotFileParser
+
+import aiohttp
+from bs4 import BeautifulSoup
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session
+
+from app.db.session import SessionLocal
+from app.models.headline import Headline
+
+
+logger = logging.getLogger("article-fetcher")
+
+
+USER_AGENT = os.getenv(
+    "ARTICLE_USER_AGENT", "nlp-risk-analyzer/1.0 (+https://github.com/VeinDevTtv/nlp-risk-analyzer)"
+)
+
+_TRACKING_PARAMS = {"fbclid", "gclid", "mc_cid", "mc_eid", "cmpid", "ref"}
+
+
+def canonical_url(url: str) -> str:
+    """Normalize a URL for cache keys: lowercase scheme/host, drop fragment and tracking params."""
+    parts = urlsplit(url.strip())
+    query = [
+        (k, v)
+        for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if not k.lower().startswith("utm_") and k.lower() not in _TRACKING_PARAMS
+    ]
+    path = parts.path or "/"
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, urlencode(sorted(query)), ""))
+
+
+def extract_main_text(html: str, min_paragraph_chars: int = 40) -> str:
+    """Return the article's main text: paragraphs of <article> if present, else of the page."""
+    soup = BeautifulSoup(html, "html.parser")
+    for tag in soup(["script", "style", "noscript", "nav", "header", "footer", "aside", "form"]):
+        tag.decompose()
+    root = soup.find("article") or soup.body or soup
+    paragraphs = [p.get_text(" ", strip=True) for p in root.find_all("p")]
+    text = "\n".join(p for p in paragraphs if len(p) >= min_paragraph_chars)
+    if not text:
+        text = root.get_text(" ", strip=True)
+    return text.strip()
+
+
+class BodyCache:
+    """On-disk cache of extracted text, one gzip file per canonical URL."""
+
+    def __init__(self, directory: str) -> None:
+        self.directory = directory
+
+    def _path(self, url: str) -> str:
+        key = hashlib.sha256(canonical_url(url).encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, key[:2], f"{key}.txt.gz")
+
+    def get(self, url: str) -> Optional[str]:
+        path = self._path(url)
+        if not os.path.exists(path):
+            return None
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as fh:
+                return fh.read()
+        except Exception:
+            return None
+
+    def put(self, url: str, text: str) -> None:
+        path = self._path(url)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.tmp"
+        with gzip.open(tmp, "wt", encoding="utf-8") as fh:
+            fh.write(text)
+        os.replace(tmp, path)
+
+
+class ArticleFetcher:
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        max_concurrency: Optional[int] = None,
+        per_host_concurrency: Optional[int] = None,
+        timeout_s: Optional[float] = None,
+        max_bytes: Optional[int] = None,
+        respect_robots: Optional[bool] = None,
+    ) -> None:
+        cache_dir = cache_dir or os.getenv("ARTICLE_CACHE_DIR", os.path.join(".cache", "articles"))
+        self.cache = BodyCache(cache_dir)
+        self.max_concurrency = max_concurrency or int(os.getenv("ARTICLE_MAX_CONCURRENCY", "16"))
+        self.per_host_concurrency = per_host_concurrency or int(os.getenv("ARTICLE_PER_HOST_CONCURRENCY", "2"))
+        self.timeout_s = timeout_s or float(os.getenv("ARTICLE_TIMEOUT_SECONDS", "10"))
+        self.max_bytes = max_bytes or int(os.getenv("ARTICLE_MAX_BYTES", str(2 * 1024 * 1024)))
+        if respect_robots is None:
+            respect_robots = os.getenv("ARTICLE_RESPECT_ROBOTS", "1") == "1"
+        self.respect_robots = respect_robots
+        self._robots: Dict[str, Optional[RobotFileParser]] = {}
+        self._robots_locks: Dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+        self._host_sems: Dict[str, asyncio.Semaphore] = {}
+        self._global_sem: Optional[asyncio.Semaphore] = None
+
+    def _host_sem(self, host: str) -> asyncio.Semaphore:
+        sem = self._host_sems.get(host)
+        if sem is None:
+            sem = asyncio.Semaphore(self.per_host_concurrency)
+            self._host_sems[host] = sem
+        return sem
+
+    async def _allowed(self, session: aiohttp.ClientSession, url: str) -> bool:
+        if not self.respect_robots:
+            return True
+        parts = urlsplit(url)
+        origin = f"{parts.scheme}://{parts.netloc}"
+        async with self._robots_locks[origin]:
+            if origin not in self._robots:
+                parser: Optional[RobotFileParser] = None
+                try:
+                    async with session.get(f"{origin}/robots.txt") as resp:
+                        if resp.status == 200:
+                            parser = RobotFileParser()
+                            parser.parse((await resp.text(errors="replace")).splitlines())
+                except Exception:
+                    parser = None
+                # Missing or unreachable robots.txt means no restrictions
+                self._robots[origin] = parser
+        parser = self._robots[origin]
+        return parser is None or parser.can_fetch(USER_AGENT, url)
+
+    async def _download(self, session: aiohttp.ClientSession, url: str) -> Optional[str]:
+        async with session.get(url) as resp:
+            if resp.status != 200:
+                return None
+            if "html" not in resp.headers.get("Content-Type", "text/html").lower():
+                return None
+            declared = resp.content_length
+            if declared is not None and declared > self.max_bytes:
+                return None
+            raw = await resp.content.read(self.max_bytes + 1)
+            if len(raw) > self.max_bytes:
+                return None
+            return raw.decode(resp.charset or "utf-8", errors="replace")
+
+    async def fetch_one(self, session: aiohttp.ClientSession, url: str) -> Optional[str]:
+        cached = await asyncio.to_thread(self.cache.get, url)
+        if cached is not None:
+            return cached
+        if self._global_sem is None:
+            self._global_sem = asyncio.Semaphore(self.max_concurrency)
+        host = urlsplit(url).netloc.lower()
+        async with self._global_sem, self._host_sem(host):
+            try:
+                if not await self._allowed(session, url):
+                    return None
+                html = await self._download(session, url)
+            except Exception:
+                logger.debug("article fetch failed url=%s", url, exc_info=True)
+                return None
+        if not html:
+            return None
+        text = await asyncio.to_thread(extract_main_text, html)
+        if text:
+            await asyncio.to_thread(self.cache.put, url, text)
+        return text or None
+
+    async def fetch_many(self, urls: Iterable[str]) -> Dict[str, Optional[str]]:
+        """Fetch and extract bodies for `urls`; failures and disallowed URLs map to None."""
+        unique = list(dict.fromkeys(u for u in urls if u))
+        if not unique:
+            return {}
+        timeout = aiohttp.ClientTimeout(total=self.timeout_s)
+        async with aiohttp.ClientSession(timeout=timeout, headers={"User-Agent": USER_AGENT}) as session:
+            bodies = await asyncio.gather(*(self.fetch_one(session, u) for u in unique))
+        return dict(zip(unique, bodies))
+
+
+def headlines_missing_body(db: Session, headline_ids: List[int]) -> Dict[int, str]:
+    """Return {id: url} for the given headlines that have a URL but no stored body yet."""
+    if not headline_ids:
+        return {}
+    rows = db.execute(
+        select(Headline.id, Headline.url).where(
+            Headline.id.in_(headline_ids), Headline.body.is_(None), Headline.url.is_not(None)
+        )
+    ).all()
+    return {int(r[0]): str(r[1]) for r in rows}
+
+
+def store_bodies(db: Session, bodies: Dict[int, str]) -> int:
+    """Persist extracted bodies by headline id; returns the number of rows updated."""
+    if not bodies:
+        return 0
+    for hid, text in bodies.items():
+        db.execute(update(Headline).where(Headline.id == hid).values(body=text))
+    db.commit()
+    return len(bodies)
+
+
+async def fetch_missing_bodies(
+    headline_ids: List[int],
+    fetcher: Optional[ArticleFetcher] = None,
+    session_factory: Callable[[], Session] = SessionLocal,
+) -> Dict[int, str]:
+    """Fetch and extract bodies for headlines that lack one, without storing them.
+
+    Returns {id: body} for the pages that yielded text. Safe to cancel: nothing is written.
+    """
+
+    def _targets() -> Dict[int, str]:
+        with session_factory() as db:
+            return headlines_missing_body(db, headline_ids)
+
+    targets = await asyncio.to_thread(_targets)
+    if not targets:
+        return {}
+    by_url = await (fetcher or ArticleFetcher()).fetch_many(targets.values())
+    return {hid: str(by_url[url]) for hid, url in targets.items() if by_url.get(url)}
+
+
+async def save_bodies(bodies: Dict[int, str], session_factory: Callable[[], Session] = SessionLocal) -> int:
+    """`store_bodies` in a worker thread with its own session; returns rows updated."""
+    if not bodies:
+        return 0
+
+    def _store() -> int:
+        with session_factory() as db:
+            return store_bodies(db, bodies)
+
+    return await asyncio.to_thread(_store)
+
+
+async def enrich_headlines(
+    headline_ids: List[int],
+    fetcher: Optional[ArticleFetcher] = None,
+    session_factory: Callable[[], Session] = SessionLocal,
+) -> int:
+    """Fetch, extract and store bodies for headlines that lack one; returns rows updated.
+
+    DB work runs in worker threads with its own sessions so callers on the event loop never block.
+    """
+    bodies = await fetch_missing_bodies(headline_ids, fetcher=fetcher, session_factory=session_factory)
+    return await save_bodies(bodies, session_factory=session_factory)
@@ -0,0 +1,286 @@
+"""Stream historical headline archives (JSONL / CSV, optionally gzipped) into `headlines`.
+
+Rows are read in chunks, parsed and normalized in a process pool, deduplicated against the DB
+by URL and title hash, and loaded with executemany inserts (or COPY into a staging table on
+Postgres). Only a bounded number of chunks is in flight, so memory stays flat regardless of
+archive size.
+
+Usage:
+
+    python -m app.ingest.bulk_import archive.jsonl.gz other.csv --chunk-size 5000 --workers 4
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import gzip
+import io
+import json
+import logging
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import IO, Any, Dict, Iterator, List, Optional, Set, Tuple
+
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from app.ingest.news_fetcher import (
+    _normalize_newsapi_article,
+    _normalize_rss_entry,
+    _parse_datetime,
+    _sha256,
+    dedupe_new_items,
+)
+from app.models.headline import Headline
+
+
+logger = logging.getLogger("bulk-import")
+
+
+@dataclass
+class ImportStats:
+    rows_read: int = 0
+    rows_valid: int = 0
+    rows_inserted: int = 0
+    started_at: float = field(default_factory=time.monotonic)
+
+    @property
+    def duplicates(self) -> int:
+        return self.rows_valid - self.rows_inserted
+
+    def summary(self) -> Dict[str, Any]:
+        elapsed = max(time.monotonic() - self.started_at, 1e-9)
+        return {
+            "rows_read": self.rows_read,
+            "rows_valid": self.rows_valid,
+            "rows_inserted": self.rows_inserted,
+            "duplicates": self.duplicates,
+            "elapsed_s": round(elapsed, 2),
+            "rows_per_s": round(self.rows_read / elapsed, 1),
+        }
+
+
+def _open_text(path: str) -> IO[str]:
+    if path.endswith(".gz"):
+        return gzip.open(path, "rt", encoding="utf-8", newline="")
+    return open(path, "r", encoding="utf-8", newline="")
+
+
+def _detect_format(path: str) -> str:
+    name = path[:-3] if path.endswith(".gz") else path
+    if name.endswith(".csv"):
+        return "csv"
+    return "jsonl"
+
+
+def _iter_chunks(path: str, fmt: str, chunk_size: int) -> Iterator[Tuple[str, List[Any]]]:
+    """Yield raw chunks: JSONL lines are shipped unparsed so `json.loads` runs in the workers."""
+    with _open_text(path) as fh:
+        chunk: List[Any] = []
+        if fmt == "csv":
+            for row in csv.DictReader(fh):
+                chunk.append(row)
+                if len(chunk) >= chunk_size:
+                    yield fmt, chunk
+                    chunk = []
+        else:
+            for line in fh:
+                if line.strip():
+                    chunk.append(line)
+                    if len(chunk) >= chunk_size:
+                        yield fmt, chunk
+                        chunk = []
+        if chunk:
+            yield fmt, chunk
+
+
+def normalize_archive_row(row: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Normalize one archived row into {text, published_at, source, url, title_hash}.
+
+    Accepts raw NewsAPI articles, raw RSS entries (title/link/published) or already-normalized
+    rows (text or title, published_at, source, url).
+    """
+    if isinstance(row.get("source"), dict) or "publishedAt" in row:
+        norm = _normalize_newsapi_article(row)
+    elif "link" in row or "published" in row:
+        source = row.get("source") if isinstance(row.get("source"), str) else None
+        norm = _normalize_rss_entry(row, fallback_source=source)
+    else:
+        published = row.get("published_at")
+        norm = {
+            "text": str(row.get("text") or row.get("title") or "").strip(),
+            "published_at": _parse_datetime(published) if isinstance(published, str) else published,
+            "source": row.get("source") or None,
+            "url": row.get("url") or None,
+        }
+    if not norm.get("text"):
+        return None
+    norm["title_hash"] = _sha256(norm["text"])
+    return norm
+
+
+def _parse_chunk(fmt: str, raw_rows: List[Any]) -> Tuple[int, int, List[Dict[str, Any]]]:
+    """Worker entry point: returns (rows seen, rows valid, normalized rows deduplicated within the chunk).
+
+    Rows valid counts before that dedupe, so `ImportStats.duplicates` includes in-chunk repeats.
+    """
+    out: List[Dict[str, Any]] = []
+    valid = 0
+    seen_urls: Set[str] = set()
+    seen_hashes: Set[str] = set()
+    for raw in raw_rows:
+        try:
+            row = json.loads(raw) if fmt == "jsonl" else raw
+            if not isinstance(row, dict):
+                continue
+            norm = normalize_archive_row(row)
+        except Exception:
+            continue
+        if norm is None:
+            continue
+        valid += 1
+        url = norm.get("url")
+        if (url and url in seen_urls) or norm["title_hash"] in seen_hashes:
+            continue
+        if url:
+            seen_urls.add(url)
+        seen_hashes.add(norm["title_hash"])
+        out.append(norm)
+    return len(raw_rows), valid, out
+
+
+def _load_insert(db: Session, items: List[Dict[str, Any]]) -> int:
+    rows = dedupe_new_items(db, items)
+    if rows:
+        db.execute(insert(Headline), rows)
+        db.commit()
+    return len(rows)
+
+
+_COPY_COLUMNS = ("source", "url", "title", "title_hash", "published_at")
+
+
+def _load_copy(db: Session, items: List[Dict[str, Any]]) -> int:
+    """Postgres fast path: COPY the chunk into a temp table, then one anti-join INSERT."""
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    for i in items:
+        published = i.get("published_at")
+        writer.writerow(
+            [
+                i.get("source") or "",
+                i.get("url") or "",
+                i["text"],
+                i["title_hash"],
+                published.isoformat() if published is not None else "",
+            ]
+        )
+    buf.seek(0)
+
+    conn = db.connection().connection  # DBAPI (psycopg2) connection inside the session transaction
+    with conn.cursor() as cur:
+        cur.execute(
+            "CREATE TEMP TABLE IF NOT EXISTS _headline_import "
+            "(source varchar(255), url text, title text, title_hash varchar(64), published_at timestamptz) "
+            "ON COMMIT DELETE ROWS"
+        )
+        cur.copy_expert(
+            f"COPY _headline_import ({', '.join(_COPY_COLUMNS)}) FROM STDIN WITH (FORMAT csv, NULL '')",
+            buf,
+        )
+        cur.execute(
+            """
+            INSERT INTO headlines (source, url, title, title_hash, published_at)
+            SELECT s.source, s.url, s.title, s.title_hash, s.published_at
+            FROM _headline_import s
+            WHERE NOT EXISTS (SELECT 1 FROM headlines h WHERE h.title_hash = s.title_hash)
+              AND (s.url IS NULL OR NOT EXISTS (SELECT 1 FROM headlines h WHERE h.url = s.url))
+            """
+        )
+        inserted = int(cur.rowcount or 0)
+    db.commit()
+    return inserted
+
+
+def import_files(
+    paths: List[str],
+    chunk_size: int = 5000,
+    workers: Optional[int] = None,
+    method: str = "auto",
+    fmt: str = "auto",
+    progress_every_s: float = 10.0,
+) -> ImportStats:
+    """Import one or more archive files; returns the aggregate stats."""
+    # Imported here so parser processes never build an engine of their own
+    from app.db.session import SessionLocal, engine
+
+    if method == "auto":
+        method = "copy" if engine.dialect.name == "postgresql" else "insert"
+    loader = _load_copy if method == "copy" else _load_insert
+
+    workers = workers or max(1, (os.cpu_count() or 2) - 1)
+    max_in_flight = workers * 2
+    stats = ImportStats()
+    last_report = time.monotonic()
+
+    def _consume(fut: "Future[Tuple[int, int, List[Dict[str, Any]]]]", db: Session) -> None:
+        n_read, n_valid, items = fut.result()
+        stats.rows_read += n_read
+        stats.rows_valid += n_valid
+        if items:
+            stats.rows_inserted += loader(db, items)
+
+    with ProcessPoolExecutor(max_workers=workers) as pool, SessionLocal() as db:
+        in_flight: Set["Future[Tuple[int, int, List[Dict[str, Any]]]]"] = set()
+        for path in paths:
+            path_fmt = _detect_format(path) if fmt == "auto" else fmt
+            for chunk_fmt, chunk in _iter_chunks(path, path_fmt, chunk_size):
+                if len(in_flight) >= max_in_flight:
+                    done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for fut in done:
+                        _consume(fut, db)
+                in_flight.add(pool.submit(_parse_chunk, chunk_fmt, chunk))
+
+                if time.monotonic() - last_report >= progress_every_s:
+                    logger.info("bulk import progress %s", stats.summary())
+                    last_report = time.monotonic()
+
+        for fut in in_flight:
+            _consume(fut, db)
+
+    logger.info("bulk import complete %s", stats.summary())
+    return stats
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Bulk import historical headlines from JSONL/CSV(.gz) archives")
+    parser.add_argument("paths", nargs="+", help="Archive files (.jsonl, .csv, optionally .gz)")
+    parser.add_argument("--format", dest="fmt", choices=["auto", "jsonl", "csv"], default="auto")
+    parser.add_argument("--chunk-size", type=int, default=5000)
+    parser.add_argument("--workers", type=int, default=None, help="Parser processes (default: cpu_count - 1)")
+    parser.add_argument("--method", choices=["auto", "copy", "insert"], default="auto")
+    parser.add_argument("--progress-every", type=float, default=10.0, help="Seconds between progress logs")
+    args = parser.parse_args(argv)
+
+    if not os.getenv("DATABASE_URL"):
+        raise RuntimeError("DATABASE_URL is required")
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    stats = import_files(
+        args.paths,
+        chunk_size=args.chunk_size,
+        workers=args.workers,
+        method=args.method,
+        fmt=args.fmt,
+        progress_every_s=args.progress_every,
+    )
+    json.dump(stats.summary(), sys.stdout)
+    sys.stdout.write("\n")
+
+
+if __name__ == "__main__":
+    main()
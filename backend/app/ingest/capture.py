@@ -0,0 +1,76 @@
+"""Raw feed capture to a compressed local archive.
+
+When FEED_CAPTURE_PATH is set (or a recorder is installed with `set_recorder`), the fetch helpers
+in `news_fetcher` record every raw RSS document and NewsAPI response with its wall-clock
+timestamp. The archive is gzip-compressed JSONL, one record per fetch:
+
+    {"ts": 1760000000.0, "kind": "rss", "source": "<feed url>", "payload_b64": "..."}
+    {"ts": 1760000001.2, "kind": "newsapi", "source": "<endpoint>", "payload": {...}}
+
+`app.ingest.replay` plays an archive back through the same fetch functions.
+"""
+
+import base64
+import gzip
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, Iterator, Optional
+
+
+class FeedRecorder:
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+
+    def _append(self, record: Dict[str, Any]) -> None:
+        line = json.dumps(record, default=str) + "\n"
+        # Each append adds a gzip member; gzip readers transparently concatenate members
+        with self._lock, gzip.open(self.path, "at", encoding="utf-8") as fh:
+            fh.write(line)
+
+    def record_rss(self, feed_url: str, payload: bytes) -> None:
+        self._append(
+            {
+                "ts": time.time(),
+                "kind": "rss",
+                "source": feed_url,
+                "payload_b64": base64.b64encode(payload).decode("ascii"),
+            }
+        )
+
+    def record_newsapi(self, endpoint: str, payload: Any) -> None:
+        self._append({"ts": time.time(), "kind": "newsapi", "source": endpoint, "payload": payload})
+
+
+_recorder: Optional[FeedRecorder] = None
+
+
+def set_recorder(recorder: Optional[FeedRecorder]) -> None:
+    global _recorder
+    _recorder = recorder
+
+
+def active_recorder() -> Optional[FeedRecorder]:
+    """Return the installed recorder, creating one from FEED_CAPTURE_PATH on first use."""
+    global _recorder
+    if _recorder is None:
+        path = os.getenv("FEED_CAPTURE_PATH")
+        if path:
+            _recorder = FeedRecorder(path)
+    return _recorder
+
+
+def read_archive(path: str) -> Iterator[Dict[str, Any]]:
+    """Yield archive records in timestamp order as written; RSS payloads are decoded to bytes."""
+    with gzip.open(path, "rt", encoding="utf-8") as fh:
+        for line in fh:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            if record.get("kind") == "rss":
+                record["payload"] = base64.b64decode(record.pop("payload_b64", ""))
+            yield record
@@ -0,0 +1,260 @@
+"""New-headline notifications published at insert time.
+
+`insert_headlines` announces the ids it wrote so a consumer (`app.workers.trigger`) can score
+them within seconds instead of waiting for the next polling sweep. Backend, via
+HEADLINE_EVENTS_BACKEND:
+
+- `postgres`: `pg_notify` inside the inserting transaction (delivered on commit) and
+  LISTEN on a dedicated connection. The default when DATABASE_URL is Postgres.
+- `redis`: RPUSH onto a Redis list at REDIS_URL and BLPOP on the consumer side, for setups
+  where Postgres is not used.
+- `memory`: an in-process queue, for SQLite and single-process deployments. Ids are only
+  queued once a subscriber exists in this process. The default for non-Postgres URLs.
+- `off`: no notifications; only the polling sweep processes headlines.
+
+Delivery is best effort. Lost notifications are picked up by the polling sweep.
+"""
+
+import abc
+import logging
+import os
+import queue
+import re
+import select
+import time
+from typing import Any, List, Optional
+
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from app.utils import metrics
+
+
+logger = logging.getLogger("headline-events")
+
+
+CHANNEL = os.getenv("HEADLINE_EVENTS_CHANNEL", "new_headlines")
+# pg_notify payloads are capped at 8000 bytes; stay well below with comma-separated ids
+_NOTIFY_IDS_PER_PAYLOAD = 500
+
+_published_total = metrics.counter("headline_events_published_total", "New-headline ids published", ["backend"])
+_dropped_total = metrics.counter("headline_events_dropped_total", "New-headline ids dropped (queue full/error)")
+
+_memory_queue: "Optional[queue.Queue[int]]" = None
+
+
+def backend_name(engine: Optional[Engine] = None) -> str:
+    configured = os.getenv("HEADLINE_EVENTS_BACKEND", "auto").lower()
+    if configured != "auto":
+        return configured
+    if engine is not None and engine.dialect.name == "postgresql":
+        return "postgres"
+    return "memory"
+
+
+def _channel() -> str:
+    if not re.fullmatch(r"[A-Za-z_][A-Za-z0-9_]*", CHANNEL):
+        raise ValueError(f"invalid HEADLINE_EVENTS_CHANNEL: {CHANNEL!r}")
+    return CHANNEL
+
+
+def _redis_client():
+    import redis  # type: ignore
+
+    return redis.Redis.from_url(os.getenv("REDIS_URL", "redis://localhost:6379/0"))
+
+
+def publish_in_transaction(db: Session, headline_ids: List[int]) -> None:
+    """Stage Postgres notifications in the current transaction; a no-op for other backends."""
+    if not headline_ids or backend_name(db.get_bind()) != "postgres":
+        return
+    try:
+        with db.begin_nested():
+            for i in range(0, len(headline_ids), _NOTIFY_IDS_PER_PAYLOAD):
+                chunk = headline_ids[i:i + _NOTIFY_IDS_PER_PAYLOAD]
+                db.execute(
+                    text("SELECT pg_notify(:channel, :payload)"),
+                    {"channel": _channel(), "payload": ",".join(str(h) for h in chunk)},
+                )
+        _published_total.labels("postgres").inc(len(headline_ids))
+    except Exception:
+        _dropped_total.inc(len(headline_ids))
+        logger.warning("pg_notify failed for %d ids", len(headline_ids), exc_info=True)
+
+
+def publish_after_commit(db: Session, headline_ids: List[int]) -> None:
+    """Publish committed ids on the redis/memory backends; a no-op for postgres/off."""
+    if not headline_ids:
+        return
+    backend = backend_name(db.get_bind())
+    if backend == "memory":
+        q = _memory_queue
+        if q is None:
+            return
+        for hid in headline_ids:
+            try:
+                q.put_nowait(int(hid))
+            except queue.Full:
+                _dropped_total.inc()
+                continue
+            _published_total.labels("memory").inc()
+    elif backend == "redis":
+        try:
+            _redis_client().rpush(_channel(), *[int(h) for h in headline_ids])
+            _published_total.labels("redis").inc(len(headline_ids))
+        except Exception:
+            _dropped_total.inc(len(headline_ids))
+            logger.warning("redis publish failed for %d ids", len(headline_ids), exc_info=True)
+
+
+class Subscriber(abc.ABC):
+    @abc.abstractmethod
+    def get(self, timeout_s: float, max_items: int, linger_s: float = 0.0) -> List[int]:
+        """Block up to `timeout_s` for the first id, then collect more for `linger_s`."""
+
+    def close(self) -> None:
+        pass
+
+
+class MemorySubscriber(Subscriber):
+    def __init__(self, maxsize: Optional[int] = None) -> None:
+        global _memory_queue
+        if _memory_queue is None:
+            _memory_queue = queue.Queue(maxsize or int(os.getenv("HEADLINE_EVENTS_MAX_QUEUE", "10000")))
+        self._q = _memory_queue
+
+    def get(self, timeout_s: float, max_items: int, linger_s: float = 0.0) -> List[int]:
+        try:
+            ids = [self._q.get(timeout=timeout_s)]
+        except queue.Empty:
+            return []
+        deadline = time.monotonic() + linger_s
+        while len(ids) < max_items:
+            remaining = deadline - time.monotonic()
+            try:
+                ids.append(self._q.get(timeout=remaining) if remaining > 0 else self._q.get_nowait())
+            except queue.Empty:
+                break
+        return ids
+
+    def close(self) -> None:
+        global _memory_queue
+        if _memory_queue is self._q:
+            _memory_queue = None
+
+
+class RedisSubscriber(Subscriber):
+    def __init__(self) -> None:
+        self._client = _redis_client()
+
+    def get(self, timeout_s: float, max_items: int, linger_s: float = 0.0) -> List[int]:
+        first = self._client.blpop([_channel()], timeout=max(1, int(timeout_s)))
+        if not first:
+            return []
+        ids = [int(first[1])]
+        if linger_s > 0:
+            time.sleep(linger_s)
+        more = self._client.lpop(_channel(), max_items - 1) if max_items > 1 else None
+        ids.extend(int(v) for v in (more or []))
+        return ids
+
+
+class PostgresSubscriber(Subscriber):
+    """LISTEN on a dedicated connection.
+
+    When that connection drops, `get` returns what it has and reconnects on later calls, backing
+    off exponentially from `reconnect_base_s` up to `reconnect_max_s`. Ids announced while
+    disconnected are left to the polling sweep.
+    """
+
+    def __init__(self, engine: Engine, reconnect_base_s: float = 1.0, reconnect_max_s: float = 30.0) -> None:
+        self._engine = engine
+        self._fairy: Any = None
+        self._conn: Any = None
+        self._pending: List[int] = []
+        self.reconnect_base_s = reconnect_base_s
+        self.reconnect_max_s = reconnect_max_s
+        self._backoff_s = 0.0
+        self._next_attempt = 0.0
+        self._connect()
+
+    def _connect(self) -> None:
+        # A dedicated autocommit DBAPI connection; LISTEN only delivers outside a transaction
+        fairy = self._engine.raw_connection()
+        try:
+            conn = fairy.driver_connection
+            conn.autocommit = True
+            with conn.cursor() as cur:
+                cur.execute(f"LISTEN {_channel()}")
+        except Exception:
+            fairy.invalidate()
+            raise
+        self._fairy, self._conn = fairy, conn
+
+    def _disconnect(self) -> None:
+        if self._fairy is not None:
+            try:
+                # Never hand a broken connection back to the pool
+                self._fairy.invalidate()
+            except Exception:
+                pass
+        self._fairy = self._conn = None
+
+    def _ensure_connected(self, timeout_s: float) -> bool:
+        if self._conn is not None:
+            return True
+        wait = self._next_attempt - time.monotonic()
+        if wait > 0:
+            time.sleep(min(wait, max(0.0, timeout_s)))
+            if time.monotonic() < self._next_attempt:
+                return False
+        try:
+            self._connect()
+        except Exception:
+            self._backoff_s = min(self.reconnect_max_s, max(self.reconnect_base_s, self._backoff_s * 2))
+            self._next_attempt = time.monotonic() + self._backoff_s
+            logger.warning("LISTEN reconnect failed; retrying in %.1fs", self._backoff_s, exc_info=True)
+            return False
+        logger.info("LISTEN connection re-established")
+        self._backoff_s = 0.0
+        return True
+
+    def _drain_notifies(self) -> None:
+        self._conn.poll()
+        while self._conn.notifies:
+            note = self._conn.notifies.pop(0)
+            self._pending.extend(int(p) for p in note.payload.split(",") if p)
+
+    def get(self, timeout_s: float, max_items: int, linger_s: float = 0.0) -> List[int]:
+        if not self._pending and self._ensure_connected(timeout_s):
+            try:
+                if select.select([self._conn], [], [], timeout_s)[0]:
+                    self._drain_notifies()
+                if self._pending and linger_s > 0:
+                    time.sleep(linger_s)
+                    self._drain_notifies()
+            except Exception:
+                logger.warning("LISTEN connection lost; reconnecting", exc_info=True)
+                self._disconnect()
+                self._next_attempt = time.monotonic()
+        ids, self._pending = self._pending[:max_items], self._pending[max_items:]
+        return ids
+
+    def close(self) -> None:
+        try:
+            if self._fairy is not None:
+                self._fairy.close()
+        except Exception:
+            pass
+
+
+def subscribe(engine: Engine) -> Optional[Subscriber]:
+    backend = backend_name(engine)
+    if backend == "postgres":
+        return PostgresSubscriber(engine)
+    if backend == "redis":
+        return RedisSubscriber()
+    if backend == "memory":
+        return MemorySubscriber()
+    return None
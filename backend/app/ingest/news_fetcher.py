@@ -1,18 +1,30 @@
 import os
 import hashlib
 import datetime as dt
-from typing import Any, Dict, Iterable, List, Optional
+import urllib.request
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 import aiohttp
 import feedparser
 from email.utils import parsedate_to_datetime
 
-from sqlalchemy import select
+from sqlalchemy import insert, select
 from sqlalchemy.orm import Session
 
+from app.ingest import capture, events, priority
 from app.models.headline import Headline
 
 
+NEWSAPI_URL = "https://newsapi.org/v2/everything"
+
+# Default RSS feeds (lightweight, no auth)
+DEFAULT_RSS_FEEDS: List[str] = [
+    "https://feeds.a.dj.com/rss/RSSMarketsMain.xml",  # WSJ Markets
+    "https://www.reutersagency.com/feed/?best-topics=business-finance&post_type=best",  # Reuters Biz
+    "https://www.investing.com/rss/news_25.rss",  # Investing.com Stocks
+]
+
+
 def _parse_datetime(value: Optional[str]) -> Optional[dt.datetime]:
     """Parse various datetime string formats to aware datetime (UTC).
 
@@ -92,20 +104,18 @@ def _normalize_rss_entry(entry: Any, fallback_source: Optional[str] = None) -> D
     }
 
 
-async def fetch_from_newsapi(
+async def _fetch_newsapi_articles(
     query: str = "stocks OR markets",
     language: str = "en",
     page_size: int = 100,
+    endpoint: Optional[str] = None,
 ) -> List[Dict[str, Any]]:
-    """Fetch headlines from NewsAPI using the NEWSAPI_KEY environment variable.
-
-    Returns a list of normalized headline dicts: {text, published_at, source, url}.
-    """
+    """Return raw NewsAPI article payloads (un-normalized); empty when no key or on non-200."""
     api_key = os.getenv("NEWSAPI_KEY")
     if not api_key:
         return []
 
-    url = "https://newsapi.org/v2/everything"
+    url = endpoint or os.getenv("NEWSAPI_URL") or NEWSAPI_URL
     params = {
         "q": query,
         "language": language,
@@ -120,44 +130,79 @@ async def fetch_from_newsapi(
             if resp.status != 200:
                 return []
             data = await resp.json()
-            articles = data.get("articles", []) if isinstance(data, dict) else []
-            normalized = []
-            for a in articles:
-                try:
-                    norm = _normalize_newsapi_article(a)
-                    if norm.get("text") and norm.get("url"):
-                        normalized.append(norm)
-                except Exception:
-                    continue
-            return normalized
+            recorder = capture.active_recorder()
+            if recorder is not None:
+                recorder.record_newsapi(url, data)
+            return data.get("articles", []) if isinstance(data, dict) else []
 
 
-def fetch_from_rss(feed_urls: Iterable[str]) -> List[Dict[str, Any]]:
-    """Fetch headlines from a list of RSS feeds using feedparser.
+async def fetch_from_newsapi(
+    query: str = "stocks OR markets",
+    language: str = "en",
+    page_size: int = 100,
+    endpoint: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    """Fetch headlines from NewsAPI using the NEWSAPI_KEY environment variable.
 
+    `endpoint` (or NEWSAPI_URL) overrides the API URL, e.g. to point at a replay stub.
     Returns a list of normalized headline dicts: {text, published_at, source, url}.
     """
-    items: List[Dict[str, Any]] = []
-    for feed_url in feed_urls:
+    articles = await _fetch_newsapi_articles(
+        query=query, language=language, page_size=page_size, endpoint=endpoint
+    )
+    normalized = []
+    for a in articles:
         try:
-            parsed = feedparser.parse(feed_url)
+            norm = _normalize_newsapi_article(a)
+            if norm.get("text") and norm.get("url"):
+                normalized.append(norm)
         except Exception:
             continue
+    return normalized
 
+
+def _fetch_rss_entries(feed_url: str) -> Tuple[Optional[str], List[Any]]:
+    """Parse one RSS feed and return (feed_title, raw entries); empty entries on failure.
+
+    While capture is active the raw document is downloaded first so it can be archived.
+    """
+    try:
+        recorder = capture.active_recorder()
+        if recorder is not None:
+            req = urllib.request.Request(feed_url, headers={"User-Agent": "nlp-risk-analyzer/1.0"})
+            with urllib.request.urlopen(req, timeout=20) as resp:
+                payload = resp.read()
+            recorder.record_rss(feed_url, payload)
+            parsed = feedparser.parse(payload)
+        else:
+            parsed = feedparser.parse(feed_url)
+    except Exception:
+        return None, []
+
+    feed_title = None
+    try:
+        feed_title = getattr(parsed.feed, "title", None) if hasattr(parsed, "feed") else None
+        if isinstance(parsed, dict):  # extremely defensive; feedparser returns a custom obj
+            feed_title = parsed.get("feed", {}).get("title") if parsed.get("feed") else feed_title
+    except Exception:
         feed_title = None
-        try:
-            feed_title = getattr(parsed.feed, "title", None) if hasattr(parsed, "feed") else None
-            if isinstance(parsed, dict):  # extremely defensive; feedparser returns a custom obj
-                feed_title = parsed.get("feed", {}).get("title") if parsed.get("feed") else feed_title
-        except Exception:
-            feed_title = None
 
+    entries = []
+    try:
+        entries = list(parsed.entries) if hasattr(parsed, "entries") else []
+    except Exception:
         entries = []
-        try:
-            entries = list(parsed.entries) if hasattr(parsed, "entries") else []
-        except Exception:
-            entries = []
+    return feed_title, entries
 
+
+def fetch_from_rss(feed_urls: Iterable[str]) -> List[Dict[str, Any]]:
+    """Fetch headlines from a list of RSS feeds using feedparser.
+
+    Returns a list of normalized headline dicts: {text, published_at, source, url}.
+    """
+    items: List[Dict[str, Any]] = []
+    for feed_url in feed_urls:
+        feed_title, entries = _fetch_rss_entries(feed_url)
         for entry in entries:
             try:
                 norm = _normalize_rss_entry(entry, fallback_source=feed_title)
@@ -169,63 +214,91 @@ def fetch_from_rss(feed_urls: Iterable[str]) -> List[Dict[str, Any]]:
     return items
 
 
-def save_headlines(db: Session, items: List[Dict[str, Any]]) -> int:
-    """Insert new headlines into DB avoiding duplicates by URL or text hash.
+def dedupe_new_items(db: Session, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Drop items already stored (by URL or title hash) or repeated within the batch.
 
-    Returns the number of inserted rows.
+    Returns `Headline` column dicts (source, url, title, title_hash, published_at) ready to insert.
     """
-    if not items:
-        return 0
+    candidates: List[Dict[str, Any]] = []
+    for i in items:
+        title = str(i.get("text") or "").strip()
+        if not title:
+            continue
+        candidates.append(
+            {
+                "source": i.get("source"),
+                "url": i.get("url"),
+                "title": title,
+                "title_hash": i.get("title_hash") or _sha256(title),
+                "published_at": i.get("published_at"),
+            }
+        )
+    if not candidates:
+        return []
 
     # Prepare sets for fast duplicate checks (existing in DB)
-    incoming_urls = [i.get("url") for i in items if i.get("url")]
+    incoming_urls = [c["url"] for c in candidates if c["url"]]
     existing_urls: set[str] = set()
     if incoming_urls:
         existing_urls = set(
             r[0] for r in db.execute(select(Headline.url).where(Headline.url.in_(incoming_urls))).all()
         )
 
-    incoming_texts = [str(i.get("text") or "").strip() for i in items if i.get("text")]
-    existing_titles: set[str] = set()
-    if incoming_texts:
-        existing_titles = set(
-            r[0] for r in db.execute(select(Headline.title).where(Headline.title.in_(incoming_texts))).all()
-        )
-    existing_title_hashes = {_sha256(t) for t in existing_titles}
+    incoming_hashes = [c["title_hash"] for c in candidates]
+    existing_title_hashes = set(
+        r[0] for r in db.execute(select(Headline.title_hash).where(Headline.title_hash.in_(incoming_hashes))).all()
+    )
 
     # Track duplicates within this batch as well
     seen_urls: set[str] = set(u for u in existing_urls if u)
     seen_hashes: set[str] = set(existing_title_hashes)
 
-    inserted = 0
-    for i in items:
-        title = str(i.get("text") or "").strip()
-        if not title:
-            continue
-        url = i.get("url")
-        text_hash = _sha256(title)
-
+    rows: List[Dict[str, Any]] = []
+    for c in candidates:
+        url = c["url"]
         if url and url in seen_urls:
             continue
-        if text_hash in seen_hashes:
+        if c["title_hash"] in seen_hashes:
             continue
-
-        headline = Headline(
-            source=i.get("source"),
-            url=url,
-            title=title,
-            published_at=i.get("published_at"),
-        )
-        db.add(headline)
-        inserted += 1
+        rows.append(c)
         if url:
             seen_urls.add(url)
-        seen_hashes.add(text_hash)
+        seen_hashes.add(c["title_hash"])
+    return rows
+
+
+def insert_headlines(db: Session, items: List[Dict[str, Any]]) -> List[int]:
+    """Insert new headlines into DB avoiding duplicates by URL or text hash.
 
-    if inserted:
-        db.commit()
+    Returns the ids of the inserted rows, in input order.
+    """
+    if not items:
+        return []
 
-    return inserted
+    rows = dedupe_new_items(db, items)
+    if not rows:
+        return []
+
+    # Watchlist pre-pass: headlines about watched tickers are claimed ahead of the backlog
+    for row, prio in zip(rows, priority.priorities_for(db, [r["title"] for r in rows])):
+        row["priority"] = prio
+
+    # One executemany INSERT ... RETURNING; ids come back in parameter order
+    stmt = insert(Headline).returning(Headline.id, sort_by_parameter_order=True)
+    ids = [int(i) for i in db.execute(stmt, rows).scalars().all()]
+    # Announce the new ids so the event trigger can score them without waiting for a sweep
+    events.publish_in_transaction(db, ids)
+    db.commit()
+    events.publish_after_commit(db, ids)
+    return ids
+
+
+def save_headlines(db: Session, items: List[Dict[str, Any]]) -> int:
+    """Insert new headlines into DB avoiding duplicates by URL or text hash.
+
+    Returns the number of inserted rows.
+    """
+    return len(insert_headlines(db, items))
 
 
 # Convenience orchestration used by schedulers/workers
@@ -237,13 +310,8 @@ def fetch_and_save(db: Session) -> int:
     items: List[Dict[str, Any]] = []
 
     # RSS feeds (lightweight, no auth)
-    rss_feeds = [
-        "https://feeds.a.dj.com/rss/RSSMarketsMain.xml",  # WSJ Markets
-        "https://www.reutersagency.com/feed/?best-topics=business-finance&post_type=best",  # Reuters Biz
-        "https://www.investing.com/rss/news_25.rss",  # Investing.com Stocks
-    ]
     try:
-        items.extend(fetch_from_rss(rss_feeds))
+        items.extend(fetch_from_rss(DEFAULT_RSS_FEEDS))
     except Exception:
         pass
 
@@ -0,0 +1,99 @@
+"""Watchlist-aware priority pre-pass.
+
+Before any NLP runs, headline titles are matched against an in-memory index of every watched
+ticker: its symbol (as a `$cashtag` or a capitalised token) and its company name without legal
+suffixes ("Apple Inc." → "apple"). Matching headlines get `Headline.priority` raised so claims
+take them first and the Celery dispatcher routes them to the high-priority queue.
+
+The index is cached per process for WATCHLIST_INDEX_TTL_SECONDS and rebuilt early when the
+watchlist API changes an item in this process.
+"""
+
+import os
+import re
+import time
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.models.headline import PRIORITY_NORMAL, PRIORITY_WATCHLIST
+from app.models.ticker import Ticker
+from app.models.watchlist_item import WatchlistItem
+
+
+# `$aapl` cashtags in any case, bare symbols only when written in capitals ("A" but not "a")
+_TOKEN_RE = re.compile(r"\$([A-Za-z][A-Za-z.\-]{0,9})|\b([A-Z][A-Z.\-]{0,9})\b")
+_NAME_SUFFIX_RE = re.compile(
+    r"[,.]?\s+(inc|incorporated|corp|corporation|co|company|ltd|limited|plc|holdings|group|"
+    r"class [a-z]|n\.?v|s\.?a|ag|se)\.?$",
+    re.IGNORECASE,
+)
+# Shorter names ("ge", "hp") match too much ordinary text; their symbols still match
+_MIN_NAME_CHARS = 4
+
+_watch_index_cache: Dict[str, Any] = {}
+_watch_index_cache_expiry: float = 0.0
+
+
+def _core_name(name: str) -> str:
+    core = name.strip()
+    while True:
+        stripped = _NAME_SUFFIX_RE.sub("", core).strip()
+        if stripped == core:
+            return core.lower()
+        core = stripped
+
+
+def title_mentions_any(title: str, symbols: Set[str]) -> bool:
+    """Does a cashtag or capitalised token of `title` equal one of `symbols`?"""
+    if not title or not symbols:
+        return False
+    return any((m.group(1) or m.group(2)).upper() in symbols for m in _TOKEN_RE.finditer(title))
+
+
+def invalidate_watch_index() -> None:
+    global _watch_index_cache, _watch_index_cache_expiry
+    _watch_index_cache = {}
+    _watch_index_cache_expiry = 0.0
+
+
+def get_watch_index(db: Session) -> Dict[str, Any]:
+    """Return {"symbols": set of watched symbols, "names": compiled name regex or None}."""
+    global _watch_index_cache, _watch_index_cache_expiry
+    now = time.time()
+    if _watch_index_cache and now < _watch_index_cache_expiry:
+        return _watch_index_cache
+
+    symbols = {str(s).upper() for s in db.execute(select(WatchlistItem.symbol).distinct()).scalars().all() if s}
+    names: Set[str] = set()
+    if symbols:
+        for (name,) in db.execute(select(Ticker.name).where(Ticker.symbol.in_(symbols))).all():
+            core = _core_name(name or "")
+            if len(core) >= _MIN_NAME_CHARS:
+                names.add(core)
+    pattern: Optional["re.Pattern[str]"] = None
+    if names:
+        alternation = "|".join(re.escape(n) for n in sorted(names, key=len, reverse=True))
+        pattern = re.compile(rf"\b(?:{alternation})\b", re.IGNORECASE)
+
+    _watch_index_cache = {"symbols": symbols, "names": pattern}
+    _watch_index_cache_expiry = now + float(os.getenv("WATCHLIST_INDEX_TTL_SECONDS", "60"))
+    return _watch_index_cache
+
+
+def matches_watchlist(title: str, index: Dict[str, Any]) -> bool:
+    if not title:
+        return False
+    if title_mentions_any(title, index["symbols"]):
+        return True
+    names = index["names"]
+    return names is not None and names.search(title) is not None
+
+
+def priorities_for(db: Session, titles: Iterable[str]) -> List[int]:
+    """Priority for each title, in order."""
+    index = get_watch_index(db)
+    if not index["symbols"]:
+        return [PRIORITY_NORMAL for _ in titles]
+    return [PRIORITY_WATCHLIST if matches_watchlist(t or "", index) else PRIORITY_NORMAL for t in titles]
@@ -0,0 +1,195 @@
+"""Deterministic replay of a captured feed archive through the real ingest→NLP path.
+
+A local stub server serves each archived payload, and `fetch_from_rss` / `fetch_from_newsapi`
+fetch from it exactly as they would from the live sources. Records are replayed in order at
+real-time speed (`--speed 1`), accelerated (`--speed 10`) or as fast as possible (`--speed 0`).
+Per-stage timings are reported so runs can be compared across commits.
+
+Usage:
+
+    FEED_CAPTURE_PATH=captures/today.jsonl.gz python -m app.workers.scheduler   # record
+    python -m app.ingest.replay captures/today.jsonl.gz --speed 0 --process --report run.json
+"""
+
+import argparse
+import asyncio
+import cProfile
+import json
+import logging
+import os
+import subprocess
+import sys
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+from aiohttp import web
+from sqlalchemy.orm import Session
+
+from app.db.session import SessionLocal
+from app.ingest import capture
+from app.ingest.news_fetcher import fetch_from_newsapi, fetch_from_rss, insert_headlines
+from app.nlp import processor
+
+
+logger = logging.getLogger("replay")
+
+
+@dataclass
+class ReplayReport:
+    archive: str
+    speed: float
+    commit: Optional[str] = None
+    records: int = 0
+    items_fetched: int = 0
+    inserted: int = 0
+    processed: int = 0
+    fetch_s: float = 0.0
+    persist_s: float = 0.0
+    nlp_s: float = 0.0
+    wall_s: float = 0.0
+
+    @property
+    def headlines_per_s(self) -> float:
+        return self.inserted / self.wall_s if self.wall_s else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        out = asdict(self)
+        out["headlines_per_s"] = round(self.headlines_per_s, 2)
+        for key in ("fetch_s", "persist_s", "nlp_s", "wall_s"):
+            out[key] = round(out[key], 4)
+        return out
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, timeout=5, check=True
+        ).stdout.strip() or None
+    except Exception:
+        return None
+
+
+async def _start_stub(served: Dict[int, Dict[str, Any]]) -> "tuple[web.AppRunner, str]":
+    async def rss(request: web.Request) -> web.Response:
+        record = served.get(int(request.match_info["i"]))
+        if record is None:
+            return web.Response(status=404)
+        return web.Response(body=record["payload"], content_type="application/rss+xml")
+
+    async def newsapi(request: web.Request) -> web.Response:
+        record = served.get(int(request.match_info["i"]))
+        if record is None:
+            return web.Response(status=404)
+        return web.json_response(record["payload"])
+
+    app = web.Application()
+    app.router.add_get("/rss/{i}", rss)
+    app.router.add_get("/newsapi/{i}", newsapi)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]  # type: ignore[union-attr]
+    return runner, f"http://127.0.0.1:{port}"
+
+
+async def replay_archive(
+    path: str,
+    speed: float = 0.0,
+    process: bool = False,
+    session_factory: Callable[[], Session] = SessionLocal,
+) -> ReplayReport:
+    """Replay `path` through fetch → save → (optionally) NLP and return timing totals."""
+    report = ReplayReport(archive=path, speed=speed, commit=_git_commit())
+    served: Dict[int, Dict[str, Any]] = {}
+    runner, base = await _start_stub(served)
+
+    def _persist(items: List[Dict[str, Any]]) -> List[int]:
+        with session_factory() as db:
+            return insert_headlines(db, items)
+
+    def _process(ids: List[int]) -> int:
+        with session_factory() as db:
+            return len(processor.process_headlines(db, ids))
+
+    # fetch_from_newsapi is a no-op without a key; the stub ignores it
+    previous_key = os.environ.get("NEWSAPI_KEY")
+    os.environ["NEWSAPI_KEY"] = previous_key or "replay"
+    started = time.perf_counter()
+    first_ts: Optional[float] = None
+    try:
+        for i, record in enumerate(capture.read_archive(path)):
+            ts = float(record.get("ts") or 0.0)
+            if first_ts is None:
+                first_ts = ts
+            if speed > 0:
+                due = (ts - first_ts) / speed - (time.perf_counter() - started)
+                if due > 0:
+                    await asyncio.sleep(due)
+
+            served[i] = record
+            t0 = time.perf_counter()
+            if record.get("kind") == "rss":
+                items = await asyncio.to_thread(fetch_from_rss, [f"{base}/rss/{i}"])
+            elif record.get("kind") == "newsapi":
+                items = await fetch_from_newsapi(endpoint=f"{base}/newsapi/{i}")
+            else:
+                items = []
+            served.pop(i, None)
+            report.fetch_s += time.perf_counter() - t0
+            report.records += 1
+            report.items_fetched += len(items)
+
+            t0 = time.perf_counter()
+            ids = await asyncio.to_thread(_persist, items) if items else []
+            report.persist_s += time.perf_counter() - t0
+            report.inserted += len(ids)
+
+            if process and ids:
+                t0 = time.perf_counter()
+                report.processed += await asyncio.to_thread(_process, ids)
+                report.nlp_s += time.perf_counter() - t0
+    finally:
+        report.wall_s = time.perf_counter() - started
+        if previous_key is None:
+            os.environ.pop("NEWSAPI_KEY", None)
+        await runner.cleanup()
+    return report
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Replay a captured feed archive through ingest and NLP")
+    parser.add_argument("archive", help="Archive written via FEED_CAPTURE_PATH (.jsonl.gz)")
+    parser.add_argument("--speed", type=float, default=0.0, help="1 = real time, 10 = 10x, 0 = as fast as possible")
+    parser.add_argument("--process", action="store_true", help="Run NLP on inserted headlines")
+    parser.add_argument("--profile", default=None, help="Write cProfile stats to this path")
+    parser.add_argument("--report", default=None, help="Write the JSON report to this path")
+    args = parser.parse_args(argv)
+
+    if not os.getenv("DATABASE_URL"):
+        raise RuntimeError("DATABASE_URL is required")
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    # Never re-record while replaying
+    os.environ.pop("FEED_CAPTURE_PATH", None)
+    capture.set_recorder(None)
+
+    profiler = cProfile.Profile() if args.profile else None
+    if profiler is not None:
+        profiler.enable()
+    report = asyncio.run(replay_archive(args.archive, speed=args.speed, process=args.process))
+    if profiler is not None:
+        profiler.disable()
+        profiler.dump_stats(args.profile)
+
+    out = report.to_dict()
+    if args.report:
+        with open(args.report, "w", encoding="utf-8") as fh:
+            json.dump(out, fh, indent=2)
+    json.dump(out, sys.stdout)
+    sys.stdout.write("\n")
+
+
+if __name__ == "__main__":
+    main()
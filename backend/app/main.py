@@ -3,8 +3,12 @@ import logging
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.api.v1 import api_v1_router
+from app.api.v1 import headlines as headlines_api
 from app.utils.logging import setup_logging
 from app.nlp import processor
+from app.realtime import publish as risk_stream
+from app.realtime.hub import RedisBridge
+from app.utils.body_limit import BodySizeLimitMiddleware
 
 setup_logging()
 
@@ -55,12 +59,34 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Refuse oversized bulk pushes before their JSON is read and validated
+app.add_middleware(BodySizeLimitMiddleware, limits={"/v1/headlines/bulk": headlines_api.BULK_MAX_BYTES})
+
+# Compress responses above HTTP_COMPRESSION_MIN_BYTES: brotli (with gzip fallback) when
+# brotli-asgi is installed, gzip otherwise.
+_compression_min_bytes = int(os.getenv("HTTP_COMPRESSION_MIN_BYTES", "1000"))
+try:
+    from brotli_asgi import BrotliMiddleware  # type: ignore
+
+    app.add_middleware(
+        BrotliMiddleware,
+        minimum_size=_compression_min_bytes,
+        gzip_fallback=True,
+        # Compressors buffer; event streams must reach the client as they are written
+        excluded_handlers=[r"^/v1/stream/"],
+    )
+except Exception:
+    from starlette.middleware.gzip import GZipMiddleware
+
+    app.add_middleware(GZipMiddleware, minimum_size=_compression_min_bytes)
+
 # Prometheus metrics endpoint (optional)
 try:
-    from prometheus_client import CONTENT_TYPE_LATEST, CollectorRegistry, Counter, generate_latest  # type: ignore
+    from prometheus_client import CONTENT_TYPE_LATEST, Counter, generate_latest  # type: ignore
     from fastapi import Response
+    from app.db.session import update_pool_metrics
+    from app.utils.metrics import registry
 
-    registry = CollectorRegistry()
     http_requests_total = Counter(
         "http_requests_total",
         "Total HTTP requests",
@@ -79,6 +105,7 @@ try:
 
     @app.get("/metrics")
     async def metrics() -> Response:  # type: ignore
+        update_pool_metrics()
         data = generate_latest(registry)
         return Response(content=data, media_type=CONTENT_TYPE_LATEST)
 except Exception:
@@ -95,3 +122,18 @@ async def _startup_warm_nlp():  # type: ignore
         except Exception:
             # Non-fatal: proceed even if warmup fails
             pass
+
+
+# Live risk events from workers on other processes/replicas arrive over Redis pub/sub
+_risk_bridge = RedisBridge()
+
+
+@app.on_event("startup")
+async def _startup_risk_stream():  # type: ignore
+    if risk_stream.backend_name() == "redis":
+        _risk_bridge.start()
+
+
+@app.on_event("shutdown")
+async def _shutdown_risk_stream():  # type: ignore
+    await _risk_bridge.stop()
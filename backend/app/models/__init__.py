@@ -5,8 +5,10 @@ from app.db.base import Base  # noqa: F401  (re-export Base for Alembic's target
 from app.models import user  # noqa: F401
 from app.models import ticker  # noqa: F401
 from app.models import headline  # noqa: F401
+from app.models import headline_search  # noqa: F401
 from app.models import mention  # noqa: F401
 from app.models import risk_score  # noqa: F401
+from app.models import scheduler_lease  # noqa: F401
 
 # Also export names for convenience
 from app.models.user import User  # noqa: F401
@@ -14,5 +16,6 @@ from app.models.ticker import Ticker  # noqa: F401
 from app.models.headline import Headline  # noqa: F401
 from app.models.mention import Mention  # noqa: F401
 from app.models.risk_score import RiskScore  # noqa: F401
+from app.models.scheduler_lease import SchedulerLease  # noqa: F401
 
 
@@ -1,19 +1,60 @@
-from sqlalchemy import Column, DateTime, Integer, String, Text, func
+from sqlalchemy import Column, DateTime, Index, Integer, SmallInteger, String, Text, func, text
 from sqlalchemy.orm import relationship
 
 from app.db.base import Base
 
 
+# Headline processing states
+STATUS_PENDING = "pending"
+STATUS_CLAIMED = "claimed"
+# Terminal outcomes
+STATUS_SCORED = "scored"
+STATUS_NO_ENTITIES = "no_entities"
+STATUS_DEAD = "dead"
+# Awaiting retry after `next_retry_at`
+STATUS_FAILED = "failed"
+
+# Claim order: higher first (see app.ingest.priority)
+PRIORITY_NORMAL = 0
+PRIORITY_WATCHLIST = 1
+
+
 class Headline(Base):
     __tablename__ = "headlines"
+    __table_args__ = (
+        # Partial index: claim scans only touch rows still waiting for (or stuck in) processing
+        Index(
+            "ix_headlines_unprocessed",
+            "priority",
+            "id",
+            postgresql_where=text("status IN ('pending', 'claimed', 'failed')"),
+            sqlite_where=text("status IN ('pending', 'claimed', 'failed')"),
+        ),
+        # Keyset pagination of the headline feed, newest first (see app.api.v1.headlines)
+        Index("ix_headlines_published_at_id", "published_at", "id"),
+        Index("ix_headlines_source_published_at_id", "source", "published_at", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     source = Column(String(255), nullable=True)
-    url = Column(Text, nullable=True)
+    url = Column(Text, nullable=True, index=True)
     title = Column(Text, nullable=False)
+    # sha256 hex of the stripped title; indexed so dedupe never compares full titles
+    title_hash = Column(String(64), nullable=True, index=True)
     published_at = Column(DateTime(timezone=True), nullable=True)
+    # Extracted article text, filled by the optional body enrichment stage
+    body = Column(Text, nullable=True)
     created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
 
+    # Processing state, see app.workers.claims
+    status = Column(String(16), nullable=False, default=STATUS_PENDING, server_default=STATUS_PENDING)
+    claimed_at = Column(DateTime(timezone=True), nullable=True)
+    attempts = Column(Integer, nullable=False, default=0, server_default="0")
+    processed_at = Column(DateTime(timezone=True), nullable=True)
+    next_retry_at = Column(DateTime(timezone=True), nullable=True)
+    last_error = Column(String(512), nullable=True)
+    priority = Column(SmallInteger, nullable=False, default=PRIORITY_NORMAL, server_default="0")
+
     mentions = relationship("Mention", back_populates="headline", cascade="all, delete-orphan")
 
 
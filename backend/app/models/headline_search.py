@@ -0,0 +1,52 @@
+"""Full-text index over `headlines.title`, kept current by the database itself.
+
+Postgres: a GIN index on the `to_tsvector('english', title)` expression; queries that use the same
+expression (`title_tsvector`) are answered from the index, and every insert path (ORM, bulk
+INSERT, COPY) maintains it without application code.
+
+SQLite: an external-content FTS5 table `headlines_fts` (porter stemming, like the english
+configuration) synced by insert/update/delete triggers on `headlines`.
+
+Both are created with the schema (`create_all`) and by migration 20261019_000011.
+"""
+
+from sqlalchemy import DDL, event, func, literal_column
+
+from app.models.headline import Headline
+
+
+TS_CONFIG = "english"
+SQLITE_FTS_TABLE = "headlines_fts"
+
+
+def title_tsvector():
+    """The indexed expression; use it verbatim in queries so Postgres picks the GIN index."""
+    return func.to_tsvector(literal_column(f"'{TS_CONFIG}'"), Headline.title)
+
+
+_POSTGRES_DDL = [
+    f"CREATE INDEX IF NOT EXISTS ix_headlines_title_tsv ON headlines USING gin (to_tsvector('{TS_CONFIG}', title))",
+]
+
+_SQLITE_DDL = [
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS {SQLITE_FTS_TABLE} USING fts5("
+    "title, content='headlines', content_rowid='id', tokenize='porter unicode61')",
+    f"CREATE TRIGGER IF NOT EXISTS headlines_fts_ai AFTER INSERT ON headlines BEGIN "
+    f"INSERT INTO {SQLITE_FTS_TABLE}(rowid, title) VALUES (new.id, new.title); END",
+    f"CREATE TRIGGER IF NOT EXISTS headlines_fts_ad AFTER DELETE ON headlines BEGIN "
+    f"INSERT INTO {SQLITE_FTS_TABLE}({SQLITE_FTS_TABLE}, rowid, title) VALUES ('delete', old.id, old.title); END",
+    f"CREATE TRIGGER IF NOT EXISTS headlines_fts_au AFTER UPDATE OF title ON headlines BEGIN "
+    f"INSERT INTO {SQLITE_FTS_TABLE}({SQLITE_FTS_TABLE}, rowid, title) VALUES ('delete', old.id, old.title); "
+    f"INSERT INTO {SQLITE_FTS_TABLE}(rowid, title) VALUES (new.id, new.title); END",
+]
+
+for _statement in _POSTGRES_DDL:
+    event.listen(Headline.__table__, "after_create", DDL(_statement).execute_if(dialect="postgresql"))
+for _statement in _SQLITE_DDL:
+    event.listen(Headline.__table__, "after_create", DDL(_statement).execute_if(dialect="sqlite"))
+# The triggers go with the table; the FTS table would outlive it with stale rowids
+event.listen(
+    Headline.__table__,
+    "before_drop",
+    DDL(f"DROP TABLE IF EXISTS {SQLITE_FTS_TABLE}").execute_if(dialect="sqlite"),
+)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, DateTime, Float, ForeignKey, Integer, String, func
+from sqlalchemy import Column, DateTime, Float, ForeignKey, Index, Integer, String, func
 from sqlalchemy.orm import relationship
 
 from app.db.base import Base
@@ -6,6 +6,10 @@ from app.db.base import Base
 
 class Mention(Base):
     __tablename__ = "mentions"
+    __table_args__ = (
+        # Headlines mentioning a ticker, for the feed's ticker filter
+        Index("ix_mentions_ticker_id_headline_id", "ticker_id", "headline_id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     headline_id = Column(Integer, ForeignKey("headlines.id", ondelete="CASCADE"), nullable=False, index=True)
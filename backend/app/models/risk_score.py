@@ -1,4 +1,4 @@
-from sqlalchemy import Column, DateTime, Float, ForeignKey, Integer, String, func
+from sqlalchemy import Column, DateTime, Float, ForeignKey, Index, Integer, String, func
 from sqlalchemy.orm import relationship
 
 from app.db.base import Base
@@ -6,15 +6,24 @@ from app.db.base import Base
 
 class RiskScore(Base):
     __tablename__ = "risk_scores"
+    __table_args__ = (
+        # Newest score per ticker (HTTP cache validator) and per-ticker time ranges
+        Index("ix_risk_scores_ticker_id_id", "ticker_id", "id"),
+        Index("ix_risk_scores_ticker_id_created_at", "ticker_id", "created_at"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
-    ticker_id = Column(Integer, ForeignKey("tickers.id", ondelete="CASCADE"), nullable=False, index=True)
+    # NULL for market-wide scores of headlines without tickers (NLP_SCORE_WITHOUT_TICKERS=1)
+    ticker_id = Column(Integer, ForeignKey("tickers.id", ondelete="CASCADE"), nullable=True, index=True)
     headline_id = Column(Integer, ForeignKey("headlines.id", ondelete="SET NULL"), nullable=True, index=True)
 
     model = Column(String(64), nullable=False, default="finbert")
+    # Registry version (pinned revision) of `model`; NULL when loaded from the Hub by name
+    model_version = Column(String(64), nullable=True)
     sentiment = Column(Float, nullable=True)
     urgency = Column(Float, nullable=True)
     volatility = Column(Float, nullable=True)
+    # Risk percent (0..100) from app.utils.risk.score_risk_percent
     composite = Column(Float, nullable=True)
     created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
 
@@ -0,0 +1,15 @@
+from sqlalchemy import Column, DateTime, String
+
+from app.db.base import Base
+
+
+class SchedulerLease(Base):
+    """A named lease held by one scheduler replica until `expires_at` unless renewed."""
+
+    __tablename__ = "scheduler_leases"
+
+    name = Column(String(64), primary_key=True)
+    holder = Column(String(255), nullable=True)
+    acquired_at = Column(DateTime(timezone=True), nullable=True)
+    renewed_at = Column(DateTime(timezone=True), nullable=True)
+    expires_at = Column(DateTime(timezone=True), nullable=True)
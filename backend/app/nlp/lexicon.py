@@ -0,0 +1,67 @@
+"""Fast finance lexicon sentiment, the first tier of the sentiment cascade.
+
+A small weighted word list in the spirit of the Loughran-McDonald finance dictionary, with
+negation handling. It takes microseconds per headline and yields both a score and a confidence;
+`app.nlp.processor` only escalates low-confidence headlines to the transformer.
+"""
+
+import math
+import re
+from typing import Dict, List, Tuple
+
+
+# Bump when the word lists or scoring change; recorded on RiskScore.model_version
+LEXICON_VERSION = "1"
+
+# Weight ~ how unambiguously the term signals polarity in a financial headline
+POSITIVE: Dict[str, float] = {
+    "beat": 1.0, "beats": 1.0, "tops": 0.8, "surge": 1.0, "surges": 1.0, "soar": 1.0, "soars": 1.0,
+    "jump": 0.8, "jumps": 0.8, "rally": 0.8, "rallies": 0.8, "record": 0.6, "upgrade": 1.0,
+    "upgrades": 1.0, "upgraded": 1.0, "outperform": 0.8, "raises": 0.6, "raised": 0.6, "boost": 0.7,
+    "boosts": 0.7, "profit": 0.5, "profits": 0.5, "growth": 0.5, "gain": 0.7, "gains": 0.7,
+    "strong": 0.6, "approval": 0.8, "approved": 0.8, "wins": 0.8, "win": 0.7, "buyback": 0.8,
+    "dividend": 0.5, "rebound": 0.7, "rebounds": 0.7, "exceeds": 0.9, "expands": 0.5, "climbs": 0.7,
+}
+NEGATIVE: Dict[str, float] = {
+    "bankruptcy": 1.5, "bankrupt": 1.5, "default": 1.2, "defaults": 1.2, "fraud": 1.5, "plunge": 1.2,
+    "plunges": 1.2, "plummets": 1.2, "crash": 1.2, "crashes": 1.2, "slump": 1.0, "slumps": 1.0,
+    "tumble": 1.0, "tumbles": 1.0, "sinks": 1.0, "falls": 0.7, "drop": 0.7, "drops": 0.7,
+    "miss": 1.0, "misses": 1.0, "downgrade": 1.0, "downgrades": 1.0, "downgraded": 1.0, "loss": 0.8,
+    "losses": 0.8, "layoffs": 0.9, "cuts": 0.6, "cut": 0.6, "lawsuit": 0.9, "sued": 0.9,
+    "investigation": 0.9, "probe": 0.9, "recall": 0.9, "warning": 0.9, "halts": 0.8, "halted": 0.8,
+    "delisted": 1.2, "weak": 0.7, "slowdown": 0.7, "fine": 0.6, "fined": 0.9, "resigns": 0.7,
+    "breach": 1.0, "hack": 1.0, "shortfall": 0.9, "writedown": 1.0, "impairment": 0.9,
+}
+NEGATIONS = {"no", "not", "never", "without", "fails", "failed", "avoids", "avoid", "denies"}
+
+_WORD_RE = re.compile(r"[a-z][a-z\-']*")
+# Lookback window for negations ("not expected to miss" flips "miss")
+_NEGATION_WINDOW = 3
+
+
+def lexicon_sentiment(text: str) -> Tuple[float, float]:
+    """Return (score in [-1, 1], confidence in [0, 1]) for one headline.
+
+    Confidence grows with total matched weight and falls when positive and negative terms
+    conflict; a headline with no lexicon hits has confidence 0 and always escalates.
+    """
+    words: List[str] = _WORD_RE.findall((text or "").lower())
+    pos = neg = 0.0
+    for i, word in enumerate(words):
+        weight_pos = POSITIVE.get(word, 0.0)
+        weight_neg = NEGATIVE.get(word, 0.0)
+        if not weight_pos and not weight_neg:
+            continue
+        negated = any(w in NEGATIONS for w in words[max(0, i - _NEGATION_WINDOW):i])
+        if negated:
+            weight_pos, weight_neg = weight_neg, weight_pos
+        pos += weight_pos
+        neg += weight_neg
+    total = pos + neg
+    if total == 0.0:
+        return 0.0, 0.0
+    net = pos - neg
+    score = math.tanh(net)
+    agreement = abs(net) / total
+    strength = 1.0 - math.exp(-total)
+    return float(score), float(agreement * strength)
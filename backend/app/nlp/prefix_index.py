@@ -0,0 +1,94 @@
+"""Sorted-array prefix index for ticker typeahead.
+
+Keys live in sorted Python lists; a prefix lookup is one `bisect` plus a short forward scan, so
+a keystroke costs O(log n + results) with no database access. Each ticker contributes three
+kinds of key, searched in this order so the most specific matches come first:
+
+    symbol       "aapl"
+    name         "apple inc."
+    name word    "inc."  (every later word start, so "bank of america" answers "america")
+"""
+
+import bisect
+import re
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+KIND_SYMBOL = 0
+KIND_NAME = 1
+KIND_WORD = 2
+
+_WORD_START_RE = re.compile(r"(?<=[\s\-&/(])[0-9a-z]")
+
+
+def _name_keys(name: str) -> Iterable[Tuple[int, str]]:
+    yield KIND_NAME, name
+    for m in _WORD_START_RE.finditer(name):
+        yield KIND_WORD, name[m.start():]
+
+
+class PrefixIndex:
+    def __init__(self) -> None:
+        self._keys: Dict[int, List[str]] = {KIND_SYMBOL: [], KIND_NAME: [], KIND_WORD: []}
+        self._ids: Dict[int, List[int]] = {KIND_SYMBOL: [], KIND_NAME: [], KIND_WORD: []}
+
+    @classmethod
+    def build(cls, tickers: Iterable[Tuple[int, Optional[str], Optional[str]]]) -> "PrefixIndex":
+        """Index (id, symbol, name) rows with one sort per key kind."""
+        index = cls()
+        pairs: Dict[int, List[Tuple[str, int]]] = {kind: [] for kind in index._keys}
+        for tid, symbol, name in tickers:
+            for kind, key in index._entries(symbol, name):
+                pairs[kind].append((key, tid))
+        for kind, entries in pairs.items():
+            entries.sort()
+            index._keys[kind] = [k for k, _ in entries]
+            index._ids[kind] = [t for _, t in entries]
+        return index
+
+    @staticmethod
+    def _entries(symbol: Optional[str], name: Optional[str]) -> Iterable[Tuple[int, str]]:
+        if symbol:
+            yield KIND_SYMBOL, symbol.lower()
+        if name:
+            yield from _name_keys(name.strip().lower())
+
+    def copy(self) -> "PrefixIndex":
+        """An independent copy, to extend while readers keep searching this one."""
+        index = PrefixIndex()
+        index._keys = {kind: list(keys) for kind, keys in self._keys.items()}
+        index._ids = {kind: list(ids) for kind, ids in self._ids.items()}
+        return index
+
+    def add(self, tid: int, symbol: Optional[str], name: Optional[str]) -> None:
+        """Insert one ticker in place (O(n) list shift; meant for the few new rows per refresh).
+
+        Not safe while other threads search this index; extend a `copy()` instead.
+        """
+        for kind, key in self._entries(symbol, name):
+            pos = bisect.bisect_right(self._keys[kind], key)
+            self._keys[kind].insert(pos, key)
+            self._ids[kind].insert(pos, tid)
+
+    def __len__(self) -> int:
+        return len(self._keys[KIND_SYMBOL]) + len(self._keys[KIND_NAME])
+
+    def search(self, prefix: str, limit: int = 10) -> List[int]:
+        """Ticker ids whose keys start with `prefix` (case-insensitive), best kind first."""
+        prefix = prefix.strip().lower()
+        found: List[int] = []
+        if not prefix or limit <= 0:
+            return found
+        seen = set()
+        for kind in (KIND_SYMBOL, KIND_NAME, KIND_WORD):
+            keys, ids = self._keys[kind], self._ids[kind]
+            i = bisect.bisect_left(keys, prefix)
+            while i < len(keys) and keys[i].startswith(prefix):
+                tid = ids[i]
+                if tid not in seen:
+                    seen.add(tid)
+                    found.append(tid)
+                    if len(found) >= limit:
+                        return found
+                i += 1
+        return found
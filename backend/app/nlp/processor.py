@@ -1,5 +1,8 @@
 from typing import Any, Dict, Iterable, List, Optional, Tuple
+from datetime import datetime, timezone
+import logging
 import os
+import threading
 import time
 
 from difflib import get_close_matches
@@ -20,19 +23,73 @@ try:
 except Exception:
     openai = None
 
-from sqlalchemy import select
+from sqlalchemy import select, update
 from sqlalchemy.orm import Session
 
-from app.models.headline import Headline
+from app.models.headline import STATUS_NO_ENTITIES, STATUS_SCORED, Headline
 from app.models.mention import Mention
 from app.models.risk_score import RiskScore
 from app.models.ticker import Ticker
+from app.nlp import registry
+from app.nlp.lexicon import LEXICON_VERSION, lexicon_sentiment
+from app.nlp.prefix_index import PrefixIndex
+from app.realtime import publish as risk_stream
+from app.utils import metrics
+from app.utils.risk import score_risk_percent
 
 
+logger = logging.getLogger("processor")
+
 _nlp_model = None
 _sentiment_pipeline = None
+# Why a configured registry could not provide a sentiment model; cached so it is logged once
+_sentiment_load_error: Optional[str] = None
+# (name, version) of the loaded sentiment model, recorded on each RiskScore
+_sentiment_model_identity: Tuple[str, Optional[str]] = ("finbert", None)
+# Replaced wholesale on refresh, never mutated, so readers need no lock
 _ticker_index_cache: Dict[str, Any] = {}
 _ticker_index_cache_expiry: float = 0.0
+_ticker_index_lock = threading.Lock()
+
+_inferences_total = metrics.counter(
+    "nlp_inferences_total", "Sentiment/urgency inferences run, by kind", ["kind"]
+)
+_inferences_skipped_total = metrics.counter(
+    "nlp_inferences_skipped_total", "Inferences avoided because a headline mapped to no tickers", ["kind"]
+)
+
+
+_cascade_total = metrics.counter(
+    "nlp_cascade_total", "Sentiment cascade decisions by the tier that produced the score", ["tier"]
+)
+
+# RiskScore.model values
+MODEL_TRANSFORMER = "finbert"
+MODEL_LEXICON = "lexicon"
+
+
+def model_identity(tier: str) -> Tuple[str, Optional[str]]:
+    """(model, model_version) to record on a RiskScore for a score produced by `tier`."""
+    if tier == MODEL_LEXICON:
+        return MODEL_LEXICON, LEXICON_VERSION
+    return _sentiment_model_identity
+
+
+def cascade_enabled() -> bool:
+    """NLP_CASCADE=1 scores with the lexicon first and escalates only uncertain headlines."""
+    return os.getenv("NLP_CASCADE", "0") == "1"
+
+
+def cascade_threshold() -> float:
+    return float(os.getenv("NLP_CASCADE_THRESHOLD", "0.6"))
+
+
+def _score_without_tickers() -> bool:
+    """NLP_SCORE_WITHOUT_TICKERS=1 scores every headline, e.g. for market-wide sentiment.
+
+    The market-wide rows (NULL ticker_id) are only written to storage; no API endpoint reads them.
+    """
+    return os.getenv("NLP_SCORE_WITHOUT_TICKERS", "0") == "1"
 
 
 def _get_spacy_model():
@@ -52,8 +109,13 @@ def _get_spacy_model():
     return _nlp_model
 
 
+def sentiment_load_error() -> Optional[str]:
+    """Why the configured model registry has no usable sentiment model, or None."""
+    return _sentiment_load_error
+
+
 def _get_sentiment_pipeline():
-    global _sentiment_pipeline
+    global _sentiment_pipeline, _sentiment_model_identity, _sentiment_load_error
     if _sentiment_pipeline is not None:
         return _sentiment_pipeline
 
@@ -61,6 +123,27 @@ def _get_sentiment_pipeline():
         _sentiment_pipeline = None
         return _sentiment_pipeline
 
+    # A configured registry is authoritative: load the pinned model offline, never the Hub
+    if registry.registry_dir():
+        if _sentiment_load_error is not None:
+            return None
+        spec = registry.resolve()
+        if spec is None:
+            _sentiment_load_error = (
+                f"no sentiment model in MODEL_REGISTRY_DIR={registry.registry_dir()}"
+                f" (NLP_SENTIMENT_MODEL={os.getenv('NLP_SENTIMENT_MODEL')!r})"
+            )
+            logger.error("%s; sentiment scoring is unavailable", _sentiment_load_error)
+            return None
+        try:
+            _sentiment_pipeline = registry.load_pipeline(spec)
+            _sentiment_model_identity = (spec.name, spec.version)
+        except Exception as exc:
+            _sentiment_pipeline = None
+            _sentiment_load_error = f"loading {spec.name}@{spec.version} from {spec.path} failed: {exc!r}"
+            logger.exception("%s; sentiment scoring is unavailable", _sentiment_load_error)
+        return _sentiment_pipeline
+
     # Try FinBERT first, else fallback to robust general model
     model_names = [
         "ProsusAI/finbert",
@@ -71,6 +154,7 @@ def _get_sentiment_pipeline():
     for name in model_names:
         try:
             _sentiment_pipeline = pipeline("sentiment-analysis", model=name, top_k=None)
+            _sentiment_model_identity = (name, None)
             break
         except Exception:  # pragma: no cover - model download may fail
             _sentiment_pipeline = None
@@ -126,40 +210,96 @@ def detect_entities(text: str) -> List[str]:
     return candidates
 
 
-def _get_ticker_index(db: Session) -> Dict[str, Any]:
-    """Return a cached index for fast entity→ticker id mapping.
-
-    Cache stores symbol_upper→id, name_lower→id, and list of all names for fuzzy matching.
-    """
-    global _ticker_index_cache, _ticker_index_cache_expiry
-    ttl_s = float(os.getenv("TICKER_CACHE_TTL_SECONDS", "300"))
-    now = time.time()
-    if _ticker_index_cache and now < _ticker_index_cache_expiry:
-        return _ticker_index_cache
-
-    rows: List[Ticker] = list(db.execute(select(Ticker.id, Ticker.symbol, Ticker.name)).all())  # type: ignore
-    symbol_to_id: Dict[str, int] = {}
-    name_to_id: Dict[str, int] = {}
+def _add_to_ticker_index(index: Dict[str, Any], rows: Iterable[Any]) -> None:
     for r in rows:
         # rows may be Row objects (id, symbol, name)
         tid = int(r[0])
         sym = r[1] or None
         name = r[2] or None
         if sym:
-            symbol_to_id[str(sym).upper()] = tid
+            index["symbol_to_id"][str(sym).upper()] = tid
         if name:
-            name_to_id[str(name).lower()] = tid
+            lower = str(name).lower()
+            if lower not in index["name_to_id"]:
+                index["all_names_lower"].append(lower)
+            index["name_to_id"][lower] = tid
+        index["id_to_ticker"][tid] = (sym, name)
+        index["max_id"] = max(index["max_id"], tid)
+
 
+def get_ticker_index(db: Session) -> Dict[str, Any]:
+    """Return a cached index for fast entity→ticker id mapping and typeahead.
+
+    Cache stores symbol_upper→id, name_lower→id, the list of all names for fuzzy matching,
+    id→(symbol, name) and a `PrefixIndex` for suggestions. After TICKER_CACHE_TTL_SECONDS only
+    tickers with a higher id than any seen are fetched and merged in; the whole index is rebuilt
+    every TICKER_INDEX_REBUILD_SECONDS to pick up renames and deletions.
+
+    A refresh builds a new index and swaps it in, so an index handed out is never modified.
+    One caller refreshes at a time; while it does, others keep using the stale index (or wait
+    for the first one to be built).
+    """
+    global _ticker_index_cache, _ticker_index_cache_expiry
+    current = _ticker_index_cache
+    if current and time.time() < _ticker_index_cache_expiry:
+        return current
+    if not _ticker_index_lock.acquire(blocking=not current):
+        return current
+    try:
+        now = time.time()
+        index = _ticker_index_cache
+        if index and now < _ticker_index_cache_expiry:
+            return index
+        index = _refreshed_ticker_index(db, index, now)
+        _ticker_index_cache = index
+        _ticker_index_cache_expiry = now + float(os.getenv("TICKER_CACHE_TTL_SECONDS", "300"))
+        return index
+    finally:
+        _ticker_index_lock.release()
+
+
+def _refreshed_ticker_index(db: Session, index: Dict[str, Any], now: float) -> Dict[str, Any]:
+    columns = select(Ticker.id, Ticker.symbol, Ticker.name)
+    rebuild_s = float(os.getenv("TICKER_INDEX_REBUILD_SECONDS", "3600"))
+    if index and now - index["built_at"] < rebuild_s:
+        rows = list(db.execute(columns.where(Ticker.id > index["max_id"]).order_by(Ticker.id)).all())
+        if not rows:
+            return index
+        index = {
+            "symbol_to_id": dict(index["symbol_to_id"]),
+            "name_to_id": dict(index["name_to_id"]),
+            "all_names_lower": list(index["all_names_lower"]),
+            "id_to_ticker": dict(index["id_to_ticker"]),
+            "max_id": index["max_id"],
+            "built_at": index["built_at"],
+            "prefix": index["prefix"].copy(),
+        }
+        _add_to_ticker_index(index, rows)
+        for r in rows:
+            index["prefix"].add(int(r[0]), r[1], r[2])
+        return index
+
+    rows = list(db.execute(columns).all())
     index = {
-        "symbol_to_id": symbol_to_id,
-        "name_to_id": name_to_id,
-        "all_names_lower": list(name_to_id.keys()),
+        "symbol_to_id": {},
+        "name_to_id": {},
+        "all_names_lower": [],
+        "id_to_ticker": {},
+        "max_id": 0,
+        "built_at": now,
     }
-    _ticker_index_cache = index
-    _ticker_index_cache_expiry = now + ttl_s
+    _add_to_ticker_index(index, rows)
+    index["prefix"] = PrefixIndex.build((int(r[0]), r[1], r[2]) for r in rows)
     return index
 
 
+def peek_ticker_index() -> Optional[Dict[str, Any]]:
+    """The cached ticker index if still fresh, without touching the database."""
+    if _ticker_index_cache and time.time() < _ticker_index_cache_expiry:
+        return _ticker_index_cache
+    return None
+
+
 def map_entities_to_tickers(db: Session, entities: Iterable[str]) -> List[Ticker]:
     """Map entity strings to `Ticker` rows using cached id index + one DB fetch.
 
@@ -171,7 +311,7 @@ def map_entities_to_tickers(db: Session, entities: Iterable[str]) -> List[Ticker
     if not cleaned:
         return []
 
-    idx = _get_ticker_index(db)
+    idx = get_ticker_index(db)
     symbol_to_id = idx["symbol_to_id"]
     name_to_id = idx["name_to_id"]
     all_names_lower = idx["all_names_lower"]
@@ -245,24 +385,98 @@ def sentiment_score(text: str) -> Optional[float]:
         return 0.0
 
     try:
-        result = pipe(text)
-        if isinstance(result, list) and result:
-            item = result[0]
-            # transformers pipelines may return dict with label and score
-            label = str(item.get("label", "")).lower()
-            score = float(item.get("score", 0.0))
-            # Normalize
-            if "positive" in label:
-                return max(-1.0, min(1.0, score))
-            if "negative" in label:
-                return max(-1.0, min(1.0, -score))
-            if "neutral" in label:
-                return 0.0
-        return 0.0
+        return _sentiment_from_output(pipe(text))
     except Exception:  # pragma: no cover - model may fail
         return 0.0
 
 
+def _sentiment_from_output(result: Any) -> float:
+    """Map one pipeline output (top label dict, or list of label dicts) to a score in [-1, 1]."""
+    item = result
+    if isinstance(result, list):
+        if not result:
+            return 0.0
+        item = result[0]
+    if not isinstance(item, dict):
+        return 0.0
+    # transformers pipelines may return dict with label and score
+    label = str(item.get("label", "")).lower()
+    score = float(item.get("score", 0.0))
+    # Normalize
+    if "positive" in label:
+        return max(-1.0, min(1.0, score))
+    if "negative" in label:
+        return max(-1.0, min(1.0, -score))
+    return 0.0
+
+
+def sentiment_scores(texts: List[str]) -> List[float]:
+    """Batched variant of `sentiment_score` that runs one pipeline call per batch.
+
+    Falls back to per-text scoring in cloud mode or when no local pipeline is available.
+    """
+    if not texts:
+        return []
+
+    pipe = None if os.getenv("NLP_MODE", "local") == "cloud" else _get_sentiment_pipeline()
+    if pipe is None:
+        return [float(sentiment_score(t) or 0.0) for t in texts]
+
+    scores = [0.0] * len(texts)
+    positions = [i for i, t in enumerate(texts) if t]
+    if not positions:
+        return scores
+
+    batch_size = int(os.getenv("NLP_BATCH_SIZE", "16"))
+    try:
+        outputs = pipe([texts[i] for i in positions], batch_size=batch_size)
+    except Exception:  # pragma: no cover - model may fail
+        return [float(sentiment_score(t) or 0.0) for t in texts]
+
+    for i, out in zip(positions, outputs):
+        try:
+            scores[i] = _sentiment_from_output(out)
+        except Exception:  # pragma: no cover - defensive
+            scores[i] = 0.0
+    return scores
+
+
+def cascade_sentiment_scores(
+    texts: List[str], threshold: Optional[float] = None, count: bool = True
+) -> Tuple[List[float], List[str]]:
+    """Two-tier sentiment: lexicon scores are kept when their confidence reaches `threshold`,
+    the remaining texts go through `sentiment_scores` in one batch.
+
+    Returns (scores, tier per text), the tier being MODEL_LEXICON or MODEL_TRANSFORMER.
+    Decisions count towards `nlp_cascade_total` unless `count` is False, so that metric
+    describes headlines rather than body chunks.
+    """
+    threshold = cascade_threshold() if threshold is None else threshold
+    scores = [0.0] * len(texts)
+    tiers = [MODEL_LEXICON] * len(texts)
+    escalate: List[int] = []
+    for i, text in enumerate(texts):
+        score, confidence = lexicon_sentiment(text)
+        if confidence >= threshold:
+            scores[i] = score
+        else:
+            escalate.append(i)
+    if escalate:
+        for i, score in zip(escalate, sentiment_scores([texts[i] for i in escalate])):
+            scores[i] = float(score)
+            tiers[i] = MODEL_TRANSFORMER
+    if texts and count:
+        _cascade_total.labels(MODEL_LEXICON).inc(len(texts) - len(escalate))
+        _cascade_total.labels(MODEL_TRANSFORMER).inc(len(escalate))
+    return scores, tiers
+
+
+def _score_texts(texts: List[str], count: bool = True) -> Tuple[List[float], List[str]]:
+    if cascade_enabled():
+        return cascade_sentiment_scores(texts, count=count)
+    return sentiment_scores(texts), [MODEL_TRANSFORMER] * len(texts)
+
+
 def urgency_score(text: str) -> float:
     """Compute urgency score based on weighted keyword matches in text, or via LLM in cloud mode.
 
@@ -312,6 +526,101 @@ def urgency_score(text: str) -> float:
     return float(max(0.0, min(1.0, score)))
 
 
+def _add_score_rows(
+    db: Session,
+    headline_id: int,
+    title: Optional[str],
+    tickers: Iterable[Tuple[int, Optional[str]]],
+    sentiment: Optional[float],
+    urgency: Optional[float],
+    model: str = MODEL_TRANSFORMER,
+) -> int:
+    """Stage one Mention and one RiskScore per (ticker id, symbol) for a headline; caller commits.
+
+    Also stages a live risk event per ticker, published once the caller commits. A scored
+    headline without tickers (NLP_SCORE_WITHOUT_TICKERS=1) gets a single market-wide RiskScore
+    with a NULL ticker_id instead.
+    """
+    model_name, model_version = model_identity(model)
+    tickers = list(tickers)
+    if not tickers:
+        if sentiment is not None:
+            db.add(
+                RiskScore(
+                    ticker_id=None,
+                    headline_id=headline_id,
+                    model=model_name[:64],
+                    model_version=model_version[:64] if model_version else None,
+                    sentiment=float(sentiment),
+                    urgency=float(urgency) if urgency is not None else None,
+                    volatility=None,
+                    composite=score_risk_percent(sentiment, urgency),
+                )
+            )
+        return 0
+    now = datetime.now(timezone.utc)
+    created = 0
+    for tid, symbol in tickers:
+        mention = Mention(
+            headline_id=headline_id,
+            ticker_id=tid,
+            context=title[:512] if title else None,
+            relevance=1.0,
+        )
+        db.add(mention)
+        created += 1
+
+        # Persist a risk score row per ticker-headline
+        rs = RiskScore(
+            ticker_id=tid,
+            headline_id=headline_id,
+            model=model_name[:64],
+            model_version=model_version[:64] if model_version else None,
+            sentiment=float(sentiment) if sentiment is not None else None,
+            urgency=float(urgency) if urgency is not None else None,
+            volatility=None,
+            composite=score_risk_percent(sentiment, urgency),
+        )
+        db.add(rs)
+        risk_stream.stage(
+            db,
+            {
+                "type": "risk",
+                "symbol": symbol,
+                "risk_percent": rs.composite,
+                "sentiment": rs.sentiment,
+                "urgency": rs.urgency,
+                "headline": {"id": headline_id, "title": title},
+                "ts": now,
+            },
+        )
+    return created
+
+
+def _outcome_status(tickers: Iterable[Any], sentiment: Optional[float]) -> str:
+    """Scored when a RiskScore was written: per ticker, or market-wide when there are none."""
+    return STATUS_SCORED if tickers or sentiment is not None else STATUS_NO_ENTITIES
+
+
+def result_status(result: Dict[str, Any]) -> str:
+    """Terminal status `persist_headline_scores` gives an `analyze_headlines` result."""
+    return _outcome_status(result.get("ticker_ids") or [], result.get("sentiment"))
+
+
+def _mark_processed(db: Session, scored_ids: List[int], no_entity_ids: List[int]) -> None:
+    """Stage the terminal outcome per headline; committed together with the score rows."""
+    now = datetime.now(timezone.utc)
+    for outcome, ids in ((STATUS_SCORED, scored_ids), (STATUS_NO_ENTITIES, no_entity_ids)):
+        if not ids:
+            continue
+        db.execute(
+            update(Headline)
+            .where(Headline.id.in_(ids))
+            .values(status=outcome, processed_at=now, next_retry_at=None, last_error=None)
+            .execution_options(synchronize_session=False)
+        )
+
+
 def process_headline(db: Session, headline_id: int) -> Dict[str, Any]:
     """Process a headline by id: detect entities, map to tickers, compute scores, and write DB records.
 
@@ -324,33 +633,34 @@ def process_headline(db: Session, headline_id: int) -> Dict[str, Any]:
     entities = detect_entities(headline.title or "")
     tickers = map_entities_to_tickers(db, entities)
 
-    sent = sentiment_score(headline.title or "")
-    urg = urgency_score(headline.title or "")
-
-    # Upsert mentions for each ticker
-    created_mentions = 0
-    for t in tickers:
-        mention = Mention(
-            headline_id=headline.id,
-            ticker_id=t.id,
-            context=headline.title[:512] if headline.title else None,
-            relevance=1.0,
-        )
-        db.add(mention)
-        created_mentions += 1
-
-        # Persist a risk score row per ticker-headline
-        rs = RiskScore(
-            ticker_id=t.id,
-            headline_id=headline.id,
-            model="finbert",
-            sentiment=float(sent) if sent is not None else None,
-            urgency=float(urg),
-            volatility=None,
-            composite=None,
-        )
-        db.add(rs)
+    # Entity-first: skip the expensive scoring for headlines without tickers, unless
+    # market-wide scores are wanted
+    sent: Optional[float] = None
+    urg: Optional[float] = None
+    model = MODEL_TRANSFORMER
+    if tickers or _score_without_tickers():
+        if cascade_enabled():
+            lex_score, lex_confidence = lexicon_sentiment(headline.title or "")
+            if lex_confidence >= cascade_threshold():
+                sent, model = lex_score, MODEL_LEXICON
+            _cascade_total.labels(model).inc()
+        if sent is None:
+            sent = sentiment_score(headline.title or "")
+        urg = urgency_score(headline.title or "")
+        _inferences_total.labels("sentiment").inc()
+        _inferences_total.labels("urgency").inc()
+    else:
+        _inferences_skipped_total.labels("sentiment").inc()
+        _inferences_skipped_total.labels("urgency").inc()
 
+    created_mentions = _add_score_rows(
+        db, headline.id, headline.title, [(t.id, t.symbol) for t in tickers], sent, urg, model
+    )
+    status = _outcome_status(tickers, sent)
+    if status == STATUS_SCORED:
+        _mark_processed(db, [headline.id], [])
+    else:
+        _mark_processed(db, [], [headline.id])
     db.commit()
 
     return {
@@ -359,6 +669,151 @@ def process_headline(db: Session, headline_id: int) -> Dict[str, Any]:
         "sentiment": sent,
         "urgency": urg,
         "mentions_created": created_mentions,
+        "status": status,
     }
 
 
+def _text_chunks(text: str, max_chars: int = 512) -> List[str]:
+    """Split long text into sentence-aligned chunks of at most ~`max_chars` characters."""
+    chunks: List[str] = []
+    current = ""
+    for sentence in text.replace("\n", " ").split(". "):
+        sentence = sentence.strip()
+        if not sentence:
+            continue
+        if current and len(current) + len(sentence) + 2 > max_chars:
+            chunks.append(current)
+            current = ""
+        current = f"{current}. {sentence}" if current else sentence
+        while len(current) > max_chars:
+            chunks.append(current[:max_chars])
+            current = current[max_chars:]
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def _blend_body_sentiment(
+    ids: List[int], title_scores: List[float], tiers: List[str], body_by_id: Dict[int, str]
+) -> Tuple[List[float], List[str]]:
+    """Blend title sentiment with mean sentiment over article body chunks, when bodies are stored.
+
+    All chunks of the batch are scored in one call (through the cascade when enabled, without
+    counting them as cascade decisions). Returns the blended scores and, per headline, the model
+    to record: the transformer whenever it scored the title or any blended chunk.
+    Weight via NLP_BODY_WEIGHT.
+    """
+    weight = float(os.getenv("NLP_BODY_WEIGHT", "0.5"))
+    if not body_by_id or weight <= 0.0:
+        return title_scores, tiers
+
+    max_chunks = int(os.getenv("NLP_BODY_MAX_CHUNKS", "8"))
+    spans: Dict[int, Tuple[int, int]] = {}
+    all_chunks: List[str] = []
+    for hid in ids:
+        body = body_by_id.get(hid)
+        if not body:
+            continue
+        chunks = _text_chunks(body)[:max_chunks]
+        spans[hid] = (len(all_chunks), len(all_chunks) + len(chunks))
+        all_chunks.extend(chunks)
+    if not all_chunks:
+        return title_scores, tiers
+
+    chunk_scores, chunk_tiers = _score_texts(all_chunks, count=False)
+    blended: List[float] = []
+    models: List[str] = []
+    for hid, title_score, tier in zip(ids, title_scores, tiers):
+        span = spans.get(hid)
+        if span is None or span[0] == span[1]:
+            blended.append(title_score)
+            models.append(tier)
+            continue
+        body_score = sum(chunk_scores[span[0]:span[1]]) / (span[1] - span[0])
+        blended.append(max(-1.0, min(1.0, (1.0 - weight) * float(title_score) + weight * body_score)))
+        models.append(MODEL_TRANSFORMER if MODEL_TRANSFORMER in chunk_tiers[span[0]:span[1]] else tier)
+    return blended, models
+
+
+def analyze_headlines(db: Session, headline_ids: List[int]) -> List[Dict[str, Any]]:
+    """Run NER, ticker mapping and scoring for many headlines without writing anything.
+
+    Tickers are resolved first; only headlines that mapped to at least one ticker are scored
+    (all of them with NLP_SCORE_WITHOUT_TICKERS=1), the rest carry sentiment/urgency None.
+    Sentiment runs as a single batched pipeline call (plus one for stored article body chunks,
+    if any). Unknown ids are skipped. The returned dicts are consumed by `persist_headline_scores`.
+    """
+    if not headline_ids:
+        return []
+    rows = db.execute(
+        select(Headline.id, Headline.title, Headline.body).where(Headline.id.in_(headline_ids))
+    ).all()
+    title_by_id = {int(r[0]): (r[1] or "") for r in rows}
+    body_by_id = {int(r[0]): r[2] for r in rows if r[2]}
+    ids = [hid for hid in headline_ids if hid in title_by_id]
+    titles = [title_by_id[hid] for hid in ids]
+
+    tickers_by_id = {hid: map_entities_to_tickers(db, detect_entities(title)) for hid, title in zip(ids, titles)}
+    score_all = _score_without_tickers()
+    scored = [hid for hid in ids if score_all or tickers_by_id[hid]]
+    skipped = len(ids) - len(scored)
+    if skipped:
+        _inferences_skipped_total.labels("sentiment").inc(skipped)
+        _inferences_skipped_total.labels("urgency").inc(skipped)
+    if scored:
+        _inferences_total.labels("sentiment").inc(len(scored))
+        _inferences_total.labels("urgency").inc(len(scored))
+
+    scored_titles = [title_by_id[hid] for hid in scored]
+    title_scores, tiers = _score_texts(scored_titles) if scored else ([], [])
+    blended, models = _blend_body_sentiment(scored, title_scores, tiers, body_by_id)
+    sentiment_by_id = dict(zip(scored, blended))
+    model_by_id = dict(zip(scored, models))
+    results: List[Dict[str, Any]] = []
+    for hid, title in zip(ids, titles):
+        tickers = tickers_by_id[hid]
+        results.append(
+            {
+                "headline_id": hid,
+                "title": title,
+                "ticker_ids": [t.id for t in tickers],
+                "tickers": [t.symbol for t in tickers],
+                "sentiment": sentiment_by_id.get(hid),
+                "urgency": urgency_score(title) if hid in sentiment_by_id else None,
+                "model": model_by_id.get(hid, MODEL_TRANSFORMER),
+            }
+        )
+    return results
+
+
+def persist_headline_scores(db: Session, results: List[Dict[str, Any]]) -> int:
+    """Write mentions and risk scores for `analyze_headlines` results in one commit.
+
+    Returns the number of mentions created.
+    """
+    created = 0
+    for r in results:
+        created += _add_score_rows(
+            db,
+            r["headline_id"],
+            r.get("title"),
+            zip(r.get("ticker_ids") or [], r.get("tickers") or []),
+            r.get("sentiment"),
+            r["urgency"],
+            r.get("model", MODEL_TRANSFORMER),
+        )
+    if results:
+        _mark_processed(
+            db,
+            [r["headline_id"] for r in results if result_status(r) == STATUS_SCORED],
+            [r["headline_id"] for r in results if result_status(r) != STATUS_SCORED],
+        )
+        db.commit()
+    return created
+
+
+def process_headlines(db: Session, headline_ids: List[int]) -> List[Dict[str, Any]]:
+    """Batched `process_headline`: analyze all ids, then persist their rows in one commit."""
+    results = analyze_headlines(db, headline_ids)
+    persist_headline_scores(db, results)
+    return results
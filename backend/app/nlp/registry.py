@@ -0,0 +1,197 @@
+"""Local model registry: pinned sentiment models loaded from disk with no network access.
+
+MODEL_REGISTRY_DIR holds one directory per provisioned model. Each contains the tokenizer files,
+`config.json`, `model.safetensors` and a `model_info.json` manifest:
+
+    {"name": "ProsusAI/finbert", "version": "4556d13", "task": "sentiment-analysis", "priority": 0}
+
+Weights are safetensors, which `transformers` memory-maps on load: start-up does not copy the file
+through Python, and processes on one node share the page cache. With a registry configured,
+loading never touches the network (`local_files_only`, HF_HUB_OFFLINE); a missing or broken model
+fails fast instead of timing out against the Hub.
+
+    # on a connected machine, then copy the directory to air-gapped nodes
+    python -m app.nlp.registry provision ProsusAI/finbert --revision 4556d13 --registry /models
+    # cold-start time and memory per provisioned model, each in a fresh process
+    python -m app.nlp.registry benchmark --registry /models
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+from app.utils.memory import current_rss_bytes
+
+
+MANIFEST = "model_info.json"
+
+
+@dataclass
+class ModelSpec:
+    name: str
+    version: str
+    path: str
+    task: str = "sentiment-analysis"
+    priority: int = 0
+
+
+def registry_dir() -> Optional[str]:
+    return os.getenv("MODEL_REGISTRY_DIR") or None
+
+
+def list_models(directory: Optional[str] = None, task: str = "sentiment-analysis") -> List[ModelSpec]:
+    """Provisioned models for `task`, best first (lowest priority value, then name)."""
+    directory = directory or registry_dir()
+    if not directory or not os.path.isdir(directory):
+        return []
+    specs: List[ModelSpec] = []
+    for entry in sorted(os.listdir(directory)):
+        path = os.path.join(directory, entry)
+        manifest = os.path.join(path, MANIFEST)
+        if not os.path.isfile(manifest):
+            continue
+        with open(manifest, "r", encoding="utf-8") as fh:
+            info = json.load(fh)
+        if info.get("task", "sentiment-analysis") != task:
+            continue
+        specs.append(
+            ModelSpec(
+                name=str(info["name"]),
+                version=str(info.get("version") or "unversioned"),
+                path=path,
+                task=task,
+                priority=int(info.get("priority", 0)),
+            )
+        )
+    return sorted(specs, key=lambda s: (s.priority, s.name))
+
+
+def resolve(directory: Optional[str] = None, task: str = "sentiment-analysis") -> Optional[ModelSpec]:
+    """The model to serve: NLP_SENTIMENT_MODEL by name if set, else the best provisioned one."""
+    specs = list_models(directory, task)
+    wanted = os.getenv("NLP_SENTIMENT_MODEL")
+    if wanted:
+        for spec in specs:
+            if spec.name == wanted or os.path.basename(spec.path) == wanted:
+                return spec
+        return None
+    return specs[0] if specs else None
+
+
+def load_pipeline(spec: ModelSpec) -> Any:
+    """Build a transformers pipeline from a registry entry, offline and with mmap'd safetensors."""
+    os.environ.setdefault("HF_HUB_OFFLINE", "1")
+    os.environ.setdefault("TRANSFORMERS_OFFLINE", "1")
+    from transformers import (  # type: ignore
+        AutoModelForSequenceClassification,
+        AutoTokenizer,
+        pipeline,
+    )
+
+    tokenizer = AutoTokenizer.from_pretrained(spec.path, local_files_only=True)
+    model = AutoModelForSequenceClassification.from_pretrained(
+        spec.path, local_files_only=True, use_safetensors=True
+    )
+    return pipeline(spec.task, model=model, tokenizer=tokenizer, top_k=None)
+
+
+def provision(name: str, revision: str, directory: str, priority: int = 0) -> ModelSpec:
+    """Download a pinned model snapshot (safetensors only) into the registry."""
+    from huggingface_hub import snapshot_download  # type: ignore
+
+    target = os.path.join(directory, name.replace("/", "__"))
+    snapshot_download(
+        repo_id=name,
+        revision=revision,
+        local_dir=target,
+        allow_patterns=["*.json", "*.safetensors", "*.txt", "*.model", "tokenizer*"],
+    )
+    if not any(f.endswith(".safetensors") for f in os.listdir(target)):
+        raise RuntimeError(f"{name}@{revision} has no safetensors weights; convert it before provisioning")
+    spec = ModelSpec(name=name, version=revision, path=target, priority=priority)
+    with open(os.path.join(target, MANIFEST), "w", encoding="utf-8") as fh:
+        json.dump({k: v for k, v in asdict(spec).items() if k != "path"}, fh, indent=2)
+    return spec
+
+
+def measure_cold_start(
+    spec: ModelSpec,
+    load: Callable[[ModelSpec], Any] = load_pipeline,
+    rss_bytes: Callable[[], Optional[int]] = current_rss_bytes,
+) -> Dict[str, Any]:
+    """Load `spec` with `load` in this process; report load and first-inference seconds and RSS growth."""
+    rss_before = rss_bytes()
+    t0 = time.perf_counter()
+    pipe = load(spec)
+    load_s = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    pipe(["Shares rise after earnings beat"])
+    first_s = time.perf_counter() - t0
+    rss_after = rss_bytes()
+    return {
+        "name": spec.name,
+        "version": spec.version,
+        "load_s": round(load_s, 3),
+        "first_inference_s": round(first_s, 3),
+        "rss_mib": round(rss_after / 2**20, 1) if rss_after else None,
+        "rss_delta_mib": round((rss_after - rss_before) / 2**20, 1) if rss_after and rss_before else None,
+    }
+
+
+def benchmark(directory: str) -> List[Dict[str, Any]]:
+    """Cold-start every provisioned model, each in a fresh interpreter so numbers don't mix."""
+    results: List[Dict[str, Any]] = []
+    for spec in list_models(directory):
+        proc = subprocess.run(
+            [sys.executable, "-m", "app.nlp.registry", "measure", spec.path],
+            capture_output=True,
+            text=True,
+            cwd=os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")),
+        )
+        if proc.returncode != 0:
+            results.append({"name": spec.name, "version": spec.version, "error": proc.stderr.strip()[-500:]})
+            continue
+        results.append(json.loads(proc.stdout.strip().splitlines()[-1]))
+    return results
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Manage the local sentiment model registry")
+    sub = parser.add_subparsers(dest="command", required=True)
+    p_prov = sub.add_parser("provision", help="Download a pinned model into the registry")
+    p_prov.add_argument("name")
+    p_prov.add_argument("--revision", required=True, help="Commit hash or tag to pin")
+    p_prov.add_argument("--registry", default=registry_dir())
+    p_prov.add_argument("--priority", type=int, default=0)
+    p_list = sub.add_parser("list", help="List provisioned models")
+    p_list.add_argument("--registry", default=registry_dir())
+    p_bench = sub.add_parser("benchmark", help="Cold-start time and memory per provisioned model")
+    p_bench.add_argument("--registry", default=registry_dir())
+    p_measure = sub.add_parser("measure", help=argparse.SUPPRESS)
+    p_measure.add_argument("path")
+    args = parser.parse_args(argv)
+
+    if args.command == "measure":
+        directory, entry = os.path.split(os.path.abspath(args.path))
+        spec = next(s for s in list_models(directory) if os.path.basename(s.path) == entry)
+        print(json.dumps(measure_cold_start(spec)))
+        return
+    if not args.registry:
+        parser.error("--registry or MODEL_REGISTRY_DIR is required")
+    if args.command == "provision":
+        print(json.dumps(asdict(provision(args.name, args.revision, args.registry, args.priority))))
+    elif args.command == "list":
+        for spec in list_models(args.registry):
+            print(f"{spec.priority:>3} {spec.name}@{spec.version} {spec.path}")
+    elif args.command == "benchmark":
+        for row in benchmark(args.registry):
+            print(json.dumps(row))
+
+
+if __name__ == "__main__":
+    main()
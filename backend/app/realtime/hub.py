@@ -0,0 +1,172 @@
+"""In-process fan-out of live risk events to streaming clients.
+
+Each SSE/WebSocket connection holds a `Subscription` for a set of symbols; the hub indexes
+subscriptions by symbol, so publishing an event touches only that ticker's subscribers, never
+every connection. Subscriptions buffer at most RISK_STREAM_BUFFER events: when a slow client
+falls behind, the oldest undelivered events are dropped (counted, and reported to the client
+as a `lagged` notice so it can resync over REST) instead of growing memory without bound.
+
+`publish` is safe from any thread; delivery is scheduled onto each subscriber's event loop.
+With several API replicas, `RedisBridge` relays events published by workers (see
+`app.realtime.publish`) into the local hub.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import threading
+from collections import defaultdict
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Set
+
+from app.utils import metrics
+
+
+logger = logging.getLogger("risk-stream")
+
+
+CHANNEL = os.getenv("RISK_STREAM_CHANNEL", "risk_updates")
+
+_subscribers = metrics.gauge("risk_stream_subscribers", "Open risk stream subscriptions")
+_delivered_total = metrics.counter("risk_stream_events_delivered_total", "Events queued to subscribers")
+_dropped_total = metrics.counter("risk_stream_events_dropped_total", "Events dropped for slow subscribers")
+
+
+def default_buffer() -> int:
+    return int(os.getenv("RISK_STREAM_BUFFER", "100"))
+
+
+class Subscription:
+    def __init__(self, symbols: Iterable[str], max_buffer: int, loop: asyncio.AbstractEventLoop) -> None:
+        self.symbols: FrozenSet[str] = frozenset(s.upper() for s in symbols)
+        self.loop = loop
+        self.queue: "asyncio.Queue[Dict[str, Any]]" = asyncio.Queue(maxsize=max(1, max_buffer))
+        # Dropped since the client was last told
+        self.dropped = 0
+
+    def offer(self, event: Dict[str, Any]) -> None:
+        """Queue an event, evicting the oldest when the buffer is full. Runs on `self.loop`."""
+        if self.queue.full():
+            try:
+                self.queue.get_nowait()
+            except asyncio.QueueEmpty:  # pragma: no cover
+                pass
+            self.dropped += 1
+            _dropped_total.inc()
+        self.queue.put_nowait(event)
+        _delivered_total.inc()
+
+    async def next_event(self, timeout_s: float) -> Optional[Dict[str, Any]]:
+        """The next event, a `lagged` notice after drops, or None on timeout (send a heartbeat)."""
+        if self.dropped:
+            dropped, self.dropped = self.dropped, 0
+            return {"type": "lagged", "dropped": dropped}
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout_s)
+        except asyncio.TimeoutError:
+            return None
+
+
+class RiskHub:
+    def __init__(self) -> None:
+        self._by_symbol: Dict[str, Set[Subscription]] = defaultdict(set)
+        self._lock = threading.Lock()
+
+    def subscribe(self, symbols: Iterable[str], max_buffer: Optional[int] = None) -> Subscription:
+        """Register a subscription on the running event loop."""
+        sub = Subscription(symbols, max_buffer or default_buffer(), asyncio.get_running_loop())
+        with self._lock:
+            for symbol in sub.symbols:
+                self._by_symbol[symbol].add(sub)
+        _subscribers.inc()
+        return sub
+
+    def unsubscribe(self, sub: Subscription) -> None:
+        with self._lock:
+            for symbol in sub.symbols:
+                subs = self._by_symbol.get(symbol)
+                if subs is None:
+                    continue
+                subs.discard(sub)
+                if not subs:
+                    del self._by_symbol[symbol]
+        _subscribers.dec()
+
+    def subscriber_count(self, symbol: Optional[str] = None) -> int:
+        with self._lock:
+            if symbol is not None:
+                return len(self._by_symbol.get(symbol.upper(), ()))
+            return len({s for subs in self._by_symbol.values() for s in subs})
+
+    def publish(self, event: Dict[str, Any]) -> int:
+        """Deliver to the event's symbol's subscribers; returns how many were scheduled."""
+        symbol = str(event.get("symbol") or "").upper()
+        with self._lock:
+            targets: List[Subscription] = list(self._by_symbol.get(symbol, ()))
+        try:
+            current = asyncio.get_running_loop()
+        except RuntimeError:
+            current = None
+        for sub in targets:
+            if sub.loop is current:
+                sub.offer(event)
+            elif not sub.loop.is_closed():
+                sub.loop.call_soon_threadsafe(sub.offer, event)
+        return len(targets)
+
+
+hub = RiskHub()
+
+
+class RedisBridge:
+    """Relay the Redis pub/sub channel into the local hub, reconnecting with backoff."""
+
+    def __init__(self, target: RiskHub = hub, url: Optional[str] = None, channel: str = CHANNEL) -> None:
+        self.target = target
+        self.url = url or os.getenv("REDIS_URL", "redis://localhost:6379/0")
+        self.channel = channel
+        self._task: Optional["asyncio.Task[None]"] = None
+
+    def handle_message(self, data: Any) -> None:
+        try:
+            event = json.loads(data)
+        except (TypeError, ValueError):
+            logger.warning("ignoring malformed risk stream message")
+            return
+        if isinstance(event, dict):
+            self.target.publish(event)
+
+    async def run(self) -> None:
+        import redis.asyncio as aioredis  # type: ignore
+
+        backoff_s = 1.0
+        while True:
+            client = aioredis.Redis.from_url(self.url)
+            try:
+                pubsub = client.pubsub(ignore_subscribe_messages=True)
+                await pubsub.subscribe(self.channel)
+                backoff_s = 1.0
+                async for message in pubsub.listen():
+                    if message.get("type") == "message":
+                        self.handle_message(message["data"])
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.warning("risk stream redis bridge lost connection; retrying in %.0fs", backoff_s, exc_info=True)
+                await asyncio.sleep(backoff_s)
+                backoff_s = min(backoff_s * 2, 30.0)
+            finally:
+                await client.aclose()
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self.run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
@@ -0,0 +1,90 @@
+"""Publish risk events for newly committed scores.
+
+`app.nlp.processor` stages one event per score row in `Session.info` while it writes them; the
+session `after_commit` hook below sends them once the rows are durable (and `after_rollback`
+discards them). Backend, via RISK_STREAM_BACKEND:
+
+- `redis`: PUBLISH JSON on RISK_STREAM_CHANNEL; every API replica's `RedisBridge` relays it to
+  its connected clients. The default when REDIS_URL is set, as it is for Celery workers.
+- `memory`: straight into this process's hub; only reaches clients of the same process (inline
+  processing in the API, tests). The default otherwise.
+- `off`: no live events.
+"""
+
+import json
+import logging
+import os
+from datetime import datetime
+from typing import Any, Dict, List
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.realtime.hub import CHANNEL, hub
+from app.utils import metrics
+
+
+logger = logging.getLogger("risk-stream")
+
+
+_PENDING_KEY = "risk_events"
+
+_published_total = metrics.counter("risk_stream_events_published_total", "Risk events published", ["backend"])
+
+_redis = None
+
+
+def backend_name() -> str:
+    configured = os.getenv("RISK_STREAM_BACKEND", "auto").lower()
+    if configured != "auto":
+        return configured
+    return "redis" if os.getenv("REDIS_URL") else "memory"
+
+
+def stage(db: Session, event_: Dict[str, Any]) -> None:
+    """Queue an event to publish when `db` commits."""
+    if event_.get("symbol"):
+        db.info.setdefault(_PENDING_KEY, []).append(event_)
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"not JSON serializable: {type(value).__name__}")
+
+
+def publish(events: List[Dict[str, Any]]) -> None:
+    global _redis
+    backend = backend_name()
+    if not events or backend == "off":
+        return
+    if backend == "redis":
+        try:
+            if _redis is None:
+                import redis  # type: ignore
+
+                _redis = redis.Redis.from_url(os.getenv("REDIS_URL", "redis://localhost:6379/0"))
+            with _redis.pipeline(transaction=False) as pipe:
+                for e in events:
+                    pipe.publish(CHANNEL, json.dumps(e, default=_json_default))
+                pipe.execute()
+            _published_total.labels("redis").inc(len(events))
+        except Exception:
+            # Live updates are best effort; clients resync over REST
+            logger.warning("risk stream publish failed for %d events", len(events), exc_info=True)
+        return
+    for e in events:
+        hub.publish(json.loads(json.dumps(e, default=_json_default)))
+    _published_total.labels("memory").inc(len(events))
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_on_commit(session: Session) -> None:
+    events = session.info.pop(_PENDING_KEY, None)
+    if events:
+        publish(events)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_on_rollback(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
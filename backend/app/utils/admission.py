@@ -0,0 +1,207 @@
+"""Admission control for CPU-bound endpoints (`/v1/analyze`).
+
+Each request first takes a token from its client's bucket (`<PREFIX>_RATE_PER_SECOND` refill,
+`<PREFIX>_RATE_BURST` capacity; a rate of 0 disables it) and gets 429 when the bucket is empty.
+It then needs one of `<PREFIX>_MAX_CONCURRENCY` slots. Requests that find every slot busy wait in
+a FIFO queue of at most `<PREFIX>_MAX_QUEUE` entries, for at most `<PREFIX>_QUEUE_TIMEOUT_SECONDS`.
+A full queue or an expired wait gets 503 immediately instead of joining a backlog that would
+time out together. Both rejections carry `Retry-After`: the time to the next token, or the
+expected time for the queue ahead to drain at the observed service time.
+"""
+
+import asyncio
+import math
+import os
+import time
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Deque, Dict, Optional, Tuple
+
+from fastapi import HTTPException, Request
+
+from app.utils import metrics
+
+
+_queue_wait = metrics.histogram(
+    "admission_queue_wait_seconds",
+    "Time admitted requests waited for a concurrency slot",
+    ["endpoint"],
+    buckets=(0.0, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
+)
+_rejected = metrics.counter(
+    "admission_rejected_total", "Requests shed by admission control", ["endpoint", "reason"]
+)
+_in_flight = metrics.gauge("admission_in_flight", "Requests holding a concurrency slot", ["endpoint"])
+_queued = metrics.gauge("admission_queued", "Requests waiting for a concurrency slot", ["endpoint"])
+
+
+class TokenBuckets:
+    """Per-key token buckets; the least recently seen keys are evicted beyond `max_keys`."""
+
+    def __init__(self, rate: float, burst: float, max_keys: int = 10000) -> None:
+        self.rate = rate
+        self.burst = max(1.0, burst)
+        self.max_keys = max_keys
+        self._buckets: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()
+
+    def take(self, key: str, now: Optional[float] = None) -> float:
+        """Take one token for `key`; returns 0.0 if granted, else seconds until one is available."""
+        if self.rate <= 0:
+            return 0.0
+        now = time.monotonic() if now is None else now
+        tokens, last = self._buckets.pop(key, (self.burst, now))
+        tokens = min(self.burst, tokens + (now - last) * self.rate)
+        if tokens >= 1.0:
+            tokens -= 1.0
+            wait = 0.0
+        else:
+            wait = (1.0 - tokens) / self.rate
+        self._buckets[key] = (tokens, now)
+        while len(self._buckets) > self.max_keys:
+            self._buckets.popitem(last=False)
+        return wait
+
+
+class Overloaded(Exception):
+    def __init__(self, reason: str, retry_after_s: float) -> None:
+        super().__init__(reason)
+        self.reason = reason
+        self.retry_after_s = retry_after_s
+
+
+class ConcurrencyLimiter:
+    """At most `limit` holders, a FIFO wait queue of `max_queue`, and a bounded wait.
+
+    A released slot is handed directly to the oldest waiter, so late arrivals cannot overtake
+    the queue. Used from a single event loop.
+    """
+
+    def __init__(self, limit: int, max_queue: int, max_wait_s: float) -> None:
+        self.limit = max(1, limit)
+        self.max_queue = max(0, max_queue)
+        self.max_wait_s = max_wait_s
+        self.active = 0
+        self._waiters: Deque["asyncio.Future[None]"] = deque()
+        # Moving average of how long a slot is held, for Retry-After estimates
+        self.service_time_s = 0.1
+
+    @property
+    def queued(self) -> int:
+        return len(self._waiters)
+
+    def retry_after_s(self) -> float:
+        return self.service_time_s * (self.queued + 1) / self.limit
+
+    async def acquire(self) -> float:
+        """Wait for a slot; returns seconds spent queued or raises `Overloaded`."""
+        if self.active < self.limit and not self._waiters:
+            self.active += 1
+            return 0.0
+        if len(self._waiters) >= self.max_queue:
+            raise Overloaded("queue_full", self.retry_after_s())
+        started = time.monotonic()
+        fut: "asyncio.Future[None]" = asyncio.get_running_loop().create_future()
+        self._waiters.append(fut)
+        try:
+            await asyncio.wait({fut}, timeout=self.max_wait_s)
+        except asyncio.CancelledError:
+            self._abandon(fut)
+            raise
+        if not fut.done():
+            self._abandon(fut)
+            raise Overloaded("queue_timeout", self.retry_after_s())
+        return time.monotonic() - started
+
+    def _abandon(self, fut: "asyncio.Future[None]") -> None:
+        if fut.done() and not fut.cancelled():
+            # The slot was handed over just as we gave up; pass it on
+            self.release()
+            return
+        fut.cancel()
+        try:
+            self._waiters.remove(fut)
+        except ValueError:
+            pass
+
+    def release(self, held_s: Optional[float] = None) -> None:
+        if held_s is not None:
+            self.service_time_s = 0.8 * self.service_time_s + 0.2 * held_s
+        while self._waiters:
+            fut = self._waiters.popleft()
+            if not fut.done():
+                # Slot ownership moves to the waiter; `active` is unchanged
+                fut.set_result(None)
+                return
+        self.active = max(0, self.active - 1)
+
+
+def _env(prefix: str, name: str, default: str) -> str:
+    return os.getenv(f"{prefix}_{name}", default)
+
+
+def _retry_after(seconds: float) -> Dict[str, str]:
+    return {"Retry-After": str(max(1, math.ceil(seconds)))}
+
+
+def client_key(request: Request) -> str:
+    """Rate-limit identity: the peer address (run uvicorn with --proxy-headers behind a proxy).
+
+    Unverified headers such as bearer tokens are not used; a client could rotate them to get a
+    fresh bucket per request.
+    """
+    return request.client.host if request.client else "unknown"
+
+
+class AdmissionController:
+    """Rate limit + concurrency limit for one endpoint, configured from `<PREFIX>_*` env vars."""
+
+    def __init__(
+        self,
+        endpoint: str,
+        prefix: str,
+        max_concurrency: Optional[int] = None,
+        max_queue: Optional[int] = None,
+        queue_timeout_s: Optional[float] = None,
+        rate_per_s: Optional[float] = None,
+        burst: Optional[float] = None,
+    ) -> None:
+        self.endpoint = endpoint
+        if max_concurrency is None:
+            max_concurrency = int(_env(prefix, "MAX_CONCURRENCY", str(os.cpu_count() or 4)))
+        self.limiter = ConcurrencyLimiter(
+            max_concurrency,
+            max_queue if max_queue is not None else int(_env(prefix, "MAX_QUEUE", "16")),
+            queue_timeout_s if queue_timeout_s is not None else float(_env(prefix, "QUEUE_TIMEOUT_SECONDS", "2")),
+        )
+        self.buckets = TokenBuckets(
+            rate_per_s if rate_per_s is not None else float(_env(prefix, "RATE_PER_SECOND", "5")),
+            burst if burst is not None else float(_env(prefix, "RATE_BURST", "10")),
+        )
+
+    @asynccontextmanager
+    async def admit(self, request: Request) -> AsyncIterator[None]:
+        """Hold a slot for the body of the block, or raise 429/503 with `Retry-After`."""
+        wait = self.buckets.take(client_key(request))
+        if wait > 0:
+            _rejected.labels(self.endpoint, "rate_limited").inc()
+            raise HTTPException(status_code=429, detail="Rate limit exceeded", headers=_retry_after(wait))
+
+        _queued.labels(self.endpoint).inc()
+        try:
+            waited = await self.limiter.acquire()
+        except Overloaded as exc:
+            _rejected.labels(self.endpoint, exc.reason).inc()
+            raise HTTPException(
+                status_code=503, detail="Server busy, retry later", headers=_retry_after(exc.retry_after_s)
+            )
+        finally:
+            _queued.labels(self.endpoint).dec()
+        _queue_wait.labels(self.endpoint).observe(waited)
+
+        _in_flight.labels(self.endpoint).inc()
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            _in_flight.labels(self.endpoint).dec()
+            self.limiter.release(time.monotonic() - started)
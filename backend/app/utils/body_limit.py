@@ -0,0 +1,52 @@
+"""Per-path request body size limits, enforced before the app reads or parses the body.
+
+A declared `Content-Length` over the limit is answered with 413 straight away. Chunked bodies
+are counted as they arrive and cut off with 413 once they pass the limit.
+"""
+
+from typing import Any, Awaitable, Callable, Dict, MutableMapping
+
+from fastapi import HTTPException
+from starlette.responses import JSONResponse
+
+
+Scope = MutableMapping[str, Any]
+Message = MutableMapping[str, Any]
+Receive = Callable[[], Awaitable[Message]]
+Send = Callable[[Message], Awaitable[None]]
+
+
+def _too_large(limit: int) -> str:
+    return f"Request body exceeds {limit} bytes"
+
+
+class BodySizeLimitMiddleware:
+    def __init__(self, app: Any, limits: Dict[str, int]) -> None:
+        self.app = app
+        self.limits = limits
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        limit = self.limits.get(scope.get("path", "")) if scope["type"] == "http" else None
+        if limit is None:
+            await self.app(scope, receive, send)
+            return
+
+        declared = dict(scope.get("headers") or []).get(b"content-length")
+        if declared is not None and declared.isdigit() and int(declared) > limit:
+            response = JSONResponse({"detail": _too_large(limit)}, status_code=413)
+            await response(scope, receive, send)
+            return
+
+        received = 0
+
+        async def limited_receive() -> Message:
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > limit:
+                    # Raised inside the route's body read, so the app's handler answers 413
+                    raise HTTPException(status_code=413, detail=_too_large(limit))
+            return message
+
+        await self.app(scope, limited_receive, send)
@@ -0,0 +1,77 @@
+"""Conditional GET and fast serialization helpers for read endpoints.
+
+Routes derive a validator from a cheap watermark query (e.g. the newest RiskScore id for a
+ticker), answer `If-None-Match` / `If-Modified-Since` with 304 before building the payload, and
+otherwise send the body with `ETag`, `Last-Modified` and `Cache-Control` so browsers, the Next.js
+fetch cache and CDNs can revalidate instead of re-downloading.
+"""
+
+import hashlib
+import os
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Dict, Optional
+
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+try:
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover
+    orjson = None  # type: ignore
+
+
+CACHE_MAX_AGE_SECONDS = int(os.getenv("HTTP_CACHE_MAX_AGE_SECONDS", "30"))
+
+
+class FastJSONResponse(JSONResponse):
+    """JSON from plain dicts/lists via orjson (datetimes included); stdlib json if orjson is missing.
+
+    For large payloads, build primitives and return this directly rather than one Pydantic model
+    per element.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if orjson is not None:
+            return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+        return super().render(jsonable_encoder(content))
+
+
+def make_etag(*parts: Any) -> str:
+    """Weak validator over the watermark and every parameter that shapes the payload."""
+    digest = hashlib.sha1("|".join(str(p) for p in parts).encode()).hexdigest()[:24]
+    return f'W/"{digest}"'
+
+
+def _utc(value: datetime) -> datetime:
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value.astimezone(timezone.utc)
+
+
+def cache_headers(etag: str, last_modified: Optional[datetime] = None, private: bool = False) -> Dict[str, str]:
+    scope = "private" if private else "public"
+    headers = {"ETag": etag, "Cache-Control": f"{scope}, max-age={CACHE_MAX_AGE_SECONDS}, must-revalidate"}
+    if last_modified is not None:
+        headers["Last-Modified"] = format_datetime(_utc(last_modified), usegmt=True)
+    return headers
+
+
+def is_not_modified(request: Request, etag: str, last_modified: Optional[datetime] = None) -> bool:
+    """RFC 9110 precedence: If-None-Match (weak comparison) wins over If-Modified-Since."""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        tags = {t.strip().removeprefix("W/") for t in if_none_match.split(",")}
+        return "*" in tags or etag.removeprefix("W/") in tags
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and last_modified is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        # HTTP dates have one-second resolution
+        return _utc(last_modified).replace(microsecond=0) <= _utc(since)
+    return False
+
+
+def not_modified_response(headers: Dict[str, str]) -> Response:
+    return Response(status_code=304, headers=headers)
@@ -0,0 +1,21 @@
+"""Process memory introspection shared by workers and the model registry benchmark."""
+
+import os
+from typing import Optional
+
+
+def current_rss_bytes() -> Optional[int]:
+    """Current resident set size of this process (Linux /proc, else peak RSS via resource)."""
+    try:
+        with open("/proc/self/statm", "r", encoding="ascii") as fh:
+            pages = int(fh.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE")
+    except Exception:
+        pass
+    try:
+        import resource
+
+        # ru_maxrss is KiB on Linux and bytes on macOS; only reached off Linux
+        return int(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+    except Exception:
+        return None
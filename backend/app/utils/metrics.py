@@ -0,0 +1,57 @@
+from typing import Any, Optional, Sequence
+
+try:
+    from prometheus_client import CollectorRegistry, Counter, Gauge, Histogram  # type: ignore
+except Exception:  # pragma: no cover - optional dependency
+    CollectorRegistry = None  # type: ignore
+    Counter = None  # type: ignore
+    Gauge = None  # type: ignore
+    Histogram = None  # type: ignore
+
+
+# Shared registry so API, workers and the pipeline export through the same collector.
+registry: Optional[Any] = CollectorRegistry() if CollectorRegistry is not None else None
+
+
+class _NoopMetric:
+    """Stand-in used when prometheus_client is unavailable; accepts and ignores all updates."""
+
+    def labels(self, *args: Any, **kwargs: Any) -> "_NoopMetric":
+        return self
+
+    def inc(self, amount: float = 1.0) -> None:
+        pass
+
+    def dec(self, amount: float = 1.0) -> None:
+        pass
+
+    def set(self, value: float) -> None:
+        pass
+
+    def observe(self, value: float) -> None:
+        pass
+
+
+def counter(name: str, documentation: str, labelnames: Sequence[str] = ()) -> Any:
+    if Counter is None or registry is None:
+        return _NoopMetric()
+    return Counter(name, documentation, list(labelnames), registry=registry)
+
+
+def gauge(name: str, documentation: str, labelnames: Sequence[str] = ()) -> Any:
+    if Gauge is None or registry is None:
+        return _NoopMetric()
+    return Gauge(name, documentation, list(labelnames), registry=registry)
+
+
+def histogram(
+    name: str,
+    documentation: str,
+    labelnames: Sequence[str] = (),
+    buckets: Optional[Sequence[float]] = None,
+) -> Any:
+    if Histogram is None or registry is None:
+        return _NoopMetric()
+    if buckets is None:
+        return Histogram(name, documentation, list(labelnames), registry=registry)
+    return Histogram(name, documentation, list(labelnames), registry=registry, buckets=list(buckets))
@@ -21,6 +21,16 @@ def _normalize_weights(weights: Dict[str, float]) -> Dict[str, float]:
     return {k: float(v) / total for k, v in weights.items()}
 
 
+def estimate_volatility(sentiment: Optional[float], urgency: Optional[float]) -> float:
+    """Lightweight volatility heuristic in [0,1].
+
+    Combines magnitude of sentiment with urgency. Keeps computation local and fast.
+    """
+    s_mag = abs(float(sentiment or 0.0))
+    u_val = float(urgency or 0.0)
+    return _clamp(0.5 * s_mag + 0.5 * u_val, 0.0, 1.0)
+
+
 def compute_risk_score(
     sentiment_score: Optional[float],
     urgency: Optional[float],
@@ -80,3 +90,16 @@ def compute_risk_score(
     }
 
 
+def score_risk_percent(
+    sentiment: Optional[float], urgency: Optional[float], volatility: Optional[float] = None
+) -> Optional[float]:
+    """Risk percent (0..100) of a stored score row, or None if it was never scored.
+
+    Rows persist sentiment and urgency only; volatility falls back to `estimate_volatility`,
+    the same heuristic `/v1/analyze` uses.
+    """
+    if sentiment is None and urgency is None:
+        return None
+    if volatility is None:
+        volatility = estimate_volatility(sentiment, urgency)
+    return float(compute_risk_score(sentiment, urgency, volatility)["risk_percent"])
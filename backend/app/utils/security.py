@@ -1,15 +1,22 @@
 import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
-from typing import Optional
+from typing import Optional, Tuple
 
 from fastapi import Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from jose import JWTError, jwt
 from passlib.context import CryptContext
+from sqlalchemy import event, inspect, update
 from sqlalchemy.orm import Session
 
-from app.db.session import get_db
+from app.db.session import SessionLocal
 from app.models.user import User
+from app.utils import metrics
 
 
 # Password hashing context
@@ -41,25 +48,130 @@ def create_access_token(subject: str | int, expires_delta: Optional[timedelta] =
 bearer_scheme = HTTPBearer(auto_error=True)
 
 
+@dataclass(frozen=True)
+class CurrentUser:
+    """Immutable snapshot of an authenticated user; safe to share between requests via the cache."""
+
+    id: int
+    email: str
+    is_active: bool
+    is_superuser: bool
+
+
+# token subject + expiry → (user snapshot, monotonic deadline). Entries live at most
+# AUTH_CACHE_TTL_SECONDS and never past the token's own expiry.
+AUTH_CACHE_TTL_SECONDS = float(os.getenv("AUTH_CACHE_TTL_SECONDS", "60"))
+AUTH_CACHE_MAX_ENTRIES = int(os.getenv("AUTH_CACHE_MAX_ENTRIES", "10000"))
+_user_cache: "OrderedDict[Tuple[int, int], Tuple[CurrentUser, float]]" = OrderedDict()
+_user_cache_lock = threading.Lock()
+
+_auth_cache_total = metrics.counter("auth_user_cache_total", "Token to user resolutions by cache result", ["result"])
+
+
 def _get_user_by_id(db: Session, user_id: int) -> Optional[User]:
     return db.query(User).filter(User.id == user_id, User.is_active == True).first()  # noqa: E712
 
 
+def _load_current_user(user_id: int) -> Optional[CurrentUser]:
+    with SessionLocal() as db:
+        user = _get_user_by_id(db, user_id)
+        if user is None:
+            return None
+        return CurrentUser(
+            id=int(user.id), email=str(user.email), is_active=True, is_superuser=bool(user.is_superuser)
+        )
+
+
+def _cache_get(key: Tuple[int, int]) -> Optional[CurrentUser]:
+    with _user_cache_lock:
+        entry = _user_cache.get(key)
+        if entry is None:
+            return None
+        if entry[1] <= time.monotonic():
+            del _user_cache[key]
+            return None
+        _user_cache.move_to_end(key)
+        return entry[0]
+
+
+def _cache_put(key: Tuple[int, int], user: CurrentUser, token_exp: int) -> None:
+    ttl = min(AUTH_CACHE_TTL_SECONDS, token_exp - time.time())
+    if ttl <= 0:
+        return
+    with _user_cache_lock:
+        _user_cache[key] = (user, time.monotonic() + ttl)
+        _user_cache.move_to_end(key)
+        while len(_user_cache) > AUTH_CACHE_MAX_ENTRIES:
+            _user_cache.popitem(last=False)
+
+
+def invalidate_user(user_id: int) -> None:
+    """Drop every cached token for `user_id` (deactivation, deletion, privilege change)."""
+    with _user_cache_lock:
+        for key in [k for k in _user_cache if k[0] == user_id]:
+            del _user_cache[key]
+
+
+def clear_user_cache() -> None:
+    with _user_cache_lock:
+        _user_cache.clear()
+
+
+def deactivate_user(db: Session, user_id: int) -> None:
+    db.execute(update(User).where(User.id == user_id).values(is_active=False))
+    db.commit()
+    invalidate_user(user_id)
+
+
+@event.listens_for(User, "after_update")
+def _invalidate_on_user_update(_mapper, _connection, target: User) -> None:
+    # ORM-level changes in this process (admin scripts, future endpoints) invalidate automatically
+    state = inspect(target)
+    if state.attrs.is_active.history.has_changes() or state.attrs.is_superuser.history.has_changes():
+        invalidate_user(int(target.id))
+
+
+@event.listens_for(User, "after_delete")
+def _invalidate_on_user_delete(_mapper, _connection, target: User) -> None:
+    invalidate_user(int(target.id))
+
+
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
-    db: Session = Depends(get_db),
-) -> User:
+) -> CurrentUser:
+    """Resolve the bearer token to an active user.
+
+    Cache hits cost no DB round trip; misses query in the threadpool so the event loop never
+    blocks on the database.
+    """
     token = credentials.credentials
     try:
         payload = jwt.decode(token, JWT_SECRET_KEY, algorithms=[JWT_ALGORITHM])
-        sub = payload.get("sub")
-        if sub is None:
-            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid authentication credentials")
-        user = _get_user_by_id(db, int(sub))
-        if not user:
-            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found or inactive")
-        return user
     except JWTError:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Could not validate credentials")
-
-
+    sub = payload.get("sub")
+    if sub is None:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid authentication credentials")
+    try:
+        user_id = int(sub)
+    except (TypeError, ValueError):
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid authentication credentials")
+
+    key = (user_id, int(payload.get("exp") or 0))
+    user = _cache_get(key)
+    if user is not None:
+        _auth_cache_total.labels("hit").inc()
+        return user
+    _auth_cache_total.labels("miss").inc()
+    user = await run_in_threadpool(_load_current_user, user_id)
+    if user is None:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found or inactive")
+    _cache_put(key, user, key[1])
+    return user
+
+
+async def get_current_superuser(user: CurrentUser = Depends(get_current_user)) -> CurrentUser:
+    """Like `get_current_user`, but only for superusers (service and admin accounts)."""
+    if not user.is_superuser:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Superuser privileges required")
+    return user
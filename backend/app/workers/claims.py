@@ -0,0 +1,205 @@
+"""Atomic work claiming over `headlines.status` so several workers can drain one backlog.
+
+On Postgres a batch is claimed with `UPDATE ... WHERE id IN (SELECT ... FOR UPDATE SKIP LOCKED)`,
+so concurrent workers skip each other's rows instead of blocking or double-processing. SQLite
+has no row locks, but a single UPDATE ... RETURNING statement runs under its database-wide write
+lock, which gives the same guarantee for local runs.
+
+Claims older than CLAIM_TIMEOUT_SECONDS (a crashed worker) become claimable again. A claim's
+`claimed_at` doubles as its token: work handed on to another process (a Celery batch) carries it
+and re-checks ownership with `renew_claims` before processing, so a batch that waited past the
+timeout does not score rows that have since been re-claimed elsewhere. Every
+claimed headline ends in an explicit outcome: `scored`, `no_entities` (set by the processor),
+`failed` with exponential backoff until `next_retry_at`, or `dead` after PROCESSING_MAX_ATTEMPTS.
+"""
+
+import logging
+import os
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Optional
+
+from sqlalchemy import and_, or_, select, update
+from sqlalchemy.orm import Session
+
+from app.models.headline import (
+    STATUS_CLAIMED,
+    STATUS_DEAD,
+    STATUS_FAILED,
+    STATUS_NO_ENTITIES,
+    STATUS_PENDING,
+    STATUS_SCORED,
+    Headline,
+)
+from app.utils import metrics
+
+
+logger = logging.getLogger("claims")
+
+
+_outcomes_total = metrics.counter(
+    "headline_processing_outcomes_total", "Processing outcomes per claimed headline", ["outcome"]
+)
+_batch_wasted_ratio = metrics.histogram(
+    "headline_batch_wasted_ratio",
+    "Fraction of each claimed batch that produced no scores (no entities or failed)",
+    buckets=(0.0, 0.1, 0.25, 0.5, 0.75, 0.9, 1.0),
+)
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def _priority_order(rows: Iterable[Any]) -> List[int]:
+    """Ids from (id, priority) rows: watchlist headlines first, newest first within a priority."""
+    return [int(r[0]) for r in sorted(rows, key=lambda r: (int(r[1] or 0), int(r[0])), reverse=True)]
+
+
+def claim_headline_batch(db: Session, limit: int = 100, claimed_at: Optional[datetime] = None) -> List[int]:
+    """Claim up to `limit` unprocessed headlines (watchlist first, then newest) and return their ids.
+
+    `claimed_at` (default: now) is stored on the rows and serves as the claim token.
+    """
+    now = claimed_at or _now()
+    stale_before = now - timedelta(seconds=float(os.getenv("CLAIM_TIMEOUT_SECONDS", "600")))
+    candidates = (
+        select(Headline.id)
+        .where(
+            or_(
+                Headline.status == STATUS_PENDING,
+                and_(Headline.status == STATUS_FAILED, Headline.next_retry_at <= now),
+                and_(Headline.status == STATUS_CLAIMED, Headline.claimed_at < stale_before),
+            )
+        )
+        .order_by(Headline.priority.desc(), Headline.id.desc())
+        .limit(limit)
+    )
+    if db.get_bind().dialect.name == "postgresql":
+        candidates = candidates.with_for_update(skip_locked=True)
+
+    stmt = (
+        update(Headline)
+        .where(Headline.id.in_(candidates.scalar_subquery()))
+        .values(status=STATUS_CLAIMED, claimed_at=now, attempts=Headline.attempts + 1)
+        .returning(Headline.id, Headline.priority)
+        .execution_options(synchronize_session=False)
+    )
+    ids = _priority_order(db.execute(stmt).all())
+    db.commit()
+    return ids
+
+
+def claim_ids(db: Session, headline_ids: Iterable[int], claimed_at: Optional[datetime] = None) -> List[int]:
+    """Claim those of `headline_ids` that are still pending; returns the ids this caller now owns.
+
+    Used by producers that score their own inserts and by event consumers. Ids are announced at
+    insert time, so a row may already have been claimed by the other side or by a sweep; only
+    the returned ids may be processed. `claimed_at` (default: now) is the claim token.
+    """
+    ids = list(headline_ids)
+    if not ids:
+        return []
+    stmt = (
+        update(Headline)
+        .where(Headline.id.in_(ids), Headline.status == STATUS_PENDING)
+        .values(status=STATUS_CLAIMED, claimed_at=claimed_at or _now(), attempts=Headline.attempts + 1)
+        .returning(Headline.id, Headline.priority)
+        .execution_options(synchronize_session=False)
+    )
+    claimed = _priority_order(db.execute(stmt).all())
+    db.commit()
+    return claimed
+
+
+def renew_claims(db: Session, headline_ids: Iterable[int], token: datetime) -> List[int]:
+    """Refresh the claims on `headline_ids` still held under `token`; returns the ids still owned.
+
+    Rows re-claimed by someone else (after CLAIM_TIMEOUT_SECONDS) or already finished are left
+    alone. The refreshed rows get a new `claimed_at`, so the timeout restarts for this attempt.
+    """
+    ids = list(headline_ids)
+    if not ids:
+        return []
+    stmt = (
+        update(Headline)
+        .where(Headline.id.in_(ids), Headline.status == STATUS_CLAIMED, Headline.claimed_at == token)
+        .values(claimed_at=_now())
+        .returning(Headline.id)
+        .execution_options(synchronize_session=False)
+    )
+    owned = {int(r[0]) for r in db.execute(stmt).all()}
+    db.commit()
+    return [hid for hid in ids if hid in owned]
+
+
+def release_claims(db: Session, headline_ids: Iterable[int]) -> None:
+    """Return claimed ids to the pending pool (e.g. after a processing error)."""
+    ids = list(headline_ids)
+    if not ids:
+        return
+    db.execute(
+        update(Headline)
+        .where(Headline.id.in_(ids), Headline.status == STATUS_CLAIMED)
+        .values(status=STATUS_PENDING, claimed_at=None)
+        .execution_options(synchronize_session=False)
+    )
+    db.commit()
+
+
+def retry_delay_seconds(attempts: int) -> float:
+    """Exponential backoff: RETRY_BASE_SECONDS * 2^(attempts-1), capped at RETRY_MAX_SECONDS."""
+    base = float(os.getenv("RETRY_BASE_SECONDS", "60"))
+    cap = float(os.getenv("RETRY_MAX_SECONDS", "3600"))
+    return min(cap, base * (2 ** max(0, attempts - 1)))
+
+
+def record_failure(db: Session, headline_ids: Iterable[int], error: str = "") -> Dict[int, str]:
+    """Mark claimed ids as failed with backoff, or dead once attempts reach the limit.
+
+    Returns {id: new status}.
+    """
+    ids = list(headline_ids)
+    if not ids:
+        return {}
+    max_attempts = int(os.getenv("PROCESSING_MAX_ATTEMPTS", "5"))
+    now = _now()
+    outcome: Dict[int, str] = {}
+    rows = db.execute(select(Headline.id, Headline.attempts).where(Headline.id.in_(ids))).all()
+    for hid, attempts in rows:
+        attempts = int(attempts or 0)
+        if attempts >= max_attempts:
+            values = {"status": STATUS_DEAD, "next_retry_at": None, "processed_at": now}
+        else:
+            values = {"status": STATUS_FAILED, "next_retry_at": now + timedelta(seconds=retry_delay_seconds(attempts))}
+        db.execute(
+            update(Headline)
+            .where(Headline.id == hid)
+            .values(claimed_at=None, last_error=(error or None) and error[:512], **values)
+            .execution_options(synchronize_session=False)
+        )
+        outcome[int(hid)] = values["status"]
+    db.commit()
+    return outcome
+
+
+def observe_batch(outcomes: Dict[str, int]) -> float:
+    """Export per-outcome counts for one batch and return its wasted-work ratio."""
+    total = sum(outcomes.values())
+    for name, n in outcomes.items():
+        if n:
+            _outcomes_total.labels(name).inc(n)
+    if not total:
+        return 0.0
+    wasted = total - outcomes.get(STATUS_SCORED, 0)
+    ratio = wasted / total
+    _batch_wasted_ratio.observe(ratio)
+    logger.info(
+        "batch outcomes %s wasted=%.0f%%",
+        " ".join(f"{k}={v}" for k, v in sorted(outcomes.items())),
+        ratio * 100.0,
+    )
+    return ratio
+
+
+def new_outcome_tally() -> Dict[str, int]:
+    return {STATUS_SCORED: 0, STATUS_NO_ENTITIES: 0, STATUS_FAILED: 0, STATUS_DEAD: 0}
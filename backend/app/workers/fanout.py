@@ -0,0 +1,61 @@
+"""Helpers for fanning the processing backlog out across Celery workers.
+
+The dispatcher claims a slice of the backlog, splits it into a high-priority part (headlines that
+match the watchlist pre-pass in `app.ingest.priority`) and a normal part, and cuts both into
+fixed-size batches. Each batch becomes one task; a chord callback folds the per-batch outcome
+tallies into a summary.
+"""
+
+from typing import Any, Dict, Iterable, List, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.ingest import priority
+from app.models.headline import PRIORITY_NORMAL, Headline
+from app.nlp import processor
+from app.workers.claims import new_outcome_tally
+
+
+QUEUE_DEFAULT = "nlp"
+QUEUE_HIGH = "nlp_high"
+
+
+def partition_by_watchlist(db: Session, headline_ids: List[int]) -> Tuple[List[int], List[int]]:
+    """Split ids into (high_priority, normal), preserving the input order within each part.
+
+    Re-runs the watchlist pre-pass so items watched since the headline was stored count too.
+    """
+    if not headline_ids:
+        return [], []
+    rows = dict(
+        db.execute(select(Headline.id, Headline.title).where(Headline.id.in_(headline_ids))).all()
+    )
+    ordered = [hid for hid in headline_ids if hid in rows]
+    prios = priority.priorities_for(db, [rows[hid] or "" for hid in ordered])
+    high = [hid for hid, prio in zip(ordered, prios) if prio > PRIORITY_NORMAL]
+    normal = [hid for hid, prio in zip(ordered, prios) if prio == PRIORITY_NORMAL]
+    return high, normal
+
+
+def chunk_ids(ids: List[int], size: int) -> List[List[int]]:
+    size = max(1, int(size))
+    return [ids[i:i + size] for i in range(0, len(ids), size)]
+
+
+def tally_results(results: Iterable[Dict[str, Any]], failed: Dict[int, str]) -> Dict[str, int]:
+    """Outcome counts for one processed batch (see `claims.new_outcome_tally`)."""
+    outcomes = new_outcome_tally()
+    for r in results:
+        outcomes[processor.result_status(r)] += 1
+    for status in failed.values():
+        outcomes[status] += 1
+    return outcomes
+
+
+def merge_tallies(tallies: Iterable[Dict[str, int]]) -> Dict[str, int]:
+    merged: Dict[str, int] = {}
+    for tally in tallies:
+        for key, n in (tally or {}).items():
+            merged[key] = merged.get(key, 0) + int(n)
+    return merged
@@ -0,0 +1,147 @@
+"""Lease-based leader election between scheduler replicas.
+
+One row per lease name in `scheduler_leases`. A replica becomes leader by atomically taking a
+lease that is free, expired or already its own, and stays leader by renewing it every
+`ttl / 3` seconds. If the leader dies, its lease expires after LEADER_LEASE_SECONDS and a standby
+takes over on its next renewal attempt. A leader that cannot renew (e.g. lost DB connectivity)
+stops acting as leader once its own view of the lease expires, before anyone else can take it.
+
+Lease timestamps are computed by the database (`now()`), never by a replica's own clock, so clock
+skew between replicas cannot make two of them see the lease as theirs.
+"""
+
+import logging
+import os
+import socket
+import time
+import uuid
+from typing import Any, Callable, Optional
+
+from sqlalchemy import func, or_, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.db.session import SessionLocal
+from app.models.scheduler_lease import SchedulerLease
+from app.utils import metrics
+
+
+logger = logging.getLogger("leader")
+
+
+_is_leader = metrics.gauge("scheduler_is_leader", "1 while this replica holds the lease", ["lease"])
+
+
+def db_now(dialect: str, plus_s: float = 0.0) -> Any:
+    """SQL expression for the database server's current time, optionally `plus_s` seconds ahead."""
+    if dialect == "sqlite":
+        # Same text layout SQLAlchemy stores DateTime in on SQLite, so comparisons stay lexical
+        return func.strftime("%Y-%m-%d %H:%M:%f000", "now", f"{plus_s:+.3f} seconds")
+    now = func.now()
+    return now + func.make_interval(0, 0, 0, 0, 0, 0, plus_s) if plus_s else now
+
+
+def default_holder() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
+class LeaderLease:
+    def __init__(
+        self,
+        name: str = "ingest",
+        holder: Optional[str] = None,
+        ttl_s: Optional[float] = None,
+        session_factory: Callable[[], Session] = SessionLocal,
+    ) -> None:
+        self.name = name
+        self.holder = holder or default_holder()
+        self.ttl_s = ttl_s or float(os.getenv("LEADER_LEASE_SECONDS", "30"))
+        self.session_factory = session_factory
+        self._valid_until = 0.0
+
+    @property
+    def renew_interval_s(self) -> float:
+        return max(1.0, self.ttl_s / 3.0)
+
+    @property
+    def is_leader(self) -> bool:
+        return time.monotonic() < self._valid_until
+
+    def _ensure_row(self, db: Session) -> None:
+        if db.get(SchedulerLease, self.name) is not None:
+            return
+        try:
+            db.add(SchedulerLease(name=self.name))
+            db.commit()
+        except IntegrityError:
+            # Another replica created it first
+            db.rollback()
+
+    def try_acquire(self) -> bool:
+        """Take or renew the lease; returns whether this replica is leader afterwards."""
+        was_leader = self.is_leader
+        started = time.monotonic()
+        reachable = True
+        try:
+            with self.session_factory() as db:
+                self._ensure_row(db)
+                dialect = db.get_bind().dialect.name
+                now = db_now(dialect)
+                result = db.execute(
+                    update(SchedulerLease)
+                    .where(
+                        SchedulerLease.name == self.name,
+                        or_(
+                            SchedulerLease.holder == self.holder,
+                            SchedulerLease.holder.is_(None),
+                            SchedulerLease.expires_at < now,
+                        ),
+                    )
+                    .values(
+                        holder=self.holder,
+                        renewed_at=now,
+                        expires_at=db_now(dialect, self.ttl_s),
+                    )
+                    .execution_options(synchronize_session=False)
+                )
+                acquired = result.rowcount == 1
+                if acquired and not was_leader:
+                    db.execute(
+                        update(SchedulerLease)
+                        .where(SchedulerLease.name == self.name)
+                        .values(acquired_at=now)
+                        .execution_options(synchronize_session=False)
+                    )
+                db.commit()
+        except Exception:
+            logger.exception("lease %s renewal failed", self.name)
+            acquired = False
+            reachable = False
+
+        if acquired:
+            # Measured from before the round trip, so the local view never outlives the row
+            self._valid_until = started + self.ttl_s
+        elif reachable:
+            # Someone else holds the lease
+            self._valid_until = 0.0
+        # Unreachable DB: keep leading until our own view of the lease runs out
+        if self.is_leader != was_leader:
+            logger.info("lease %s: %s is %s", self.name, self.holder, "leader" if self.is_leader else "standby")
+        _is_leader.labels(self.name).set(1 if self.is_leader else 0)
+        return self.is_leader
+
+    def release(self) -> None:
+        """Give the lease up (on shutdown) so a standby can take over immediately."""
+        self._valid_until = 0.0
+        _is_leader.labels(self.name).set(0)
+        try:
+            with self.session_factory() as db:
+                db.execute(
+                    update(SchedulerLease)
+                    .where(SchedulerLease.name == self.name, SchedulerLease.holder == self.holder)
+                    .values(holder=None, expires_at=None)
+                    .execution_options(synchronize_session=False)
+                )
+                db.commit()
+        except Exception:
+            logger.exception("lease %s release failed", self.name)
@@ -0,0 +1,97 @@
+"""Model lifecycle for long-running worker processes (Celery prefork children, APScheduler).
+
+Models are loaded once per process at start-up instead of inside whichever task first needs them:
+
+- `NLP_PRELOAD=child` (default): each prefork child loads its own copy in `worker_process_init`.
+- `NLP_PRELOAD=parent`: the Celery parent loads before forking, so children share the model pages
+  copy-on-write. Forking after an OpenMP/torch thread pool has started is not fork-safe (children
+  can hang on the inherited pool), and fixing the thread count does not change that; use it only
+  when loading does not start those pools, and verify on your build before relying on it.
+- `NLP_PRELOAD=off`: keep lazy loading.
+
+Torch intra-op threads are sized together with process concurrency, `cpu_count // concurrency`
+unless NLP_TORCH_THREADS is set, so N children never run N x cpu_count threads between them.
+"""
+
+import logging
+import os
+import time
+from typing import Dict, Optional
+
+from app.nlp import processor
+from app.utils import metrics
+from app.utils.memory import current_rss_bytes
+
+
+logger = logging.getLogger("worker-lifecycle")
+
+
+_rss_bytes = metrics.gauge("worker_process_rss_bytes", "Resident set size of this worker process", ["role"])
+_model_load_seconds = metrics.gauge("worker_model_load_seconds", "Time spent loading NLP models at start-up")
+
+
+def preload_mode() -> str:
+    return os.getenv("NLP_PRELOAD", "child").lower()
+
+
+def threads_per_process(concurrency: int) -> int:
+    explicit = os.getenv("NLP_TORCH_THREADS")
+    if explicit:
+        return max(1, int(explicit))
+    return max(1, (os.cpu_count() or 1) // max(1, concurrency))
+
+
+def configure_threads(concurrency: int) -> int:
+    """Limit torch/BLAS threads for a process that shares the CPU with `concurrency - 1` siblings."""
+    threads = threads_per_process(concurrency)
+    # Read by OpenMP/MKL when they initialise; harmless if already set by the operator
+    for var in ("OMP_NUM_THREADS", "MKL_NUM_THREADS"):
+        os.environ.setdefault(var, str(threads))
+    try:
+        import torch  # type: ignore
+
+        torch.set_num_threads(threads)
+    except Exception:
+        pass
+    return threads
+
+
+def report_rss(role: str, log: bool = True) -> Optional[int]:
+    rss = current_rss_bytes()
+    if rss is not None:
+        _rss_bytes.labels(role).set(rss)
+        if log:
+            logger.info("%s pid=%s rss=%.1f MiB", role, os.getpid(), rss / (1024 * 1024))
+    return rss
+
+
+def load_models() -> Dict[str, float]:
+    """Load spaCy and the sentiment pipeline now; returns load seconds per model.
+
+    Raises RuntimeError when MODEL_REGISTRY_DIR is set but yields no usable sentiment model, so
+    a misconfigured worker fails at start-up instead of storing neutral scores.
+    """
+    timings: Dict[str, float] = {}
+    for name, loader in (("spacy", processor._get_spacy_model), ("sentiment", processor._get_sentiment_pipeline)):
+        t0 = time.perf_counter()
+        try:
+            loader()
+        except Exception:
+            logger.exception("failed to load %s model", name)
+        timings[name] = time.perf_counter() - t0
+    error = processor.sentiment_load_error()
+    if error:
+        raise RuntimeError(f"sentiment model unavailable: {error}")
+    _model_load_seconds.set(sum(timings.values()))
+    logger.info(
+        "models loaded pid=%s %s", os.getpid(), " ".join(f"{k}={v:.2f}s" for k, v in timings.items())
+    )
+    return timings
+
+
+def init_process(concurrency: int, role: str, load: bool = True) -> None:
+    """Start-up hook for a worker process: size threads, load models, report memory."""
+    configure_threads(concurrency)
+    if load and preload_mode() != "off":
+        load_models()
+    report_rss(role)
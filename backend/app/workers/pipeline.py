@@ -0,0 +1,467 @@
+"""Long-running streaming ingest→NLP pipeline.
+
+Stages are asyncio tasks linked by bounded queues:
+
+    fetch → normalize → dedupe → persist → [enrich] → nlp → persist scores
+
+Each stage has its own concurrency. When NLP falls behind, its input queue fills up, `put()`
+blocks the persist stage, and the pressure propagates back to fetching instead of growing memory.
+
+The optional enrich stage (ENRICH_ARTICLE_BODIES=1) fetches article bodies but only waits
+`enrich_budget_s` for a batch's fetches; those still running then are cancelled, so they never
+stall NLP or pile up. The bodies that did arrive are stored before the ids move on to NLP, so a
+body is never written after the title-only score.
+
+Run with:
+
+    python -m app.workers.pipeline
+"""
+
+import asyncio
+import hashlib
+import logging
+import os
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from dotenv import load_dotenv
+
+from app.db.session import SessionLocal
+from app.ingest import article_fetcher, news_fetcher
+from app.nlp import processor
+from app.utils import metrics
+from app.workers import claims, fanout
+
+
+load_dotenv()
+
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+logger = logging.getLogger("pipeline")
+
+
+_stage_items_total = metrics.counter(
+    "pipeline_stage_items_total", "Items emitted by each pipeline stage", ["stage"]
+)
+_stage_errors_total = metrics.counter(
+    "pipeline_stage_errors_total", "Errors raised inside each pipeline stage", ["stage"]
+)
+_enrich_timeouts_total = metrics.counter(
+    "pipeline_enrich_timeouts_total", "Enrich batches cancelled at PIPELINE_ENRICH_BUDGET_SECONDS"
+)
+_queue_depth = metrics.gauge("pipeline_queue_depth", "Current depth of each inter-stage queue", ["queue"])
+_headline_to_score_seconds = metrics.histogram(
+    "pipeline_headline_to_score_seconds",
+    "Seconds from headline insert to risk score persist",
+    buckets=(0.1, 0.25, 0.5, 1, 2, 5, 10, 30, 60, 120, 300),
+)
+
+
+@dataclass
+class PipelineConfig:
+    rss_feeds: List[str] = field(default_factory=lambda: list(news_fetcher.DEFAULT_RSS_FEEDS))
+    fetch_interval_s: float = 60.0
+    fetch_concurrency: int = 4
+    normalize_concurrency: int = 2
+    nlp_concurrency: int = 1
+    queue_size: int = 256
+    persist_batch_size: int = 50
+    nlp_batch_size: int = 16
+    batch_linger_s: float = 0.5
+    dedupe_cache_size: int = 50_000
+    stats_interval_s: float = 30.0
+    enrich_bodies: bool = False
+    enrich_concurrency: int = 4
+    enrich_budget_s: float = 3.0
+
+    @classmethod
+    def from_env(cls) -> "PipelineConfig":
+        cfg = cls()
+        feeds = os.getenv("PIPELINE_RSS_FEEDS")
+        if feeds:
+            cfg.rss_feeds = [f.strip() for f in feeds.split(",") if f.strip()]
+        cfg.fetch_interval_s = float(os.getenv("PIPELINE_FETCH_INTERVAL_SECONDS", cfg.fetch_interval_s))
+        cfg.fetch_concurrency = int(os.getenv("PIPELINE_FETCH_CONCURRENCY", cfg.fetch_concurrency))
+        cfg.normalize_concurrency = int(os.getenv("PIPELINE_NORMALIZE_CONCURRENCY", cfg.normalize_concurrency))
+        cfg.nlp_concurrency = int(os.getenv("PIPELINE_NLP_CONCURRENCY", cfg.nlp_concurrency))
+        cfg.queue_size = int(os.getenv("PIPELINE_QUEUE_SIZE", cfg.queue_size))
+        cfg.persist_batch_size = int(os.getenv("PIPELINE_PERSIST_BATCH_SIZE", cfg.persist_batch_size))
+        cfg.nlp_batch_size = int(os.getenv("PIPELINE_NLP_BATCH_SIZE", cfg.nlp_batch_size))
+        cfg.batch_linger_s = float(os.getenv("PIPELINE_BATCH_LINGER_SECONDS", cfg.batch_linger_s))
+        cfg.stats_interval_s = float(os.getenv("PIPELINE_STATS_INTERVAL_SECONDS", cfg.stats_interval_s))
+        cfg.enrich_bodies = os.getenv("ENRICH_ARTICLE_BODIES", "0") == "1"
+        cfg.enrich_concurrency = int(os.getenv("PIPELINE_ENRICH_CONCURRENCY", cfg.enrich_concurrency))
+        cfg.enrich_budget_s = float(os.getenv("PIPELINE_ENRICH_BUDGET_SECONDS", cfg.enrich_budget_s))
+        return cfg
+
+
+@dataclass
+class StageStats:
+    name: str
+    processed: int = 0
+    errors: int = 0
+    busy_s: float = 0.0
+    started_at: float = field(default_factory=time.monotonic)
+
+    def snapshot(self) -> Dict[str, Any]:
+        elapsed = max(time.monotonic() - self.started_at, 1e-9)
+        return {
+            "processed": self.processed,
+            "errors": self.errors,
+            "busy_s": round(self.busy_s, 3),
+            "throughput_per_s": round(self.processed / elapsed, 3),
+        }
+
+
+@dataclass
+class _RawItem:
+    kind: str  # "rss" | "newsapi"
+    payload: Any
+    feed_title: Optional[str] = None
+
+
+async def _take_batch(queue: "asyncio.Queue[Any]", max_items: int, linger_s: float) -> List[Any]:
+    """Wait for one item, then keep collecting until `max_items` or `linger_s` elapses."""
+    batch = [await queue.get()]
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + linger_s
+    while len(batch) < max_items:
+        remaining = deadline - loop.time()
+        if remaining <= 0:
+            break
+        try:
+            batch.append(await asyncio.wait_for(queue.get(), remaining))
+        except asyncio.TimeoutError:
+            break
+    return batch
+
+
+def _persist_headlines(items: List[Dict[str, Any]]) -> List[int]:
+    with SessionLocal() as db:
+        ids = news_fetcher.insert_headlines(db, items)
+        # Score only what we claim: the event trigger may have taken some ids since the insert
+        return claims.claim_ids(db, ids)
+
+
+def _analyze(ids: List[int]) -> List[Dict[str, Any]]:
+    with SessionLocal() as db:
+        return processor.analyze_headlines(db, ids)
+
+
+def _persist_scores(results: List[Dict[str, Any]]) -> int:
+    with SessionLocal() as db:
+        return processor.persist_headline_scores(db, results)
+
+
+def _record_failure(ids: List[int], error: str) -> Dict[int, str]:
+    with SessionLocal() as db:
+        return claims.record_failure(db, ids, error)
+
+
+def _observe_outcomes(results: List[Dict[str, Any]], failed: Dict[int, str]) -> None:
+    claims.observe_batch(fanout.tally_results(results, failed))
+
+
+class IngestPipeline:
+    def __init__(
+        self,
+        config: Optional[PipelineConfig] = None,
+        fetcher: Optional[article_fetcher.ArticleFetcher] = None,
+    ) -> None:
+        self.config = config or PipelineConfig.from_env()
+        size = self.config.queue_size
+        self.raw_q: "asyncio.Queue[_RawItem]" = asyncio.Queue(maxsize=size)
+        self.normalized_q: "asyncio.Queue[Dict[str, Any]]" = asyncio.Queue(maxsize=size)
+        self.persist_q: "asyncio.Queue[Dict[str, Any]]" = asyncio.Queue(maxsize=size)
+        self.enrich_q: "asyncio.Queue[int]" = asyncio.Queue(maxsize=size)
+        self.nlp_q: "asyncio.Queue[int]" = asyncio.Queue(maxsize=size)
+        self.scores_q: "asyncio.Queue[List[Dict[str, Any]]]" = asyncio.Queue(maxsize=size)
+        self.stats: Dict[str, StageStats] = {
+            name: StageStats(name)
+            for name in ("fetch", "normalize", "dedupe", "persist", "enrich", "nlp", "persist_scores")
+        }
+        self.fetcher = fetcher
+        self._seen: "OrderedDict[str, None]" = OrderedDict()
+        self._inserted_at: Dict[int, float] = {}
+
+    # -- bookkeeping ---------------------------------------------------------------------------
+
+    def _emitted(self, stage: str, n: int = 1) -> None:
+        self.stats[stage].processed += n
+        _stage_items_total.labels(stage).inc(n)
+
+    def _failed(self, stage: str) -> None:
+        self.stats[stage].errors += 1
+        _stage_errors_total.labels(stage).inc()
+        logger.exception("pipeline stage %s failed", stage)
+
+    async def _timed(self, stage: str, fn: Callable[..., Any], *args: Any) -> Any:
+        """Run `fn` (a coroutine function, or a blocking one in a worker thread) and add its time to `stage`."""
+        t0 = time.perf_counter()
+        try:
+            if asyncio.iscoroutinefunction(fn):
+                return await fn(*args)
+            return await asyncio.to_thread(fn, *args)
+        finally:
+            self.stats[stage].busy_s += time.perf_counter() - t0
+
+    def queue_depths(self) -> Dict[str, int]:
+        return {
+            "raw": self.raw_q.qsize(),
+            "normalized": self.normalized_q.qsize(),
+            "persist": self.persist_q.qsize(),
+            "enrich": self.enrich_q.qsize(),
+            "nlp": self.nlp_q.qsize(),
+            "scores": self.scores_q.qsize(),
+        }
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "stages": {name: s.snapshot() for name, s in self.stats.items()},
+            "queues": self.queue_depths(),
+        }
+
+    # -- stages --------------------------------------------------------------------------------
+
+    async def _fetch_rss(self, feed_url: str, sem: asyncio.Semaphore) -> None:
+        async with sem:
+            try:
+                feed_title, entries = await self._timed("fetch", news_fetcher._fetch_rss_entries, feed_url)
+            except Exception:
+                self._failed("fetch")
+                return
+        for entry in entries:
+            await self.raw_q.put(_RawItem("rss", entry, feed_title))
+            self._emitted("fetch")
+
+    async def _fetch_newsapi(self, sem: asyncio.Semaphore) -> None:
+        async with sem:
+            try:
+                articles = await self._timed("fetch", news_fetcher._fetch_newsapi_articles)
+            except Exception:
+                self._failed("fetch")
+                return
+        for article in articles:
+            await self.raw_q.put(_RawItem("newsapi", article))
+            self._emitted("fetch")
+
+    async def fetch_cycle(self) -> None:
+        sem = asyncio.Semaphore(max(1, self.config.fetch_concurrency))
+        jobs: List[Awaitable[None]] = [self._fetch_rss(url, sem) for url in self.config.rss_feeds]
+        jobs.append(self._fetch_newsapi(sem))
+        await asyncio.gather(*jobs)
+
+    async def _normalize_worker(self) -> None:
+        while True:
+            raw = await self.raw_q.get()
+            try:
+                if raw.kind == "rss":
+                    norm = news_fetcher._normalize_rss_entry(raw.payload, fallback_source=raw.feed_title)
+                else:
+                    norm = news_fetcher._normalize_newsapi_article(raw.payload)
+                if norm.get("text") and norm.get("url"):
+                    await self.normalized_q.put(norm)
+                    self._emitted("normalize")
+            except Exception:
+                self._failed("normalize")
+            finally:
+                self.raw_q.task_done()
+
+    def _remember(self, key: str) -> bool:
+        """Record `key` in the bounded LRU; return False if it was already there."""
+        if key in self._seen:
+            self._seen.move_to_end(key)
+            return False
+        self._seen[key] = None
+        if len(self._seen) > self.config.dedupe_cache_size:
+            self._seen.popitem(last=False)
+        return True
+
+    async def _dedupe_worker(self) -> None:
+        # Cheap in-memory pass so repeat polls of the same feed never reach the DB;
+        # `insert_headlines` still enforces dedupe against stored rows.
+        while True:
+            item = await self.normalized_q.get()
+            try:
+                url = item.get("url")
+                text_key = hashlib.sha256(str(item.get("text") or "").strip().encode("utf-8")).hexdigest()
+                url_new = self._remember(f"u:{url}") if url else True
+                text_new = self._remember(f"t:{text_key}")
+                if url_new and text_new:
+                    await self.persist_q.put(item)
+                    self._emitted("dedupe")
+            except Exception:
+                self._failed("dedupe")
+            finally:
+                self.normalized_q.task_done()
+
+    async def _persist_worker(self) -> None:
+        cfg = self.config
+        while True:
+            batch = await _take_batch(self.persist_q, cfg.persist_batch_size, cfg.batch_linger_s)
+            try:
+                ids = await self._timed("persist", _persist_headlines, batch)
+                now = time.monotonic()
+                next_q = self.enrich_q if cfg.enrich_bodies else self.nlp_q
+                for hid in ids:
+                    self._inserted_at[hid] = now
+                    await next_q.put(hid)
+                self._emitted("persist", len(ids))
+            except Exception:
+                self._failed("persist")
+            finally:
+                for _ in batch:
+                    self.persist_q.task_done()
+
+    async def _enrich(self, ids: List[int]) -> None:
+        if self.fetcher is None:
+            self.fetcher = article_fetcher.ArticleFetcher()
+        t0 = time.perf_counter()
+        bodies: Dict[int, str] = {}
+        try:
+            # Only the fetch is bounded; bodies that arrive in time are scored, the rest are dropped
+            bodies = await asyncio.wait_for(
+                article_fetcher.fetch_missing_bodies(ids, fetcher=self.fetcher), timeout=self.config.enrich_budget_s
+            )
+        except asyncio.TimeoutError:
+            _enrich_timeouts_total.inc()
+        except Exception:
+            self._failed("enrich")
+        try:
+            # Not cancelled: NLP must see every body that is going to be stored
+            stored = await article_fetcher.save_bodies(bodies)
+            self._emitted("enrich", stored)
+        except Exception:
+            self._failed("enrich")
+        finally:
+            self.stats["enrich"].busy_s += time.perf_counter() - t0
+
+    async def _enrich_worker(self) -> None:
+        cfg = self.config
+        while True:
+            ids = await _take_batch(self.enrich_q, cfg.nlp_batch_size, cfg.batch_linger_s)
+            await self._enrich(ids)
+            for hid in ids:
+                await self.nlp_q.put(hid)
+                self.enrich_q.task_done()
+
+    async def _fail_ids(self, ids: List[int], exc: Exception) -> None:
+        """Give failed ids a retry time (or dead-letter them) so they are not stuck as claimed."""
+        for hid in ids:
+            self._inserted_at.pop(hid, None)
+        try:
+            failed = await asyncio.to_thread(_record_failure, ids, repr(exc))
+            _observe_outcomes([], failed)
+        except Exception:
+            logger.exception("could not record failure for %d headlines", len(ids))
+
+    async def _nlp_worker(self) -> None:
+        cfg = self.config
+        while True:
+            ids = await _take_batch(self.nlp_q, cfg.nlp_batch_size, cfg.batch_linger_s)
+            try:
+                results = await self._timed("nlp", _analyze, ids)
+                # Ids the processor returned no result for never reach persist_scores
+                returned = {r["headline_id"] for r in results}
+                for hid in ids:
+                    if hid not in returned:
+                        self._inserted_at.pop(hid, None)
+                await self.scores_q.put(results)
+                self._emitted("nlp", len(results))
+            except Exception as exc:
+                self._failed("nlp")
+                await self._fail_ids(ids, exc)
+            finally:
+                for _ in ids:
+                    self.nlp_q.task_done()
+
+    async def _persist_scores_worker(self) -> None:
+        while True:
+            results = await self.scores_q.get()
+            try:
+                await self._timed("persist_scores", _persist_scores, results)
+                now = time.monotonic()
+                for r in results:
+                    t0 = self._inserted_at.pop(r["headline_id"], None)
+                    if t0 is not None:
+                        _headline_to_score_seconds.observe(now - t0)
+                self._emitted("persist_scores", len(results))
+                _observe_outcomes(results, {})
+            except Exception as exc:
+                self._failed("persist_scores")
+                await self._fail_ids([r["headline_id"] for r in results], exc)
+            finally:
+                self.scores_q.task_done()
+
+    async def _report_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.config.stats_interval_s)
+            for name, depth in self.queue_depths().items():
+                _queue_depth.labels(name).set(depth)
+            logger.info("pipeline stats %s", self.snapshot())
+
+    # -- lifecycle -----------------------------------------------------------------------------
+
+    def _start_workers(self) -> List["asyncio.Task[None]"]:
+        cfg = self.config
+        tasks = [asyncio.create_task(self._normalize_worker()) for _ in range(max(1, cfg.normalize_concurrency))]
+        tasks.append(asyncio.create_task(self._dedupe_worker()))
+        tasks.append(asyncio.create_task(self._persist_worker()))
+        if cfg.enrich_bodies:
+            tasks.extend(asyncio.create_task(self._enrich_worker()) for _ in range(max(1, cfg.enrich_concurrency)))
+        tasks.extend(asyncio.create_task(self._nlp_worker()) for _ in range(max(1, cfg.nlp_concurrency)))
+        tasks.append(asyncio.create_task(self._persist_scores_worker()))
+        tasks.append(asyncio.create_task(self._report_loop()))
+        return tasks
+
+    async def drain(self) -> None:
+        """Wait until every queue is empty and every in-flight item has been handled."""
+        for q in (self.raw_q, self.normalized_q, self.persist_q, self.enrich_q, self.nlp_q, self.scores_q):
+            await q.join()
+
+    async def run(self, max_cycles: Optional[int] = None) -> Dict[str, Any]:
+        """Fetch every `fetch_interval_s` until cancelled, or for `max_cycles` cycles then drain.
+
+        Returns the final stats snapshot.
+        """
+        workers = self._start_workers()
+        cycles = 0
+        try:
+            while max_cycles is None or cycles < max_cycles:
+                started = time.monotonic()
+                await self.fetch_cycle()
+                cycles += 1
+                if max_cycles is not None and cycles >= max_cycles:
+                    break
+                await asyncio.sleep(max(0.0, self.config.fetch_interval_s - (time.monotonic() - started)))
+            await self.drain()
+        finally:
+            for t in workers:
+                t.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+        return self.snapshot()
+
+
+def main() -> None:
+    if not os.getenv("DATABASE_URL"):
+        raise RuntimeError("DATABASE_URL is required")
+
+    metrics_port = os.getenv("PIPELINE_METRICS_PORT")
+    if metrics_port and metrics.registry is not None:
+        from prometheus_client import start_http_server  # type: ignore
+
+        start_http_server(int(metrics_port), registry=metrics.registry)
+        logger.info("pipeline metrics on :%s/metrics", metrics_port)
+
+    pipeline = IngestPipeline()
+    logger.info("streaming pipeline started. Press Ctrl+C to exit.")
+    try:
+        asyncio.run(pipeline.run())
+    except KeyboardInterrupt:
+        logger.info("shutting down pipeline...")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,18 +1,18 @@
 import os
 import time
 import logging
-from typing import List
+from typing import Optional
 
 from dotenv import load_dotenv
 from apscheduler.schedulers.background import BackgroundScheduler
-from sqlalchemy import select
 
 from app.db.session import SessionLocal
-from app.models.headline import Headline
-from app.models.mention import Mention
-from app.models.risk_score import RiskScore
 from app.ingest.news_fetcher import fetch_and_save
 from app.nlp.processor import process_headline
+from app.workers import lifecycle
+from app.workers.leader import LeaderLease
+from app.workers.trigger import EventTrigger, observe_score_latency
+from app.workers.claims import claim_headline_batch, new_outcome_tally, observe_batch, record_failure
 
 
 load_dotenv()
@@ -21,27 +21,15 @@ load_dotenv()
 logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
 logger = logging.getLogger("scheduler")
 
+# Threads that may run NLP concurrently: the event trigger and the processing job
+INFERENCE_THREADS = 2
 
-def _find_unprocessed_headline_ids(limit: int = 100) -> List[int]:
-    """Return headline ids that have no mentions and no risk_scores yet."""
-    with SessionLocal() as db:
-        q = (
-            select(Headline.id)
-            .outerjoin(Mention, Mention.headline_id == Headline.id)
-            .outerjoin(RiskScore, RiskScore.headline_id == Headline.id)
-            .where(Mention.id.is_(None), RiskScore.id.is_(None))  # type: ignore
-            .order_by(Headline.id.desc())
-            .limit(limit)
-        )
-        rows = db.execute(q).scalars().all()
-        return list(rows)
 
-
-def job_ingest_and_process() -> None:
-    """Periodic job: fetch + save headlines, then process any unprocessed ones."""
-    logger.info("job start: ingest and process")
-
-    # Ingest
+def job_ingest(lease: Optional[LeaderLease] = None) -> None:
+    """Fetch + save headlines. With a lease, only the current leader replica fetches."""
+    if lease is not None and not lease.is_leader:
+        logger.info("standby replica: skipping ingest")
+        return
     try:
         with SessionLocal() as db:
             inserted = fetch_and_save(db)
@@ -49,21 +37,43 @@ def job_ingest_and_process() -> None:
     except Exception as exc:
         logger.exception("ingest error: %s", exc)
 
-    # Process unprocessed
+
+def job_process() -> None:
+    """Sweep up unprocessed headlines; safe on every replica since work is claimed.
+
+    New inserts are normally scored right away by the event trigger; the sweep catches the rest.
+    """
     try:
-        ids = _find_unprocessed_headline_ids(limit=100)
-        if not ids:
-            logger.info("no unprocessed headlines found")
-            return
-        logger.info("processing %d headlines", len(ids))
         with SessionLocal() as db:
+            ids = claim_headline_batch(db, limit=100)
+            if not ids:
+                logger.info("no unprocessed headlines found")
+                return
+            logger.info("processing %d headlines", len(ids))
+            outcomes = new_outcome_tally()
+            done = []
             for hid in ids:
                 try:
-                    process_headline(db, hid)
-                except Exception:
+                    outcomes[process_headline(db, hid)["status"]] += 1
+                    done.append(hid)
+                except Exception as exc:
                     logger.exception("failed processing headline_id=%s", hid)
+                    db.rollback()
+                    for status in record_failure(db, [hid], repr(exc)).values():
+                        outcomes[status] += 1
+            observe_batch(outcomes)
+            observe_score_latency(db, done, "sweep")
     except Exception as exc:
         logger.exception("processing phase error: %s", exc)
+    finally:
+        lifecycle.report_rss("scheduler")
+
+
+def job_ingest_and_process(lease: Optional[LeaderLease] = None) -> None:
+    """Periodic job: ingest (leader only), then sweep up any unprocessed headlines."""
+    logger.info("job start: ingest and process")
+    job_ingest(lease)
+    job_process()
 
 
 def main() -> None:
@@ -71,8 +81,22 @@ def main() -> None:
     if not os.getenv("DATABASE_URL"):
         raise RuntimeError("DATABASE_URL is required")
 
+    # NLP runs on two threads at once: the event trigger and the sweep job (max_instances=1)
+    lifecycle.init_process(concurrency=INFERENCE_THREADS, role="scheduler")
+
+    trigger = EventTrigger().start()
+
+    # Every replica processes; only the lease holder ingests, so feeds are fetched once
+    lease = LeaderLease("ingest")
+    lease.try_acquire()
+
     scheduler = BackgroundScheduler()
-    scheduler.add_job(job_ingest_and_process, "interval", minutes=5, id="ingest_process_5m", max_instances=1)
+    scheduler.add_job(
+        lease.try_acquire, "interval", seconds=lease.renew_interval_s, id="leader_lease", max_instances=1
+    )
+    scheduler.add_job(
+        job_ingest_and_process, "interval", minutes=5, id="ingest_process_5m", max_instances=1, args=[lease]
+    )
     scheduler.start()
 
     logger.info("APScheduler started. Running every 5 minutes. Press Ctrl+C to exit.")
@@ -83,6 +107,8 @@ def main() -> None:
     except (KeyboardInterrupt, SystemExit):
         logger.info("shutting down scheduler...")
         scheduler.shutdown()
+        trigger.stop()
+        lease.release()
 
 
 if __name__ == "__main__":
@@ -1,17 +1,24 @@
 import os
+import time
 import logging
-from typing import List
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
 
 from dotenv import load_dotenv
-from celery import Celery
-from sqlalchemy import select
+from celery import Celery, chord, group, signals
+from kombu import Queue
 
 from app.db.session import SessionLocal
-from app.models.headline import Headline
-from app.models.mention import Mention
-from app.models.risk_score import RiskScore
 from app.ingest.news_fetcher import fetch_and_save
-from app.nlp.processor import process_headline
+from app.nlp.processor import process_headline, process_headlines
+from app.workers import fanout, lifecycle
+from app.workers.claims import (
+    claim_headline_batch,
+    new_outcome_tally,
+    observe_batch,
+    record_failure,
+    renew_claims,
+)
 
 
 load_dotenv()
@@ -29,19 +36,56 @@ celery_app = Celery(
     backend=REDIS_URL,
 )
 
+# Batches mentioning watchlisted tickers go to `nlp_high`; run dedicated workers for it, e.g.
+#   celery -A app.workers.tasks.celery_app worker -Q nlp_high,nlp
+#   celery -A app.workers.tasks.celery_app worker -Q nlp
+celery_app.conf.task_default_queue = "celery"
+celery_app.conf.task_queues = (
+    Queue("celery"),
+    Queue(fanout.QUEUE_HIGH),
+    Queue(fanout.QUEUE_DEFAULT),
+)
+celery_app.conf.task_routes = {
+    "nlp.process_batch": {"queue": fanout.QUEUE_DEFAULT},
+    "nlp.process_headlines": {"queue": fanout.QUEUE_DEFAULT},
+}
+# Hand out one batch at a time so a long batch never hides others in a worker's prefetch buffer
+celery_app.conf.worker_prefetch_multiplier = 1
+celery_app.conf.task_acks_late = True
+
+if os.getenv("CELERY_CONCURRENCY"):
+    celery_app.conf.worker_concurrency = int(os.environ["CELERY_CONCURRENCY"])
+
+RSS_REPORT_EVERY = int(os.getenv("NLP_RSS_REPORT_EVERY", "100"))
+_worker_concurrency = 1
+_tasks_run = 0
+
+
+@signals.worker_init.connect
+def _on_worker_init(sender=None, **_: Any) -> None:
+    """Parent process, before forking children: optionally load models to share them copy-on-write."""
+    global _worker_concurrency
+    _worker_concurrency = int(getattr(sender, "concurrency", None) or os.cpu_count() or 1)
+    if lifecycle.preload_mode() == "parent":
+        lifecycle.init_process(_worker_concurrency, role="celery-parent")
 
-def _find_unprocessed_headline_ids(limit: int = 100) -> List[int]:
-    with SessionLocal() as db:
-        q = (
-            select(Headline.id)
-            .outerjoin(Mention, Mention.headline_id == Headline.id)
-            .outerjoin(RiskScore, RiskScore.headline_id == Headline.id)
-            .where(Mention.id.is_(None), RiskScore.id.is_(None))  # type: ignore
-            .order_by(Headline.id.desc())
-            .limit(limit)
-        )
-        rows = db.execute(q).scalars().all()
-        return list(rows)
+
+@signals.worker_process_init.connect
+def _on_worker_process_init(**_: Any) -> None:
+    lifecycle.init_process(
+        _worker_concurrency, role="celery-child", load=lifecycle.preload_mode() == "child"
+    )
+
+
+@signals.task_postrun.connect
+def _on_task_postrun(**_: Any) -> None:
+    global _tasks_run
+    _tasks_run += 1
+    lifecycle.report_rss("celery-child", log=_tasks_run % RSS_REPORT_EVERY == 0)
+
+
+DISPATCH_LIMIT = int(os.getenv("NLP_DISPATCH_LIMIT", "1000"))
+DISPATCH_BATCH_SIZE = int(os.getenv("NLP_DISPATCH_BATCH_SIZE", "50"))
 
 
 @celery_app.task(name="ingest.fetch_and_save")
@@ -58,19 +102,127 @@ def task_ingest() -> int:
 def task_process_unprocessed(limit: int = 100) -> int:
     if not os.getenv("DATABASE_URL"):
         raise RuntimeError("DATABASE_URL is required")
-    ids = _find_unprocessed_headline_ids(limit=limit)
     processed = 0
+    outcomes = new_outcome_tally()
     with SessionLocal() as db:
+        ids = claim_headline_batch(db, limit=limit)
         for hid in ids:
             try:
-                process_headline(db, hid)
+                outcomes[process_headline(db, hid)["status"]] += 1
                 processed += 1
-            except Exception:
+            except Exception as exc:
                 logger.exception("celery failed processing headline_id=%s", hid)
+                db.rollback()
+                for status in record_failure(db, [hid], repr(exc)).values():
+                    outcomes[status] += 1
+    observe_batch(outcomes)
     logger.info("celery processed %d headlines", processed)
     return processed
 
 
+@celery_app.task(name="nlp.process_headlines")
+def task_process_headlines(headline_ids: List[int], claimed_at: Optional[str] = None) -> int:
+    """Process an explicit list of headline ids (e.g. pushed via /v1/headlines/bulk) in one batch.
+
+    With a `claimed_at` claim token, only ids still claimed under it are processed.
+    """
+    if not os.getenv("DATABASE_URL"):
+        raise RuntimeError("DATABASE_URL is required")
+    headline_ids = [int(h) for h in headline_ids]
+    with SessionLocal() as db:
+        if claimed_at is not None:
+            headline_ids = renew_claims(db, headline_ids, datetime.fromisoformat(claimed_at))
+        try:
+            results = process_headlines(db, headline_ids)
+        except Exception as exc:
+            logger.exception("celery failed processing %d pushed headlines", len(headline_ids))
+            db.rollback()
+            record_failure(db, headline_ids, repr(exc))
+            raise
+    logger.info("celery processed %d pushed headlines", len(results))
+    return len(results)
+
+
+@celery_app.task(name="nlp.process_batch")
+def task_process_batch(headline_ids: List[int], claimed_at: Optional[str] = None) -> Dict[str, int]:
+    """Process one dispatched batch of already-claimed ids; returns its outcome tally.
+
+    `claimed_at` is the dispatcher's claim token (ISO timestamp). Only ids still claimed under it
+    are processed: a batch that sat in the queue past CLAIM_TIMEOUT_SECONDS may have lost some
+    rows to a sweep, which now owns them.
+    """
+    if not os.getenv("DATABASE_URL"):
+        raise RuntimeError("DATABASE_URL is required")
+    ids = [int(h) for h in headline_ids]
+    with SessionLocal() as db:
+        if claimed_at is not None:
+            owned = renew_claims(db, ids, datetime.fromisoformat(claimed_at))
+            if len(owned) < len(ids):
+                logger.warning("skipping %d of %d headlines re-claimed since dispatch", len(ids) - len(owned), len(ids))
+            ids = owned
+        if not ids:
+            return fanout.tally_results([], {})
+        try:
+            results = process_headlines(db, ids)
+            failed: Dict[int, str] = {}
+        except Exception as exc:
+            logger.exception("celery batch failed (%d headlines)", len(ids))
+            db.rollback()
+            results = []
+            failed = record_failure(db, ids, repr(exc))
+    return fanout.tally_results(results, failed)
+
+
+@celery_app.task(name="nlp.summarize_batches")
+def task_summarize_batches(tallies: List[Dict[str, int]], started_at: Optional[float] = None) -> Dict[str, Any]:
+    """Chord callback: fold per-batch tallies into one summary for the dispatched backlog."""
+    outcomes = fanout.merge_tallies(tallies)
+    wasted_ratio = observe_batch(outcomes)
+    summary: Dict[str, Any] = {
+        "batches": len(tallies),
+        "headlines": sum(outcomes.values()),
+        "outcomes": outcomes,
+        "wasted_ratio": round(wasted_ratio, 4),
+    }
+    if started_at is not None:
+        summary["drain_seconds"] = round(time.time() - started_at, 3)
+    logger.info("celery backlog summary %s", summary)
+    return summary
+
+
+@celery_app.task(name="nlp.dispatch_backlog")
+def task_dispatch_backlog(limit: Optional[int] = None, batch_size: Optional[int] = None) -> Dict[str, int]:
+    """Claim up to `limit` headlines and fan them out as batch tasks across the worker fleet.
+
+    Watchlist batches are routed to the high-priority queue. Returns the number of batches sent
+    per queue; the aggregate outcome summary is produced by `nlp.summarize_batches`.
+    """
+    if not os.getenv("DATABASE_URL"):
+        raise RuntimeError("DATABASE_URL is required")
+    limit = limit or DISPATCH_LIMIT
+    batch_size = batch_size or DISPATCH_BATCH_SIZE
+    token = datetime.now(timezone.utc)
+    with SessionLocal() as db:
+        ids = claim_headline_batch(db, limit=limit, claimed_at=token)
+        high, normal = fanout.partition_by_watchlist(db, ids)
+    if not ids:
+        return {fanout.QUEUE_HIGH: 0, fanout.QUEUE_DEFAULT: 0}
+
+    high_batches = fanout.chunk_ids(high, batch_size)
+    normal_batches = fanout.chunk_ids(normal, batch_size)
+    claim = {"claimed_at": token.isoformat()}
+    header = group(
+        [task_process_batch.signature((b,), kwargs=claim, queue=fanout.QUEUE_HIGH) for b in high_batches]
+        + [task_process_batch.signature((b,), kwargs=claim, queue=fanout.QUEUE_DEFAULT) for b in normal_batches]
+    )
+    chord(header)(task_summarize_batches.s(started_at=time.time()))
+    logger.info(
+        "dispatched %d headlines: %d high-priority and %d normal batches",
+        len(ids), len(high_batches), len(normal_batches),
+    )
+    return {fanout.QUEUE_HIGH: len(high_batches), fanout.QUEUE_DEFAULT: len(normal_batches)}
+
+
 # Optional beat schedule example (if using celery beat in future):
 # from celery.schedules import crontab
 # celery_app.conf.beat_schedule = {
@@ -78,10 +230,8 @@ def task_process_unprocessed(limit: int = 100) -> int:
 #         "task": "ingest.fetch_and_save",
 #         "schedule": 300.0,  # seconds
 #     },
-#     "process-unprocessed-every-5-min": {
-#         "task": "nlp.process_unprocessed",
+#     "dispatch-backlog-every-5-min": {
+#         "task": "nlp.dispatch_backlog",
 #         "schedule": 300.0,
 #     },
 # }
-
-
@@ -0,0 +1,147 @@
+"""Event-driven processing: score headlines as soon as their insert is announced.
+
+A consumer thread waits on `app.ingest.events`, claims the announced ids that are still pending
+and scores them in small batches. The periodic sweep in the scheduler stays as a fallback for
+missed notifications, failures that are due for a retry and headlines inserted with events off.
+Headline-to-score latency (insert → scores committed) is exported per trigger.
+
+    python -m app.workers.trigger      # standalone consumer (Postgres/Redis backends)
+"""
+
+import logging
+import os
+import threading
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+from dotenv import load_dotenv
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.db.session import SessionLocal, engine
+from app.ingest import events
+from app.models.headline import Headline
+from app.nlp.processor import process_headlines
+from app.utils import metrics
+from app.workers import claims, fanout
+
+
+logger = logging.getLogger("event-trigger")
+
+
+_score_latency_seconds = metrics.histogram(
+    "headline_to_score_seconds",
+    "Seconds from headline insert to committed scores, by what triggered processing",
+    ["trigger"],
+    buckets=(0.1, 0.25, 0.5, 1, 2, 5, 10, 30, 60, 120, 300, 600),
+)
+
+
+def _as_utc(ts: datetime) -> datetime:
+    # SQLite returns naive UTC timestamps for server_default=now()
+    return ts.replace(tzinfo=timezone.utc) if ts.tzinfo is None else ts
+
+
+def observe_score_latency(db: Session, headline_ids: List[int], trigger: str) -> List[float]:
+    """Record insert-to-score latency for processed ids; returns the observed seconds."""
+    if not headline_ids:
+        return []
+    now = datetime.now(timezone.utc)
+    created = db.execute(select(Headline.created_at).where(Headline.id.in_(headline_ids))).scalars().all()
+    latencies = [max(0.0, (now - _as_utc(ts)).total_seconds()) for ts in created if ts is not None]
+    for seconds in latencies:
+        _score_latency_seconds.labels(trigger).observe(seconds)
+    return latencies
+
+
+def process_event_batch(
+    headline_ids: List[int], session_factory: Callable[[], Session] = SessionLocal
+) -> Dict[str, Any]:
+    """Claim and score announced ids that nobody else owns yet."""
+    with session_factory() as db:
+        ids = claims.claim_ids(db, headline_ids)
+        if not ids:
+            return {"claimed": 0}
+        try:
+            results = process_headlines(db, ids)
+            failed: Dict[int, str] = {}
+        except Exception as exc:
+            logger.exception("event batch failed (%d headlines)", len(ids))
+            db.rollback()
+            results = []
+            failed = claims.record_failure(db, ids, repr(exc))
+        latencies = observe_score_latency(db, [r["headline_id"] for r in results], "event")
+    claims.observe_batch(fanout.tally_results(results, failed))
+    if latencies:
+        logger.info(
+            "event batch scored=%d latency max=%.2fs mean=%.2fs",
+            len(latencies), max(latencies), sum(latencies) / len(latencies),
+        )
+    return {"claimed": len(ids), "processed": len(results), "failed": len(failed)}
+
+
+class EventTrigger:
+    def __init__(
+        self,
+        subscriber: Optional[events.Subscriber] = None,
+        batch_size: Optional[int] = None,
+        linger_s: Optional[float] = None,
+        poll_timeout_s: float = 1.0,
+    ) -> None:
+        self.subscriber = subscriber or events.subscribe(engine)
+        self.batch_size = batch_size or int(os.getenv("NLP_EVENT_BATCH_SIZE", "16"))
+        self.linger_s = linger_s if linger_s is not None else float(os.getenv("NLP_EVENT_LINGER_SECONDS", "0.05"))
+        self.poll_timeout_s = poll_timeout_s
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def run_once(self, timeout_s: Optional[float] = None) -> int:
+        """Wait for one batch of announced ids and process it; returns the number of ids received."""
+        if self.subscriber is None:
+            return 0
+        ids = self.subscriber.get(
+            self.poll_timeout_s if timeout_s is None else timeout_s, self.batch_size, self.linger_s
+        )
+        if ids:
+            process_event_batch(list(dict.fromkeys(ids)))
+        return len(ids)
+
+    def run_forever(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.run_once()
+            except Exception:
+                logger.exception("event trigger iteration failed")
+                self._stop.wait(self.poll_timeout_s)
+
+    def start(self) -> "EventTrigger":
+        if self.subscriber is None:
+            logger.info("headline events disabled; relying on the polling sweep")
+            return self
+        self._thread = threading.Thread(target=self.run_forever, name="event-trigger", daemon=True)
+        self._thread.start()
+        logger.info("event trigger started backend=%s", events.backend_name(engine))
+        return self
+
+    def stop(self, timeout_s: float = 5.0) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout_s)
+        if self.subscriber is not None:
+            self.subscriber.close()
+
+
+def main() -> None:
+    load_dotenv()
+    if not os.getenv("DATABASE_URL"):
+        raise RuntimeError("DATABASE_URL is required")
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    trigger = EventTrigger()
+    try:
+        trigger.run_forever()
+    except KeyboardInterrupt:
+        trigger.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+"""Benchmark `GET /v1/search` against an `ILIKE` scan on a large synthetic headline table.
+
+Fills the database with N generated headlines (the full-text index is maintained by the insert
+itself, as in production), then reports p50/p95 latency for the first page and for a page deep
+in the result set, next to the equivalent case-insensitive LIKE query.
+
+Usage:
+
+    cd backend
+    # SQLite FTS5 in a scratch file
+    python scripts/bench_search.py --rows 1000000 --database-url sqlite:////tmp/search_bench.db
+    # Postgres GIN (use a scratch database: the headlines table is filled with generated rows)
+    python scripts/bench_search.py --rows 1000000 --database-url postgresql+psycopg2://u:p@host/bench
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import random
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict, List
+
+_COMPANIES = ["Apple", "Microsoft", "Nvidia", "Tesla", "Amazon", "Alphabet", "Meta", "Intel", "Boeing", "Pfizer"]
+_VERBS = ["surges", "slumps", "beats", "misses", "raises", "cuts", "recalls", "acquires", "settles", "expands"]
+_OBJECTS = [
+    "earnings estimates", "revenue guidance", "dividend", "workforce", "chip supply", "buyback plan",
+    "antitrust probe", "cloud unit", "debt offering", "factory output", "battery recall", "merger talks",
+]
+_QUERIES = ["earnings", "antitrust probe", "battery recall", "Nvidia chip supply", "merger"]
+
+
+def _fill(engine: Any, rows: int, chunk: int = 20000) -> None:
+    from sqlalchemy import insert
+
+    from app.models.headline import Headline
+
+    rng = random.Random(7)
+    base = datetime(2020, 1, 1)
+    with engine.begin() as conn:
+        for start in range(0, rows, chunk):
+            batch: List[Dict[str, Any]] = []
+            for i in range(start, min(rows, start + chunk)):
+                title = f"{rng.choice(_COMPANIES)} {rng.choice(_VERBS)} {rng.choice(_OBJECTS)} #{i}"
+                batch.append({"title": title, "source": "bench", "published_at": base + timedelta(minutes=i)})
+            conn.execute(insert(Headline), batch)
+
+
+def _percentiles(samples: List[float]) -> Dict[str, float]:
+    ordered = sorted(samples)
+    return {
+        "p50_ms": round(statistics.median(ordered) * 1000, 2),
+        "p95_ms": round(ordered[int(0.95 * (len(ordered) - 1))] * 1000, 2),
+    }
+
+
+async def _bench_api(queries: List[str], repeats: int, depth: int) -> Dict[str, Any]:
+    from httpx import ASGITransport, AsyncClient
+
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+
+    from app.main import app
+
+    first: List[float] = []
+    deep: List[float] = []
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://bench") as ac:
+        for _ in range(repeats):
+            for q in queries:
+                t0 = time.perf_counter()
+                body = (await ac.get("/v1/search", params={"q": q, "limit": 20})).json()
+                first.append(time.perf_counter() - t0)
+                for _ in range(depth):
+                    if not body.get("next_cursor"):
+                        break
+                    t0 = time.perf_counter()
+                    body = (
+                        await ac.get("/v1/search", params={"q": q, "limit": 20, "cursor": body["next_cursor"]})
+                    ).json()
+                deep.append(time.perf_counter() - t0)
+    return {"first_page": _percentiles(first), f"page_{depth + 1}": _percentiles(deep)}
+
+
+def _bench_ilike(engine: Any, queries: List[str], repeats: int) -> Dict[str, float]:
+    from sqlalchemy import select
+
+    from app.models.headline import Headline
+
+    samples: List[float] = []
+    with engine.connect() as conn:
+        for _ in range(repeats):
+            for q in queries:
+                t0 = time.perf_counter()
+                conn.execute(
+                    select(Headline.id)
+                    .where(Headline.title.ilike(f"%{q}%"))
+                    .order_by(Headline.id.desc())
+                    .limit(20)
+                ).all()
+                samples.append(time.perf_counter() - t0)
+    return _percentiles(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark full-text headline search")
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--database-url", default="sqlite:////tmp/search_bench.db")
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--depth", type=int, default=20, help="Pages to follow for the deep-page timing")
+    parser.add_argument("--reuse", action="store_true", help="Keep existing rows instead of rebuilding")
+    args = parser.parse_args()
+
+    backend_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+    if backend_dir not in sys.path:
+        sys.path.insert(0, backend_dir)
+    os.environ["DATABASE_URL"] = args.database_url
+    # Time the index, not the threadpool hop or a second engine
+    os.environ.setdefault("DB_ASYNC", "0")
+
+    from app.db.base import Base  # type: ignore
+    from app.db.session import engine  # type: ignore
+
+    if not args.reuse:
+        Base.metadata.drop_all(engine)
+        Base.metadata.create_all(engine)
+        t0 = time.perf_counter()
+        _fill(engine, args.rows)
+        print(json.dumps({"rows": args.rows, "fill_s": round(time.perf_counter() - t0, 1)}))
+
+    report = {
+        "dialect": engine.dialect.name,
+        "search": asyncio.run(_bench_api(_QUERIES, args.repeats, args.depth)),
+        "ilike_first_page": _bench_ilike(engine, _QUERIES, args.repeats),
+    }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""Evaluate the lexicon → transformer sentiment cascade on a labeled sample.
+
+For each confidence threshold, reports the escalation rate (share of headlines sent to the
+transformer), accuracy against the labels, agreement with transformer-only scoring and the
+estimated scoring time, so a threshold can be picked that trades a little accuracy for
+throughput.
+
+Usage:
+
+    cd backend
+    python scripts/eval_cascade.py --data scripts/data/labeled_headlines.csv --thresholds 0.3,0.5,0.6,0.7,0.9
+"""
+
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+from typing import Dict, List
+
+
+def _label(score: float, neutral_band: float) -> str:
+    if score > neutral_band:
+        return "positive"
+    if score < -neutral_band:
+        return "negative"
+    return "neutral"
+
+
+def main() -> None:
+    backend_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+    if backend_dir not in sys.path:
+        sys.path.insert(0, backend_dir)
+    os.environ.setdefault("DATABASE_URL", "sqlite+pysqlite:///:memory:")
+
+    from app.nlp import processor  # type: ignore
+    from app.nlp.lexicon import lexicon_sentiment  # type: ignore
+
+    parser = argparse.ArgumentParser(description="Evaluate the sentiment cascade on labeled headlines")
+    parser.add_argument("--data", default=os.path.join(backend_dir, "scripts", "data", "labeled_headlines.csv"))
+    parser.add_argument("--thresholds", default="0.3,0.5,0.6,0.7,0.8,0.9")
+    parser.add_argument("--neutral-band", type=float, default=0.2, help="|score| at or below this counts as neutral")
+    parser.add_argument("--json", default=None, help="Also write the report to this path")
+    args = parser.parse_args()
+
+    with open(args.data, newline="", encoding="utf-8") as fh:
+        rows = [r for r in csv.DictReader(fh) if r.get("text")]
+    texts = [r["text"] for r in rows]
+    labels = [r["label"].strip().lower() for r in rows]
+
+    t0 = time.perf_counter()
+    lexicon = [lexicon_sentiment(t) for t in texts]
+    lexicon_s = (time.perf_counter() - t0) / max(1, len(texts))
+
+    t0 = time.perf_counter()
+    transformer = processor.sentiment_scores(texts)
+    transformer_s = (time.perf_counter() - t0) / max(1, len(texts))
+    transformer_labels = [_label(s, args.neutral_band) for s in transformer]
+    model_loaded = processor._get_sentiment_pipeline() is not None
+
+    report: List[Dict[str, float]] = []
+    baseline_acc = sum(p == y for p, y in zip(transformer_labels, labels)) / max(1, len(labels))
+    for raw in args.thresholds.split(","):
+        threshold = float(raw)
+        predicted: List[str] = []
+        escalated = 0
+        for (score, confidence), fallback in zip(lexicon, transformer):
+            if confidence >= threshold:
+                predicted.append(_label(score, args.neutral_band))
+            else:
+                escalated += 1
+                predicted.append(_label(fallback, args.neutral_band))
+        n = max(1, len(texts))
+        report.append(
+            {
+                "threshold": threshold,
+                "escalation_rate": round(escalated / n, 4),
+                "accuracy": round(sum(p == y for p, y in zip(predicted, labels)) / n, 4),
+                "agreement_with_transformer": round(
+                    sum(p == t for p, t in zip(predicted, transformer_labels)) / n, 4
+                ),
+                "est_ms_per_headline": round(1000 * (lexicon_s + transformer_s * escalated / n), 3),
+            }
+        )
+
+    print(f"{len(texts)} labeled headlines; transformer loaded: {model_loaded}")
+    print(f"transformer only: accuracy={baseline_acc:.3f} ms/headline={1000 * transformer_s:.3f}")
+    print(f"{'threshold':>9} {'escalated':>9} {'accuracy':>8} {'agree':>6} {'ms/headline':>11}")
+    for r in report:
+        print(
+            f"{r['threshold']:>9.2f} {r['escalation_rate']:>9.1%} {r['accuracy']:>8.3f} "
+            f"{r['agreement_with_transformer']:>6.3f} {r['est_ms_per_headline']:>11.3f}"
+        )
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as fh:
+            json.dump(
+                {"transformer_accuracy": baseline_acc, "transformer_loaded": model_loaded, "thresholds": report},
+                fh,
+                indent=2,
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+import asyncio
+import os
+import sys
+import time
+
+import pytest
+from httpx import AsyncClient, ASGITransport
+
+
+# Ensure backend package is importable and DB is in-memory for tests
+CURRENT_DIR = os.path.dirname(__file__)
+REPO_ROOT = os.path.abspath(os.path.join(CURRENT_DIR, "..", ".."))
+BACKEND_DIR = os.path.join(REPO_ROOT, "backend")
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
+
+os.environ["DATABASE_URL"] = "sqlite+pysqlite:///:memory:"
+
+from app.api.v1 import analyze  # noqa: E402
+from app.db.base import Base  # noqa: E402
+from app.db.session import engine  # noqa: E402
+from app.main import app  # noqa: E402
+from app.nlp import processor  # noqa: E402
+from app.utils.admission import AdmissionController, ConcurrencyLimiter, Overloaded, TokenBuckets  # noqa: E402
+
+
+def setup_function(_: object) -> None:
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+
+
+def test_token_bucket_allows_burst_then_refills() -> None:
+    buckets = TokenBuckets(rate=2.0, burst=2)
+    assert buckets.take("a", now=0.0) == 0.0
+    assert buckets.take("a", now=0.0) == 0.0
+    assert buckets.take("a", now=0.0) == pytest.approx(0.5)
+    # Another client has its own bucket
+    assert buckets.take("b", now=0.0) == 0.0
+    assert buckets.take("a", now=0.5) == 0.0
+    assert TokenBuckets(rate=0, burst=1).take("a") == 0.0
+
+
+@pytest.mark.asyncio
+async def test_limiter_queues_in_order_and_sheds_excess() -> None:
+    limiter = ConcurrencyLimiter(limit=1, max_queue=1, max_wait_s=1.0)
+    assert await limiter.acquire() == 0.0
+    waiter = asyncio.ensure_future(limiter.acquire())
+    await asyncio.sleep(0.01)
+    with pytest.raises(Overloaded) as exc:
+        await limiter.acquire()
+    assert exc.value.reason == "queue_full" and exc.value.retry_after_s > 0
+
+    limiter.release(0.05)
+    assert await waiter > 0
+    assert limiter.active == 1 and limiter.queued == 0
+    limiter.release(0.05)
+    assert limiter.active == 0
+
+
+@pytest.mark.asyncio
+async def test_limiter_times_out_and_forgets_cancelled_waiters() -> None:
+    limiter = ConcurrencyLimiter(limit=1, max_queue=4, max_wait_s=0.05)
+    await limiter.acquire()
+    with pytest.raises(Overloaded) as exc:
+        await limiter.acquire()
+    assert exc.value.reason == "queue_timeout"
+
+    limiter.max_wait_s = 5.0
+    waiter = asyncio.ensure_future(limiter.acquire())
+    await asyncio.sleep(0.01)
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    assert limiter.queued == 0
+    limiter.release()
+    assert limiter.active == 0
+
+
+@pytest.mark.asyncio
+async def test_analyze_returns_429_when_client_exceeds_rate(monkeypatch) -> None:
+    monkeypatch.setattr(analyze, "admission", AdmissionController("analyze", "ANALYZE", rate_per_s=0.5, burst=1))
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        assert (await ac.post("/v1/analyze", json={"text": "AAPL beats"})).status_code == 200
+        resp = await ac.post("/v1/analyze", json={"text": "AAPL beats"})
+    assert resp.status_code == 429
+    assert resp.headers["Retry-After"] == "2"
+
+
+@pytest.mark.asyncio
+async def test_analyze_sheds_load_with_503_when_queue_is_full(monkeypatch) -> None:
+    monkeypatch.setattr(
+        analyze, "admission", AdmissionController("analyze", "ANALYZE", max_concurrency=1, max_queue=1, rate_per_s=0)
+    )
+
+    def slow_sentiment(text: str) -> float:
+        time.sleep(0.2)
+        return -0.5
+
+    monkeypatch.setattr(processor, "sentiment_score", slow_sentiment)
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        responses = await asyncio.gather(*(ac.post("/v1/analyze", json={"text": "AAPL misses"}) for _ in range(4)))
+    codes = sorted(r.status_code for r in responses)
+    # One runs, one waits its turn, the rest are refused immediately
+    assert codes == [200, 200, 503, 503]
+    assert all(int(r.headers["Retry-After"]) >= 1 for r in responses if r.status_code == 503)
+    assert analyze.admission.limiter.active == 0
@@ -0,0 +1,228 @@
+import os
+import sys
+from datetime import datetime, timedelta
+
+import pytest
+from httpx import AsyncClient, ASGITransport
+
+
+# Ensure backend package is importable and DB is in-memory for tests
+CURRENT_DIR = os.path.dirname(__file__)
+REPO_ROOT = os.path.abspath(os.path.join(CURRENT_DIR, "..", ".."))
+BACKEND_DIR = os.path.join(REPO_ROOT, "backend")
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
+
+os.environ["DATABASE_URL"] = "sqlite+pysqlite:///:memory:"
+
+from app.db.base import Base  # noqa: E402
+from app.db.session import SessionLocal, engine  # noqa: E402
+from app.main import app  # noqa: E402
+from app.models.headline import Headline  # noqa: E402
+from app.models.mention import Mention  # noqa: E402
+from app.models.risk_score import RiskScore  # noqa: E402
+from app.models.ticker import Ticker  # noqa: E402
+from app.models.user import User  # noqa: E402
+from app.nlp import processor as p  # noqa: E402
+from app.utils.security import clear_user_cache, create_access_token  # noqa: E402
+
+
+def setup_function(_: object) -> None:
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    p._ticker_index_cache = {}
+    clear_user_cache()
+
+
+def _auth_headers(superuser: bool = True) -> dict:
+    with SessionLocal() as db:
+        user = User(email="producer@example.com", hashed_password="x", is_active=True, is_superuser=superuser)
+        db.add(user)
+        db.commit()
+        return {"Authorization": f"Bearer {create_access_token(user.id)}"}
+
+
+@pytest.mark.asyncio
+async def test_bulk_push_requires_auth() -> None:
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        resp = await ac.post("/v1/headlines/bulk", json={"items": [{"text": "x"}]})
+        assert resp.status_code in (401, 403)
+
+
+@pytest.mark.asyncio
+async def test_bulk_push_rejects_regular_users() -> None:
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        resp = await ac.post("/v1/headlines/bulk", json={"items": [{"text": "x"}]}, headers=_auth_headers(False))
+        assert resp.status_code == 403
+    with SessionLocal() as db:
+        assert db.query(Headline).count() == 0
+
+
+@pytest.mark.asyncio
+async def test_bulk_push_rejects_oversized_bodies_before_parsing() -> None:
+    from app.api.v1 import headlines as headlines_api
+
+    headers = {**_auth_headers(), "Content-Type": "application/json"}
+    body = b'{"items": [' + b"x" * headlines_api.BULK_MAX_BYTES + b"]}"
+
+    async def chunked():
+        for i in range(0, len(body), 64 * 1024):
+            yield body[i:i + 64 * 1024]
+
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        # Not even valid JSON: a 422/400 here would mean the body had been parsed
+        declared = await ac.post("/v1/headlines/bulk", content=body, headers=headers)
+        streamed = await ac.post("/v1/headlines/bulk", content=chunked(), headers=headers)
+    assert declared.status_code == 413 and "bytes" in declared.json()["detail"]
+    assert streamed.status_code == 413 and "bytes" in streamed.json()["detail"]
+
+
+@pytest.mark.asyncio
+async def test_bulk_push_dedupes_and_processes(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(p, "detect_entities", lambda text: ["AAPL"] if "AAPL" in text else [])
+    monkeypatch.setattr(p, "sentiment_scores", lambda texts: [-0.3 for _ in texts])
+    headers = _auth_headers()
+    with SessionLocal() as db:
+        db.add(Ticker(symbol="AAPL", name="Apple Inc."))
+        db.commit()
+
+    payload = {
+        "process": True,
+        "items": [
+            {"text": "AAPL plunges after earnings miss", "url": "https://example.com/1",
+             "published_at": "2025-10-02T12:00:00Z"},
+            {"text": "AAPL plunges after earnings miss", "url": "https://example.com/2"},
+            {"text": "Oil steady", "url": "https://example.com/1"},
+            {"text": "Fed holds rates", "source": "Wire"},
+        ],
+    }
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        resp = await ac.post("/v1/headlines/bulk", json=payload, headers=headers)
+        assert resp.status_code == 202
+        data = resp.json()
+        assert data["received"] == 4
+        assert data["inserted"] == 2
+        assert data["duplicates"] == 2
+        assert data["queued"] is True
+
+        again = await ac.post("/v1/headlines/bulk", json=payload, headers=headers)
+        assert again.json()["inserted"] == 0
+        assert again.json()["queued"] is False
+
+    with SessionLocal() as db:
+        assert [h.id for h in db.query(Headline).order_by(Headline.id).all()] == data["ids"]
+        scores = db.query(RiskScore).all()
+        assert len(scores) == 1 and scores[0].sentiment == -0.3
+
+
+def _seed_feed() -> None:
+    base = datetime(2026, 10, 1, 12, 0, 0)
+    with SessionLocal() as db:
+        aapl = Ticker(symbol="AAPL", name="Apple Inc.")
+        db.add(aapl)
+        db.flush()
+        for i in range(25):
+            # Pairs share a timestamp so the id tiebreak is exercised
+            h = Headline(
+                title=f"headline {i}",
+                source="wire" if i % 2 else "blog",
+                published_at=base + timedelta(minutes=i // 2),
+            )
+            db.add(h)
+            db.flush()
+            if i % 3 == 0:
+                db.add(Mention(headline_id=h.id, ticker_id=aapl.id))
+                db.add(RiskScore(ticker_id=aapl.id, headline_id=h.id, sentiment=-0.5, urgency=0.2, composite=float(i)))
+        db.add_all([Headline(title=f"undated {i}", source="wire") for i in range(3)])
+        db.commit()
+
+
+async def _walk_feed(ac: AsyncClient, params: dict) -> list:
+    items, cursor = [], None
+    while True:
+        resp = await ac.get("/v1/headlines", params={**params, **({"cursor": cursor} if cursor else {})})
+        assert resp.status_code == 200
+        body = resp.json()
+        items.extend(body["items"])
+        cursor = body["next_cursor"]
+        if cursor is None:
+            return items
+
+
+@pytest.mark.asyncio
+async def test_feed_pages_through_every_headline_once() -> None:
+    _seed_feed()
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        items = await _walk_feed(ac, {"limit": 4})
+    titles = [i["title"] for i in items]
+    assert len(titles) == len(set(titles)) == 28
+    # Newest first, ties broken by id, undated headlines last
+    assert titles[:3] == ["headline 24", "headline 23", "headline 22"]
+    assert titles[-3:] == ["undated 2", "undated 1", "undated 0"]
+    scored = next(i for i in items if i["title"] == "headline 24")
+    assert scored["scores"] == [
+        {"ticker": "AAPL", "sentiment": -0.5, "urgency": 0.2, "risk_percent": 24.0, "model": "finbert"}
+    ]
+
+
+@pytest.mark.asyncio
+async def test_feed_filters_by_ticker_source_and_min_risk() -> None:
+    _seed_feed()
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        by_ticker = await _walk_feed(ac, {"ticker": "aapl", "limit": 3})
+        by_source = await _walk_feed(ac, {"source": "blog", "limit": 5})
+        risky = await _walk_feed(ac, {"ticker": "AAPL", "min_risk": 12, "limit": 2})
+        unknown = await _walk_feed(ac, {"ticker": "ZZZZ"})
+        bad = await ac.get("/v1/headlines", params={"cursor": "not-a-cursor"})
+    assert [i["title"] for i in by_ticker] == [f"headline {i}" for i in (24, 21, 18, 15, 12, 9, 6, 3, 0)]
+    assert len(by_source) == 13 and all(i["source"] == "blog" for i in by_source)
+    assert [i["title"] for i in risky] == ["headline 24", "headline 21", "headline 18", "headline 15", "headline 12"]
+    assert unknown == []
+    assert bad.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_bulk_push_processes_only_ids_it_claims(monkeypatch: pytest.MonkeyPatch) -> None:
+    from app.api.v1 import headlines as headlines_api
+    from app.workers.claims import claim_ids
+
+    processed: list = []
+    monkeypatch.setattr(p, "process_headlines", lambda db, ids: processed.extend(ids) or [])
+
+    def insert_then_race(db, items):
+        ids = real_insert(db, items)
+        # The event trigger claims the first announced id before the producer does
+        claim_ids(db, ids[:1])
+        return ids
+
+    real_insert = headlines_api.insert_headlines
+    monkeypatch.setattr(headlines_api, "insert_headlines", insert_then_race)
+    payload = {"process": True, "items": [{"text": "first"}, {"text": "second"}, {"text": "third"}]}
+    headers = _auth_headers()
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        resp = await ac.post("/v1/headlines/bulk", json=payload, headers=headers)
+    ids = resp.json()["ids"]
+    assert sorted(processed) == sorted(ids[1:])
+    assert resp.json()["queued"] is True
+
+    # Nothing claimed, nothing queued
+    def insert_all_claimed(db, items):
+        ids = real_insert(db, items)
+        claim_ids(db, ids)
+        return ids
+
+    monkeypatch.setattr(headlines_api, "insert_headlines", insert_all_claimed)
+    processed.clear()
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        resp = await ac.post(
+            "/v1/headlines/bulk", json={"process": True, "items": [{"text": "fourth"}]}, headers=headers
+        )
+    assert resp.json()["inserted"] == 1 and resp.json()["queued"] is False
+    assert processed == []
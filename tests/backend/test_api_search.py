@@ -0,0 +1,117 @@
+import os
+import sys
+from datetime import datetime, timedelta
+
+import pytest
+from httpx import AsyncClient, ASGITransport
+from sqlalchemy import text
+
+
+# Ensure backend package is importable and DB is in-memory for tests
+CURRENT_DIR = os.path.dirname(__file__)
+REPO_ROOT = os.path.abspath(os.path.join(CURRENT_DIR, "..", ".."))
+BACKEND_DIR = os.path.join(REPO_ROOT, "backend")
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
+
+os.environ["DATABASE_URL"] = "sqlite+pysqlite:///:memory:"
+
+from app.db.base import Base  # noqa: E402
+from app.db.session import SessionLocal, engine  # noqa: E402
+from app.ingest.news_fetcher import insert_headlines  # noqa: E402
+from app.main import app  # noqa: E402
+from app.models.mention import Mention  # noqa: E402
+from app.models.ticker import Ticker  # noqa: E402
+from app.api.v1 import search  # noqa: E402
+
+
+def setup_function(_: object) -> None:
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+
+
+def _seed() -> list:
+    base = datetime(2026, 10, 1)
+    titles = [
+        "Apple shares surge after earnings beat",
+        "Apple recalls chargers",
+        "Microsoft earnings beat estimates; earnings growth strong",
+        "Oil prices slump",
+        "Earnings season: banks report",
+    ]
+    with SessionLocal() as db:
+        ids = insert_headlines(
+            db, [{"text": t, "published_at": base + timedelta(days=i)} for i, t in enumerate(titles)]
+        )
+        aapl = Ticker(symbol="AAPL", name="Apple Inc.")
+        db.add(aapl)
+        db.flush()
+        db.add_all([Mention(headline_id=ids[0], ticker_id=aapl.id), Mention(headline_id=ids[1], ticker_id=aapl.id)])
+        db.commit()
+    return ids
+
+
+async def _search(params: dict) -> dict:
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        resp = await ac.get("/v1/search", params=params)
+    assert resp.status_code == 200, resp.text
+    return resp.json()
+
+
+@pytest.mark.asyncio
+async def test_search_ranks_stemmed_matches() -> None:
+    _seed()
+    body = await _search({"q": "earning"})
+    titles = [i["title"] for i in body["items"]]
+    # Porter stemming matches "earnings"; the title that repeats it ranks first
+    assert titles[0] == "Microsoft earnings beat estimates; earnings growth strong"
+    assert set(titles) == {
+        "Apple shares surge after earnings beat",
+        "Microsoft earnings beat estimates; earnings growth strong",
+        "Earnings season: banks report",
+    }
+    ranks = [i["rank"] for i in body["items"]]
+    assert ranks == sorted(ranks, reverse=True)
+
+
+@pytest.mark.asyncio
+async def test_search_filters_and_paginates() -> None:
+    _seed()
+    by_ticker = await _search({"q": "apple", "ticker": "AAPL"})
+    assert {i["title"] for i in by_ticker["items"]} == {
+        "Apple shares surge after earnings beat",
+        "Apple recalls chargers",
+    }
+    dated = await _search({"q": "earnings", "since": "2026-10-02T00:00:00", "until": "2026-10-04T00:00:00"})
+    assert [i["title"] for i in dated["items"]] == ["Microsoft earnings beat estimates; earnings growth strong"]
+
+    first = await _search({"q": "earnings", "limit": 2})
+    assert first["next_cursor"]
+    rest = await _search({"q": "earnings", "limit": 2, "cursor": first["next_cursor"]})
+    assert rest["next_cursor"] is None
+    paged = [i["id"] for i in first["items"] + rest["items"]]
+    whole = [i["id"] for i in (await _search({"q": "earnings"}))["items"]]
+    assert paged == whole
+
+
+@pytest.mark.asyncio
+async def test_search_index_follows_updates_and_operators_are_literal() -> None:
+    ids = _seed()
+    with SessionLocal() as db:
+        db.execute(text("UPDATE headlines SET title = 'Oil prices rebound' WHERE id = :id"), {"id": ids[3]})
+        db.execute(text("DELETE FROM headlines WHERE id = :id"), {"id": ids[1]})
+        db.commit()
+    assert [i["title"] for i in (await _search({"q": "rebound"}))["items"]] == ["Oil prices rebound"]
+    assert (await _search({"q": "slump"}))["items"] == []
+    assert (await _search({"q": "recalls"}))["items"] == []
+    # FTS5 syntax in user input is matched as words, not parsed
+    assert (await _search({"q": 'apple" OR NOT*'}))["items"] == []
+
+
+@pytest.mark.asyncio
+async def test_search_ranks_only_newest_candidates(monkeypatch: pytest.MonkeyPatch) -> None:
+    ids = _seed()
+    monkeypatch.setattr(search, "SEARCH_CANDIDATES", 2)
+    body = await _search({"q": "earnings"})
+    assert {i["id"] for i in body["items"]} == {ids[2], ids[4]}
@@ -0,0 +1,119 @@
+import os
+import sys
+import time
+
+import pytest
+from httpx import AsyncClient, ASGITransport
+from sqlalchemy import event
+
+
+# Ensure backend package is importable and DB is in-memory for tests
+CURRENT_DIR = os.path.dirname(__file__)
+REPO_ROOT = os.path.abspath(os.path.join(CURRENT_DIR, "..", ".."))
+BACKEND_DIR = os.path.join(REPO_ROOT, "backend")
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
+
+os.environ["DATABASE_URL"] = "sqlite+pysqlite:///:memory:"
+
+from app.db.base import Base  # noqa: E402
+from app.db.session import SessionLocal, engine  # noqa: E402
+from app.main import app  # noqa: E402
+from app.models.ticker import Ticker  # noqa: E402
+from app.nlp import processor as p  # noqa: E402
+from app.nlp.prefix_index import PrefixIndex  # noqa: E402
+
+
+def setup_function(_: object) -> None:
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    p._ticker_index_cache = {}
+    p._ticker_index_cache_expiry = 0.0
+
+
+def _add_tickers(*tickers: tuple) -> None:
+    with SessionLocal() as db:
+        db.add_all([Ticker(symbol=s, name=n) for s, n in tickers])
+        db.commit()
+
+
+async def _suggest(q: str, queries: list = None) -> list:
+    def _count(*_args: object) -> None:
+        queries.append(1)
+
+    if queries is not None:
+        event.listen(engine, "before_cursor_execute", _count)
+    try:
+        transport = ASGITransport(app=app)
+        async with AsyncClient(transport=transport, base_url="http://test") as ac:
+            resp = await ac.get("/v1/tickers/suggest", params={"q": q})
+    finally:
+        if queries is not None:
+            event.remove(engine, "before_cursor_execute", _count)
+    assert resp.status_code == 200
+    return [s["symbol"] for s in resp.json()]
+
+
+def test_prefix_index_orders_symbol_then_name_then_word() -> None:
+    index = PrefixIndex.build(
+        [
+            (1, "BAC", "Bank of America Corp"),
+            (2, "AMZN", "Amazon.com Inc."),
+            (3, "AMER", "Ameresco Inc."),
+            (4, "A", None),
+        ]
+    )
+    assert index.search("am") == [3, 2, 1]
+    assert index.search("america") == [1]
+    assert index.search("A", limit=2) == [4, 3]
+    index.add(5, "AMD", "Advanced Micro Devices")
+    assert index.search("am") == [5, 3, 2, 1]
+    assert index.search("micro") == [5]
+    assert index.search("zz") == []
+
+
+@pytest.mark.asyncio
+async def test_suggest_serves_from_memory_and_refreshes_incrementally(monkeypatch: pytest.MonkeyPatch) -> None:
+    _add_tickers(("AAPL", "Apple Inc."), ("APP", "AppLovin Corp"), ("MSFT", "Microsoft Corp"))
+    # Symbol prefixes rank ahead of name prefixes
+    assert await _suggest("ap") == ["APP", "AAPL"]
+
+    queries: list = []
+    assert await _suggest("micro", queries) == ["MSFT"]
+    assert queries == []
+
+    _add_tickers(("APH", "Amphenol Corp"))
+    monkeypatch.setattr(p, "_ticker_index_cache_expiry", 0.0)
+    prefix_before = p._ticker_index_cache["prefix"]
+    queries = []
+    assert await _suggest("ap", queries) == ["APH", "APP", "AAPL"]
+    # One query for rows above the highest known id, merged into a copy of the index
+    assert len(queries) == 1
+    assert p._ticker_index_cache["prefix"] is not prefix_before
+    assert p._ticker_index_cache["symbol_to_id"]["APH"]
+    assert prefix_before.search("aph") == []
+
+
+def test_stale_index_is_served_while_another_caller_refreshes(monkeypatch: pytest.MonkeyPatch) -> None:
+    _add_tickers(("AAPL", "Apple Inc."))
+    with SessionLocal() as db:
+        stale = p.get_ticker_index(db)
+    _add_tickers(("APH", "Amphenol Corp"))
+    monkeypatch.setattr(p, "_ticker_index_cache_expiry", 0.0)
+
+    with p._ticker_index_lock, SessionLocal() as db:
+        assert p.get_ticker_index(db) is stale
+    with SessionLocal() as db:
+        fresh = p.get_ticker_index(db)
+    assert fresh is not stale
+    assert "APH" in fresh["symbol_to_id"] and "APH" not in stale["symbol_to_id"]
+    assert fresh["all_names_lower"] == ["apple inc.", "amphenol corp"]
+
+
+def test_prefix_search_is_sub_millisecond() -> None:
+    rows = [(i, f"T{i:05d}", f"Company {i} Holdings Inc.") for i in range(20000)]
+    index = PrefixIndex.build(rows)
+    start = time.perf_counter()
+    for q in ("t1", "t12", "company 1", "holdings", "zz") * 200:
+        index.search(q, 10)
+    assert (time.perf_counter() - start) / 1000 < 0.001
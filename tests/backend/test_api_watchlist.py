@@ -0,0 +1,131 @@
+import os
+import sys
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from httpx import AsyncClient, ASGITransport
+from sqlalchemy import event
+
+
+# Ensure backend package is importable and DB is in-memory for tests
+CURRENT_DIR = os.path.dirname(__file__)
+REPO_ROOT = os.path.abspath(os.path.join(CURRENT_DIR, "..", ".."))
+BACKEND_DIR = os.path.join(REPO_ROOT, "backend")
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
+
+os.environ["DATABASE_URL"] = "sqlite+pysqlite:///:memory:"
+
+from app.db.base import Base  # noqa: E402
+from app.db.session import SessionLocal, engine  # noqa: E402
+from app.main import app  # noqa: E402
+from app.models.headline import Headline  # noqa: E402
+from app.models.mention import Mention  # noqa: E402
+from app.models.risk_score import RiskScore  # noqa: E402
+from app.models.ticker import Ticker  # noqa: E402
+from app.models.user import User  # noqa: E402
+from app.models.watchlist_item import WatchlistItem  # noqa: E402
+from app.utils import security  # noqa: E402
+from app.utils.risk import score_risk_percent  # noqa: E402
+
+
+def setup_function(_: object) -> None:
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    security.clear_user_cache()
+
+
+def _seed(symbols: list) -> str:
+    now = datetime.now(timezone.utc)
+    with SessionLocal() as db:
+        user = User(email="overview@example.com", hashed_password="x", is_active=True)
+        db.add(user)
+        db.commit()
+        for i, symbol in enumerate(symbols):
+            ticker = Ticker(symbol=symbol, name=f"{symbol} Corp")
+            db.add(ticker)
+            db.add(WatchlistItem(user_id=user.id, symbol=symbol))
+            db.flush()
+            for j, (age_h, sentiment) in enumerate(((30, 0.5), (2, -0.5), (1, 0.0))):
+                headline = Headline(
+                    title=f"{symbol} headline {j}",
+                    url=f"https://example.com/{i}/{j}",
+                    source="test",
+                    published_at=now - timedelta(hours=age_h),
+                )
+                db.add(headline)
+                db.flush()
+                db.add(Mention(headline_id=headline.id, ticker_id=ticker.id))
+                db.add(
+                    RiskScore(
+                        ticker_id=ticker.id,
+                        headline_id=headline.id,
+                        sentiment=sentiment,
+                        urgency=0.2,
+                        created_at=now - timedelta(hours=age_h),
+                    )
+                )
+        db.commit()
+        return security.create_access_token(user.id)
+
+
+async def _get_overview(token: str, count: list) -> list:
+    def _count(*_args: object) -> None:
+        count.append(1)
+
+    event.listen(engine, "before_cursor_execute", _count)
+    try:
+        transport = ASGITransport(app=app)
+        async with AsyncClient(transport=transport, base_url="http://test") as ac:
+            resp = await ac.get("/v1/watchlist/overview", headers={"Authorization": f"Bearer {token}"})
+    finally:
+        event.remove(engine, "before_cursor_execute", _count)
+    assert resp.status_code == 200
+    return resp.json()
+
+
+@pytest.mark.asyncio
+async def test_overview_reports_latest_risk_change_and_headlines() -> None:
+    token = _seed(["AAPL"])
+    body = await _get_overview(token, [])
+    assert len(body) == 1
+    item = body[0]
+    latest = score_risk_percent(0.0, 0.2)
+    day_ago = score_risk_percent(0.5, 0.2)
+    assert item["symbol"] == "AAPL" and item["name"] == "AAPL Corp"
+    assert item["risk_percent"] == latest
+    assert item["change_24h"] == round(latest - day_ago, 2)
+    assert [h["title"] for h in item["headlines"]] == ["AAPL headline 2", "AAPL headline 1", "AAPL headline 0"]
+    assert item["headlines"][1]["risk_percent"] == score_risk_percent(-0.5, 0.2)
+
+
+@pytest.mark.asyncio
+async def test_overview_query_count_does_not_grow_with_watchlist() -> None:
+    small = []
+    await _get_overview(_seed(["AAPL", "MSFT"]), small)
+    setup_function(None)
+    large = []
+    body = await _get_overview(_seed([f"T{i:03d}" for i in range(40)]), large)
+    assert len(body) == 40
+    assert all(len(item["headlines"]) == 3 for item in body)
+    assert len(small) == len(large) <= 6
+
+
+@pytest.mark.asyncio
+async def test_overview_etag_changes_when_the_24h_baseline_moves() -> None:
+    token = _seed(["AAPL"])
+    headers = {"Authorization": f"Bearer {token}"}
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        first = await ac.get("/v1/watchlist/overview", headers=headers)
+        etag = first.headers["etag"]
+        # No new scores, but the 2h-old one ages past the cutoff, as it would a day later
+        with SessionLocal() as db:
+            score = db.query(RiskScore).filter(RiskScore.sentiment == -0.5).one()
+            score.created_at = datetime.now(timezone.utc) - timedelta(hours=25)
+            db.commit()
+        later = await ac.get("/v1/watchlist/overview", headers={**headers, "If-None-Match": etag})
+    assert later.status_code == 200
+    assert later.headers["etag"] != etag
+    latest = score_risk_percent(0.0, 0.2)
+    assert later.json()[0]["change_24h"] == round(latest - score_risk_percent(-0.5, 0.2), 2)
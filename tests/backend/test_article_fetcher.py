@@ -0,0 +1,111 @@
+import os
+import sys
+
+# Ensure backend package is importable
+CURRENT_DIR = os.path.dirname(__file__)
+REPO_ROOT = os.path.abspath(os.path.join(CURRENT_DIR, "..", ".."))
+BACKEND_DIR = os.path.join(REPO_ROOT, "backend")
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
+
+# Configure test database BEFORE importing session
+os.environ["DATABASE_URL"] = "sqlite+pysqlite:///:memory:"
+
+import pytest  # noqa: E402
+from aiohttp import web  # noqa: E402
+
+from app.db.base import Base  # noqa: E402
+from app.db.session import SessionLocal, engine  # noqa: E402
+from app.ingest.article_fetcher import (  # noqa: E402
+    ArticleFetcher,
+    canonical_url,
+    enrich_headlines,
+    extract_main_text,
+)
+from app.models.headline import Headline  # noqa: E402
+
+
+ARTICLE_HTML = """
+<html><body>
+<nav><p>Home | Markets | Tech | Opinion | Subscribe to our newsletter today</p></nav>
+<article>
+  <p>Apple shares fell sharply on Tuesday after the company cut its revenue guidance.</p>
+  <p>Short.</p>
+  <p>Analysts said the warning reflected weaker demand in China and rising component costs.</p>
+</article>
+<script>var tracking = "ignore me";</script>
+</body></html>
+"""
+
+
+def setup_function(_: object) -> None:
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+
+
+def test_canonical_url_drops_tracking_and_fragment() -> None:
+    a = canonical_url("HTTPS://Example.com/a?utm_source=x&b=2&a=1#top")
+    b = canonical_url("https://example.com/a?a=1&b=2")
+    assert a == b == "https://example.com/a?a=1&b=2"
+
+
+def test_extract_main_text_prefers_article_paragraphs() -> None:
+    text = extract_main_text(ARTICLE_HTML)
+    assert text.startswith("Apple shares fell sharply")
+    assert "weaker demand in China" in text
+    assert "Subscribe" not in text and "tracking" not in text and "Short." not in text
+
+
+@pytest.mark.asyncio
+async def test_enrich_headlines_respects_robots_size_and_caches(tmp_path) -> None:
+    hits = {"article": 0}
+
+    async def robots(_):
+        return web.Response(text="User-agent: *\nDisallow: /private\n")
+
+    async def article(_):
+        hits["article"] += 1
+        return web.Response(text=ARTICLE_HTML, content_type="text/html")
+
+    async def big(_):
+        return web.Response(text="<p>" + "x" * 5000 + "</p>", content_type="text/html")
+
+    app = web.Application()
+    app.router.add_get("/robots.txt", robots)
+    app.router.add_get("/news/1", article)
+    app.router.add_get("/private/2", article)
+    app.router.add_get("/big", big)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    base = f"http://127.0.0.1:{port}"
+
+    try:
+        with SessionLocal() as db:
+            rows = [
+                Headline(title="Apple cuts guidance", url=f"{base}/news/1?utm_source=feed"),
+                Headline(title="Private", url=f"{base}/private/2"),
+                Headline(title="Huge", url=f"{base}/big"),
+            ]
+            db.add_all(rows)
+            db.commit()
+            ids = [h.id for h in rows]
+
+        fetcher = ArticleFetcher(cache_dir=str(tmp_path), max_bytes=1024, timeout_s=5)
+        stored = await enrich_headlines(ids, fetcher=fetcher)
+        assert stored == 1
+
+        with SessionLocal() as db:
+            bodies = {h.title: h.body for h in db.query(Headline).all()}
+        assert bodies["Apple cuts guidance"].startswith("Apple shares fell sharply")
+        assert bodies["Private"] is None
+        assert bodies["Huge"] is None
+
+        # Same canonical URL is served from the disk cache
+        again = await fetcher.fetch_many([f"{base}/news/1"])
+        assert again[f"{base}/news/1"].startswith("Apple shares")
+        assert hits["article"] == 1
+    finally:
+        await runner.cleanup()
@@ -0,0 +1,93 @@
+import asyncio
+import os
+import sys
+
+import pytest
+from httpx import AsyncClient, ASGITransport
+from sqlalchemy import create_engine, select
+from sqlalchemy.pool import QueuePool
+
+
+# Ensure backend package is importable and DB is in-memory for tests
+CURRENT_DIR = os.path.dirname(__file__)
+REPO_ROOT = os.path.abspath(os.path.join(CURRENT_DIR, "..", ".."))
+BACKEND_DIR = os.path.join(REPO_ROOT, "backend")
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
+
+os.environ["DATABASE_URL"] = "sqlite+pysqlite:///:memory:"
+
+from app.db import session as db_session  # noqa: E402
+from app.db.base import Base  # noqa: E402
+from app.db.session import SessionLocal, engine  # noqa: E402
+from app.main import app  # noqa: E402
+from app.models.user import User  # noqa: E402
+from app.models.watchlist_item import WatchlistItem  # noqa: E402
+from app.utils import security  # noqa: E402
+
+
+def setup_function(_: object) -> None:
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    security.clear_user_cache()
+
+
+def test_async_database_url_maps_drivers() -> None:
+    assert db_session.async_database_url("postgresql+psycopg2://u:p@h:5432/db") == "postgresql+asyncpg://u:p@h:5432/db"
+    assert db_session.async_database_url("postgresql://u@h/db") == "postgresql+asyncpg://u@h/db"
+    assert db_session.async_database_url("sqlite+pysqlite:////tmp/x.db") == "sqlite+aiosqlite:////tmp/x.db"
+    # A second engine on an in-memory database would see an empty database
+    assert db_session.async_database_url("sqlite+pysqlite:///:memory:") is None
+    assert db_session.async_database_url("mysql+pymysql://u@h/db") is None
+
+
+@pytest.mark.asyncio
+async def test_watchlist_read_uses_async_session() -> None:
+    assert db_session.AsyncSessionLocal is None  # in-memory SQLite falls back to the threaded facade
+    with SessionLocal() as db:
+        user = User(email="async@example.com", hashed_password="x", is_active=True)
+        db.add(user)
+        db.commit()
+        db.add_all([WatchlistItem(user_id=user.id, symbol="AAPL"), WatchlistItem(user_id=user.id, symbol="MSFT")])
+        db.commit()
+        token = security.create_access_token(user.id)
+
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        resp = await ac.get("/v1/watchlist/", headers={"Authorization": f"Bearer {token}"})
+    assert resp.status_code == 200
+    assert [i["symbol"] for i in resp.json()] == ["MSFT", "AAPL"]
+
+
+def test_native_async_session_on_sqlite_file(tmp_path) -> None:
+    pytest.importorskip("aiosqlite")
+    path = tmp_path / "async.db"
+    sync_engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(sync_engine)
+    with sync_engine.begin() as conn:
+        conn.execute(WatchlistItem.__table__.insert(), [{"user_id": 1, "symbol": "NVDA"}])
+    sync_engine.dispose()
+
+    factory = db_session.create_async_session_factory(db_session.async_database_url(f"sqlite:///{path}"))
+
+    async def read() -> list:
+        async with factory() as db:
+            rows = (await db.execute(select(WatchlistItem.symbol))).scalars().all()
+        await factory.kw["bind"].dispose()
+        return rows
+
+    assert asyncio.run(read()) == ["NVDA"]
+
+
+def test_pool_stats_report_queue_pool_usage(monkeypatch) -> None:
+    pooled = create_engine("sqlite://", poolclass=QueuePool, pool_size=2, max_overflow=1)
+    monkeypatch.setattr(db_session, "engine", pooled)
+    conn = pooled.connect()
+    try:
+        stats = db_session.update_pool_metrics()
+    finally:
+        conn.close()
+    assert stats["sync"]["size"] == 2
+    assert stats["sync"]["checked_out"] == 1
+    assert db_session.pool_stats()["sync"]["checked_out"] == 0
+    pooled.dispose()
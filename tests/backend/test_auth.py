@@ -0,0 +1,69 @@
+import os
+import sys
+
+import pytest
+from httpx import AsyncClient, ASGITransport
+
+
+# Ensure backend package is importable and DB is in-memory for tests
+CURRENT_DIR = os.path.dirname(__file__)
+REPO_ROOT = os.path.abspath(os.path.join(CURRENT_DIR, "..", ".."))
+BACKEND_DIR = os.path.join(REPO_ROOT, "backend")
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
+
+os.environ["DATABASE_URL"] = "sqlite+pysqlite:///:memory:"
+
+from app.db.base import Base  # noqa: E402
+from app.db.session import SessionLocal, engine  # noqa: E402
+from app.main import app  # noqa: E402
+from app.models.user import User  # noqa: E402
+from app.utils import security  # noqa: E402
+
+
+def setup_function(_: object) -> None:
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    security.clear_user_cache()
+
+
+def _user() -> int:
+    with SessionLocal() as db:
+        user = User(email="reader@example.com", hashed_password="x", is_active=True, is_superuser=False)
+        db.add(user)
+        db.commit()
+        return int(user.id)
+
+
+@pytest.mark.asyncio
+async def test_cached_user_skips_db_until_deactivated(monkeypatch: pytest.MonkeyPatch) -> None:
+    user_id = _user()
+    headers = {"Authorization": f"Bearer {security.create_access_token(user_id)}"}
+    loads = []
+    original = security._load_current_user
+    monkeypatch.setattr(security, "_load_current_user", lambda uid: loads.append(uid) or original(uid))
+
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        for _ in range(3):
+            assert (await ac.get("/v1/watchlist/", headers=headers)).status_code == 200
+        assert loads == [user_id]
+
+        with SessionLocal() as db:
+            security.deactivate_user(db, user_id)
+        assert (await ac.get("/v1/watchlist/", headers=headers)).status_code == 401
+        assert loads == [user_id, user_id]
+
+
+@pytest.mark.asyncio
+async def test_orm_deactivation_invalidates_cache() -> None:
+    user_id = _user()
+    headers = {"Authorization": f"Bearer {security.create_access_token(user_id)}"}
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        assert (await ac.get("/v1/watchlist/", headers=headers)).status_code == 200
+        with SessionLocal() as db:
+            db.get(User, user_id).is_active = False
+            db.commit()
+        assert (await ac.get("/v1/watchlist/", headers=headers)).status_code == 401
+        assert (await ac.get("/v1/watchlist/", headers={"Authorization": "Bearer nope"})).status_code == 401
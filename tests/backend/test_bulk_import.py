@@ -0,0 +1,181 @@
+import csv
+import datetime as dt
+import gzip
+import json
+import os
+import sys
+
+# Ensure backend package is importable
+CURRENT_DIR = os.path.dirname(__file__)
+REPO_ROOT = os.path.abspath(os.path.join(CURRENT_DIR, "..", ".."))
+BACKEND_DIR = os.path.join(REPO_ROOT, "backend")
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
+
+# Configure test database BEFORE importing session
+os.environ["DATABASE_URL"] = "sqlite+pysqlite:///:memory:"
+
+from app.db.base import Base  # noqa: E402
+from app.db.session import SessionLocal, engine  # noqa: E402
+from app.ingest.bulk_import import _load_copy, _parse_chunk, import_files, normalize_archive_row  # noqa: E402
+from app.ingest.news_fetcher import _sha256, save_headlines  # noqa: E402
+from app.models.headline import Headline  # noqa: E402
+
+
+def setup_function(_: object) -> None:
+    # Recreate schema for each test
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+
+
+def test_normalize_archive_row_accepts_newsapi_rss_and_normalized_shapes() -> None:
+    newsapi = normalize_archive_row(
+        {"title": " AAPL plunges ", "url": "https://example.com/1", "source": {"name": "NewsAPI"},
+         "publishedAt": "2025-10-02T12:00:00Z"}
+    )
+    assert newsapi["text"] == "AAPL plunges" and newsapi["source"] == "NewsAPI"
+    assert newsapi["url"] == "https://example.com/1"
+    assert newsapi["published_at"] == dt.datetime(2025, 10, 2, 12, tzinfo=dt.timezone.utc)
+    assert newsapi["title_hash"] == _sha256("AAPL plunges")
+
+    rss = normalize_archive_row(
+        {"title": "Fed signals cut", "link": "https://example.com/2", "published": "Thu, 02 Oct 2025 12:00:00 GMT",
+         "source": "Reuters"}
+    )
+    assert rss["text"] == "Fed signals cut" and rss["source"] == "Reuters"
+    assert rss["url"] == "https://example.com/2"
+    assert rss["published_at"].replace(tzinfo=None) == dt.datetime(2025, 10, 2, 12)
+
+    normalized = normalize_archive_row(
+        {"text": "Oil steady", "url": "https://example.com/3", "source": "Wire", "published_at": "2025-10-03T08:00:00Z"}
+    )
+    assert normalized["text"] == "Oil steady" and normalized["source"] == "Wire"
+    assert normalized["published_at"].replace(tzinfo=None) == dt.datetime(2025, 10, 3, 8)
+    # CSV archives carry a title column instead of text, and empty strings for missing values
+    assert normalize_archive_row({"title": "Gold rises", "url": "", "source": ""})["url"] is None
+
+    assert normalize_archive_row({"text": "   ", "url": "https://example.com/4"}) is None
+
+
+def test_parse_chunk_counts_valid_rows_before_deduping_them() -> None:
+    lines = [
+        json.dumps({"text": "Oil steady", "url": "https://example.com/1"}),
+        json.dumps({"text": "Oil steady", "url": "https://example.com/2"}),
+        json.dumps({"text": "Gold rises", "url": "https://example.com/1"}),
+        json.dumps({"text": ""}),
+        "not json",
+    ]
+    read, valid, items = _parse_chunk("jsonl", lines)
+    assert (read, valid) == (5, 3)
+    assert [i["text"] for i in items] == ["Oil steady"]
+
+
+def test_bulk_import_jsonl_gz_dedupes_across_chunks_and_db(tmp_path) -> None:
+    rows = [
+        # raw NewsAPI shape
+        {"title": "AAPL plunges after earnings miss", "url": "https://example.com/1",
+         "source": {"name": "NewsAPI"}, "publishedAt": "2025-10-02T12:00:00Z"},
+        # raw RSS shape
+        {"title": "Fed signals possible rate cut", "link": "https://example.com/2",
+         "published": "Thu, 02 Oct 2025 12:00:00 GMT"},
+        # normalized shape, duplicate title of row 1 in a later chunk
+        {"text": "AAPL plunges after earnings miss", "url": "https://example.com/3"},
+        # already stored in DB
+        {"text": "Already stored", "url": "https://example.com/stored"},
+        {"text": "Oil steady", "url": "https://example.com/4", "published_at": "2025-10-03T08:00:00Z"},
+    ]
+    path = tmp_path / "archive.jsonl.gz"
+    with gzip.open(path, "wt", encoding="utf-8") as fh:
+        for r in rows:
+            fh.write(json.dumps(r) + "\n")
+        fh.write("not json\n")
+
+    with SessionLocal() as db:
+        save_headlines(db, [{"text": "Already stored", "url": "https://example.com/stored"}])
+
+    stats = import_files([str(path)], chunk_size=2, workers=1, method="insert")
+
+    assert stats.summary()["rows_read"] == 6
+    assert (stats.rows_valid, stats.rows_inserted, stats.duplicates) == (5, 3, 2)
+    with SessionLocal() as db:
+        titles = sorted(h.title for h in db.query(Headline).all())
+        assert titles == ["AAPL plunges after earnings miss", "Already stored", "Fed signals possible rate cut",
+                          "Oil steady"]
+        oil = db.query(Headline).filter(Headline.title == "Oil steady").one()
+        assert oil.published_at is not None and oil.title_hash
+
+
+def test_bulk_import_csv_counts_duplicates_within_a_chunk(tmp_path) -> None:
+    path = tmp_path / "archive.csv"
+    with open(path, "w", encoding="utf-8", newline="") as fh:
+        writer = csv.DictWriter(fh, fieldnames=["title", "url", "source", "published_at"])
+        writer.writeheader()
+        writer.writerow({"title": "Oil steady", "url": "https://example.com/1", "source": "Wire",
+                         "published_at": "2025-10-03T08:00:00Z"})
+        writer.writerow({"title": "Oil steady", "url": "https://example.com/2", "source": "Wire"})
+        writer.writerow({"title": "Gold rises", "url": "", "source": ""})
+        writer.writerow({"title": "", "url": "https://example.com/3"})
+
+    stats = import_files([str(path)], chunk_size=10, workers=1, method="insert")
+
+    assert (stats.rows_read, stats.rows_valid, stats.rows_inserted, stats.duplicates) == (4, 3, 2, 1)
+    with SessionLocal() as db:
+        rows = {h.title: h for h in db.query(Headline).all()}
+    assert sorted(rows) == ["Gold rises", "Oil steady"]
+    assert rows["Oil steady"].source == "Wire" and rows["Oil steady"].published_at is not None
+    assert rows["Gold rises"].url is None
+
+
+def test_load_copy_stages_the_chunk_and_inserts_with_one_anti_join() -> None:
+    class FakeCursor:
+        rowcount = 1
+
+        def __init__(self) -> None:
+            self.sql: list = []
+            self.copied = ""
+
+        def __enter__(self) -> "FakeCursor":
+            return self
+
+        def __exit__(self, *exc: object) -> None:
+            return None
+
+        def execute(self, sql: str) -> None:
+            self.sql.append(" ".join(sql.split()))
+
+        def copy_expert(self, sql: str, buf) -> None:
+            self.sql.append(sql)
+            self.copied = buf.read()
+
+    cursor = FakeCursor()
+
+    class FakeSession:
+        committed = False
+
+        def connection(self):
+            return type("Conn", (), {"connection": type("Raw", (), {"cursor": lambda _self: cursor})()})()
+
+        def commit(self) -> None:
+            self.committed = True
+
+    db = FakeSession()
+    items = [
+        {"text": "Oil steady", "title_hash": "h1", "url": "https://example.com/1", "source": "Wire",
+         "published_at": dt.datetime(2025, 10, 3, 8, tzinfo=dt.timezone.utc)},
+        {"text": "Gold rises, again", "title_hash": "h2", "url": None, "source": None, "published_at": None},
+    ]
+
+    assert _load_copy(db, items) == 1
+    assert db.committed
+    create, copy, insert = cursor.sql
+    assert create.startswith("CREATE TEMP TABLE IF NOT EXISTS _headline_import") and "ON COMMIT DELETE ROWS" in create
+    assert copy == (
+        "COPY _headline_import (source, url, title, title_hash, published_at) FROM STDIN WITH (FORMAT csv, NULL '')"
+    )
+    assert insert.startswith("INSERT INTO headlines (source, url, title, title_hash, published_at) SELECT")
+    assert "NOT EXISTS (SELECT 1 FROM headlines h WHERE h.title_hash = s.title_hash)" in insert
+    assert "s.url IS NULL OR NOT EXISTS (SELECT 1 FROM headlines h WHERE h.url = s.url)" in insert
+    assert list(csv.reader(cursor.copied.splitlines())) == [
+        ["Wire", "https://example.com/1", "Oil steady", "h1", "2025-10-03T08:00:00+00:00"],
+        ["", "", "Gold rises, again", "h2", ""],
+    ]
@@ -0,0 +1,114 @@
+import os
+import sys
+from datetime import datetime, timedelta, timezone
+
+# Ensure backend package is importable
+CURRENT_DIR = os.path.dirname(__file__)
+REPO_ROOT = os.path.abspath(os.path.join(CURRENT_DIR, "..", ".."))
+BACKEND_DIR = os.path.join(REPO_ROOT, "backend")
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
+
+# Configure test database BEFORE importing session
+os.environ["DATABASE_URL"] = "sqlite+pysqlite:///:memory:"
+
+import pytest  # noqa: E402
+
+from app.db.base import Base  # noqa: E402
+from app.db.session import SessionLocal, engine  # noqa: E402
+from app.models.headline import Headline  # noqa: E402
+from app.nlp import processor as p  # noqa: E402
+from app.workers.claims import (  # noqa: E402
+    claim_headline_batch,
+    observe_batch,
+    record_failure,
+    release_claims,
+    retry_delay_seconds,
+)
+
+
+def setup_function(_: object) -> None:
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    p._ticker_index_cache = {}
+
+
+def _add_headlines(n: int) -> list:
+    with SessionLocal() as db:
+        rows = [Headline(title=f"headline {i}", url=f"https://example.com/{i}") for i in range(n)]
+        db.add_all(rows)
+        db.commit()
+        return [h.id for h in rows]
+
+
+def test_claims_are_disjoint_newest_first() -> None:
+    ids = _add_headlines(5)
+    with SessionLocal() as a, SessionLocal() as b:
+        first = claim_headline_batch(a, limit=3)
+        second = claim_headline_batch(b, limit=3)
+    assert first == sorted(ids, reverse=True)[:3]
+    assert second == sorted(ids, reverse=True)[3:]
+    assert not set(first) & set(second)
+
+    with SessionLocal() as db:
+        assert claim_headline_batch(db, limit=3) == []
+        rows = db.query(Headline).all()
+        assert all(h.status == "claimed" and h.attempts == 1 for h in rows)
+
+
+def test_release_and_stale_claims_are_reclaimable(monkeypatch: pytest.MonkeyPatch) -> None:
+    ids = _add_headlines(2)
+    with SessionLocal() as db:
+        claimed = claim_headline_batch(db, limit=2)
+        release_claims(db, [claimed[0]])
+        assert claim_headline_batch(db, limit=2) == [claimed[0]]
+
+        # Simulate a crashed worker holding the other claim for too long
+        stale = db.get(Headline, claimed[1])
+        stale.claimed_at = datetime.now(timezone.utc) - timedelta(hours=1)
+        db.commit()
+        monkeypatch.setenv("CLAIM_TIMEOUT_SECONDS", "60")
+        assert claim_headline_batch(db, limit=2) == [claimed[1]]
+        assert db.get(Headline, claimed[1]).attempts == 2
+    assert sorted(claimed) == sorted(ids)
+
+
+def test_processing_records_no_entities_outcome(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(p, "detect_entities", lambda text: [])
+    monkeypatch.setattr(p, "sentiment_score", lambda text: 0.0)
+    (hid,) = _add_headlines(1)
+    with SessionLocal() as db:
+        assert claim_headline_batch(db) == [hid]
+        assert p.process_headline(db, hid)["status"] == "no_entities"
+        h = db.get(Headline, hid)
+        db.refresh(h)
+        assert h.status == "no_entities" and h.processed_at is not None
+        assert claim_headline_batch(db) == []
+
+
+def test_failures_back_off_then_dead_letter(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("PROCESSING_MAX_ATTEMPTS", "2")
+    monkeypatch.setenv("RETRY_BASE_SECONDS", "60")
+    assert [retry_delay_seconds(n) for n in (1, 2, 3)] == [60, 120, 240]
+    (hid,) = _add_headlines(1)
+    with SessionLocal() as db:
+        assert claim_headline_batch(db) == [hid]
+        assert record_failure(db, [hid], "boom" * 200) == {hid: "failed"}
+        h = db.get(Headline, hid)
+        db.refresh(h)
+        assert h.claimed_at is None and len(h.last_error) == 512
+        # Not eligible until the backoff elapses
+        assert claim_headline_batch(db) == []
+
+        h.next_retry_at = datetime.now(timezone.utc) - timedelta(seconds=1)
+        db.commit()
+        assert claim_headline_batch(db) == [hid]
+        assert record_failure(db, [hid], "boom") == {hid: "dead"}
+        h.next_retry_at = None
+        db.commit()
+        assert claim_headline_batch(db) == []
+
+
+def test_observe_batch_reports_wasted_ratio() -> None:
+    assert observe_batch({"scored": 3, "no_entities": 1, "failed": 0, "dead": 0}) == 0.25
+    assert observe_batch({}) == 0.0
@@ -0,0 +1,92 @@
+import os
+import sys
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+from httpx import AsyncClient, ASGITransport
+
+
+# Ensure backend package is importable and DB is in-memory for tests
+CURRENT_DIR = os.path.dirname(__file__)
+REPO_ROOT = os.path.abspath(os.path.join(CURRENT_DIR, "..", ".."))
+BACKEND_DIR = os.path.join(REPO_ROOT, "backend")
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
+
+os.environ["DATABASE_URL"] = "sqlite+pysqlite:///:memory:"
+
+from app.analysis.downsample import lttb_indices  # noqa: E402
+from app.db.base import Base  # noqa: E402
+from app.db.session import SessionLocal, engine  # noqa: E402
+from app.main import app  # noqa: E402
+from app.models.headline import Headline  # noqa: E402
+from app.models.mention import Mention  # noqa: E402
+from app.models.risk_score import RiskScore  # noqa: E402
+from app.models.ticker import Ticker  # noqa: E402
+
+
+def setup_function(_: object) -> None:
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+
+
+def test_lttb_keeps_endpoints_and_extremes() -> None:
+    x = np.arange(10000, dtype=float)
+    y = np.sin(x / 500.0) * 20 + 50
+    y[3333] = 100.0
+    y[7777] = 0.0
+    idx = lttb_indices(x, y, 200)
+    assert len(idx) == 200
+    assert idx[0] == 0 and idx[-1] == 9999
+    assert np.all(np.diff(idx) > 0)
+    assert 3333 in idx and 7777 in idx
+
+
+def test_lttb_passes_short_series_through() -> None:
+    x = np.arange(5, dtype=float)
+    assert list(lttb_indices(x, x, 10)) == [0, 1, 2, 3, 4]
+    assert list(lttb_indices(x, x, 2)) == [0, 4]
+
+
+@pytest.mark.asyncio
+async def test_risk_endpoint_downsamples_timeseries() -> None:
+    base = datetime(2024, 1, 1)
+    with SessionLocal() as db:
+        ticker = Ticker(symbol="AAPL", name="Apple Inc.")
+        db.add(ticker)
+        db.flush()
+        headline = Headline(title="Apple recalls chargers", source="wire", published_at=base)
+        db.add(headline)
+        db.flush()
+        db.add(Mention(headline_id=headline.id, ticker_id=ticker.id))
+        db.add_all(
+            [
+                RiskScore(
+                    ticker_id=ticker.id,
+                    headline_id=headline.id if i == 1999 else None,
+                    sentiment=-0.2,
+                    urgency=0.4,
+                    composite=99.0 if i == 1000 else 40.0 + (i % 7),
+                    created_at=base + timedelta(hours=i),
+                )
+                for i in range(2000)
+            ]
+        )
+        db.commit()
+
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        resp = await ac.get("/v1/risk/aapl", params={"max_points": 100})
+        ranged = await ac.get("/v1/risk/AAPL", params={"start": "2024-01-02T00:00:00", "end": "2024-01-03T00:00:00"})
+        missing = await ac.get("/v1/risk/NOPE")
+    assert resp.status_code == 200
+    body = resp.json()
+    assert body["total_points"] == 2000
+    assert len(body["timeseries"]) == 100
+    assert max(p["risk_percent"] for p in body["timeseries"]) == 99.0
+    assert body["risk"]["risk_percent"] == 40.0 + 1999 % 7
+    assert body["headlines"][0]["title"] == "Apple recalls chargers"
+    assert body["headlines"][0]["sentiment"] == -0.2
+    assert ranged.json()["total_points"] == len(ranged.json()["timeseries"]) == 24
+    assert missing.status_code == 404
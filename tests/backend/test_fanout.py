@@ -0,0 +1,120 @@
+import os
+import sys
+
+# Ensure backend package is importable
+CURRENT_DIR = os.path.dirname(__file__)
+REPO_ROOT = os.path.abspath(os.path.join(CURRENT_DIR, "..", ".."))
+BACKEND_DIR = os.path.join(REPO_ROOT, "backend")
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
+
+# Configure test database BEFORE importing session
+os.environ["DATABASE_URL"] = "sqlite+pysqlite:///:memory:"
+
+import pytest  # noqa: E402
+
+from app.db.base import Base  # noqa: E402
+from app.db.session import SessionLocal, engine  # noqa: E402
+from app.ingest import priority  # noqa: E402
+from app.ingest.news_fetcher import insert_headlines  # noqa: E402
+from app.models.headline import Headline  # noqa: E402
+from app.models.ticker import Ticker  # noqa: E402
+from app.models.user import User  # noqa: E402
+from app.models.watchlist_item import WatchlistItem  # noqa: E402
+from app.nlp import processor as p  # noqa: E402
+from app.workers import fanout, tasks  # noqa: E402
+from app.workers.claims import claim_headline_batch  # noqa: E402
+
+
+def setup_function(_: object) -> None:
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    p._ticker_index_cache = {}
+    priority.invalidate_watch_index()
+
+
+def test_title_mentions_any_matches_cashtags_and_capitals() -> None:
+    symbols = {"AAPL", "A"}
+    assert priority.title_mentions_any("$aapl rallies", symbols)
+    assert priority.title_mentions_any("AAPL cuts guidance", symbols)
+    assert not priority.title_mentions_any("a quiet day for markets", symbols)
+    assert fanout.chunk_ids([1, 2, 3, 4, 5], 2) == [[1, 2], [3, 4], [5]]
+
+
+def test_dispatch_routes_watchlist_batches_and_summarizes(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(tasks.celery_app.conf, "task_always_eager", True)
+    monkeypatch.setattr(p, "detect_entities", lambda text: ["AAPL"] if "AAPL" in text else [])
+    monkeypatch.setattr(p, "sentiment_scores", lambda texts: [0.1 for _ in texts])
+
+    routed = []
+    original = tasks.task_process_batch.signature
+
+    def spy(args, **options):
+        routed.append((options.get("queue"), list(args[0])))
+        return original(args, **options)
+
+    monkeypatch.setattr(tasks.task_process_batch, "signature", spy)
+    summaries = []
+    monkeypatch.setattr(fanout, "merge_tallies", lambda t, _m=fanout.merge_tallies: summaries.append(t) or _m(t))
+
+    with SessionLocal() as db:
+        user = User(email="u@example.com", hashed_password="x", is_active=True)
+        db.add_all([user, Ticker(symbol="AAPL", name="Apple Inc.")])
+        db.commit()
+        db.add(WatchlistItem(user_id=user.id, symbol="AAPL"))
+        db.add_all([Headline(title="AAPL beats estimates")] + [Headline(title=f"market note {i}") for i in range(4)])
+        db.commit()
+
+    sent = tasks.task_dispatch_backlog(limit=10, batch_size=2)
+    assert sent == {fanout.QUEUE_HIGH: 1, fanout.QUEUE_DEFAULT: 2}
+    assert [q for q, _ in routed] == [fanout.QUEUE_HIGH, fanout.QUEUE_DEFAULT, fanout.QUEUE_DEFAULT]
+    assert len(routed[0][1]) == 1
+
+    merged = fanout.merge_tallies(summaries[0])
+    assert merged["scored"] == 1 and merged["no_entities"] == 4
+
+    with SessionLocal() as db:
+        assert {h.status for h in db.query(Headline).all()} == {"scored", "no_entities"}
+
+
+def test_watchlist_headlines_are_claimed_first_by_symbol_or_name() -> None:
+    with SessionLocal() as db:
+        user = User(email="w@example.com", hashed_password="x", is_active=True)
+        db.add_all([user, Ticker(symbol="NVDA", name="NVIDIA Corporation")])
+        db.commit()
+        db.add(WatchlistItem(user_id=user.id, symbol="NVDA"))
+        db.commit()
+
+        ids = insert_headlines(
+            db,
+            [
+                {"text": "Nvidia unveils new data-center chips", "url": "https://x.test/1"},
+                {"text": "Oil slips as inventories build", "url": "https://x.test/2"},
+                {"text": "$nvda options volume spikes", "url": "https://x.test/3"},
+                {"text": "Treasury yields edge higher", "url": "https://x.test/4"},
+            ],
+        )
+        assert [h.priority for h in db.query(Headline).order_by(Headline.id)] == [1, 0, 1, 0]
+        assert claim_headline_batch(db, limit=3) == [ids[2], ids[0], ids[3]]
+
+
+def test_batch_skips_rows_reclaimed_after_dispatch(monkeypatch: pytest.MonkeyPatch) -> None:
+    from datetime import datetime, timedelta, timezone
+
+    monkeypatch.setattr(p, "detect_entities", lambda text: [])
+    with SessionLocal() as db:
+        db.add_all([Headline(title=f"market note {i}") for i in range(3)])
+        db.commit()
+        token = datetime.now(timezone.utc) - timedelta(hours=1)
+        ids = claim_headline_batch(db, limit=3, claimed_at=token)
+
+        # The batch waited too long in the queue; a sweep took one of its rows back
+        monkeypatch.setenv("CLAIM_TIMEOUT_SECONDS", "60")
+        stolen = claim_headline_batch(db, limit=1)
+        assert len(stolen) == 1
+
+    tally = tasks.task_process_batch(ids, claimed_at=token.isoformat())
+    assert tally["no_entities"] == 2
+    with SessionLocal() as db:
+        assert db.get(Headline, stolen[0]).status == "claimed"
+        assert db.get(Headline, stolen[0]).attempts == 2
@@ -0,0 +1,128 @@
+import os
+import sys
+from datetime import datetime, timedelta
+
+import pytest
+from httpx import AsyncClient, ASGITransport
+from sqlalchemy import event
+
+
+# Ensure backend package is importable and DB is in-memory for tests
+CURRENT_DIR = os.path.dirname(__file__)
+REPO_ROOT = os.path.abspath(os.path.join(CURRENT_DIR, "..", ".."))
+BACKEND_DIR = os.path.join(REPO_ROOT, "backend")
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
+
+os.environ["DATABASE_URL"] = "sqlite+pysqlite:///:memory:"
+
+from app.db.base import Base  # noqa: E402
+from app.db.session import SessionLocal, engine  # noqa: E402
+from app.main import app  # noqa: E402
+from app.models.risk_score import RiskScore  # noqa: E402
+from app.models.ticker import Ticker  # noqa: E402
+from app.models.user import User  # noqa: E402
+from app.models.watchlist_item import WatchlistItem  # noqa: E402
+from app.utils import security  # noqa: E402
+
+
+def setup_function(_: object) -> None:
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    security.clear_user_cache()
+
+
+def _seed_scores(ticker_id: int, count: int, start: int = 0) -> None:
+    base = datetime(2026, 1, 1)
+    with SessionLocal() as db:
+        db.add_all(
+            [
+                RiskScore(ticker_id=ticker_id, sentiment=0.1, urgency=0.2, composite=40.0 + i % 5,
+                          created_at=base + timedelta(minutes=i))
+                for i in range(start, start + count)
+            ]
+        )
+        db.commit()
+
+
+def _ticker(symbol: str = "AAPL") -> int:
+    with SessionLocal() as db:
+        ticker = Ticker(symbol=symbol, name="Apple Inc.")
+        db.add(ticker)
+        db.commit()
+        return ticker.id
+
+
+@pytest.mark.asyncio
+async def test_risk_endpoint_revalidates_with_etag_and_last_modified() -> None:
+    tid = _ticker()
+    _seed_scores(tid, 50)
+    queries: list = []
+
+    def _count(*_args: object) -> None:
+        queries.append(1)
+
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        first = await ac.get("/v1/risk/AAPL")
+        etag = first.headers["etag"]
+        assert first.status_code == 200
+        assert "max-age" in first.headers["cache-control"]
+        assert first.headers["last-modified"].endswith("GMT")
+
+        event.listen(engine, "before_cursor_execute", _count)
+        try:
+            cached = await ac.get("/v1/risk/AAPL", headers={"If-None-Match": etag})
+        finally:
+            event.remove(engine, "before_cursor_execute", _count)
+        assert cached.status_code == 304
+        assert cached.content == b""
+        # Ticker lookup plus the watermark; no series or headline queries
+        assert len(queries) == 2
+
+        since = await ac.get("/v1/risk/AAPL", headers={"If-Modified-Since": first.headers["last-modified"]})
+        assert since.status_code == 304
+        other_params = await ac.get("/v1/risk/AAPL", params={"max_points": 10}, headers={"If-None-Match": etag})
+        assert other_params.status_code == 200
+
+        _seed_scores(tid, 1, start=50)
+        changed = await ac.get("/v1/risk/AAPL", headers={"If-None-Match": etag})
+        assert changed.status_code == 200
+        assert changed.headers["etag"] != etag
+        assert changed.json()["total_points"] == 51
+
+
+@pytest.mark.asyncio
+async def test_large_responses_are_compressed() -> None:
+    tid = _ticker()
+    _seed_scores(tid, 400)
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        resp = await ac.get("/v1/risk/AAPL", headers={"Accept-Encoding": "gzip"})
+        small = await ac.get("/health", headers={"Accept-Encoding": "gzip"})
+    assert resp.headers["content-encoding"] in ("gzip", "br")
+    assert len(resp.json()["timeseries"]) == 400
+    assert "content-encoding" not in small.headers
+
+
+@pytest.mark.asyncio
+async def test_watchlist_overview_is_privately_cacheable() -> None:
+    tid = _ticker()
+    _seed_scores(tid, 3)
+    with SessionLocal() as db:
+        user = User(email="cache@example.com", hashed_password="x", is_active=True)
+        db.add(user)
+        db.commit()
+        db.add(WatchlistItem(user_id=user.id, symbol="AAPL"))
+        db.commit()
+        headers = {"Authorization": f"Bearer {security.create_access_token(user.id)}"}
+
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        first = await ac.get("/v1/watchlist/overview", headers=headers)
+        assert first.headers["cache-control"].startswith("private")
+        cached = await ac.get("/v1/watchlist/overview", headers={**headers, "If-None-Match": first.headers["etag"]})
+        assert cached.status_code == 304
+        _seed_scores(tid, 1, start=3)
+        changed = await ac.get("/v1/watchlist/overview", headers={**headers, "If-None-Match": first.headers["etag"]})
+        assert changed.status_code == 200
@@ -0,0 +1,74 @@
+import os
+import sys
+
+# Ensure backend package is importable
+CURRENT_DIR = os.path.dirname(__file__)
+REPO_ROOT = os.path.abspath(os.path.join(CURRENT_DIR, "..", ".."))
+BACKEND_DIR = os.path.join(REPO_ROOT, "backend")
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
+
+# Configure test database BEFORE importing session
+os.environ["DATABASE_URL"] = "sqlite+pysqlite:///:memory:"
+
+import pytest  # noqa: E402
+
+from app.nlp import processor as p  # noqa: E402
+from app.workers import lifecycle  # noqa: E402
+
+
+def test_threads_are_split_across_processes(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("NLP_TORCH_THREADS", raising=False)
+    monkeypatch.setattr(lifecycle.os, "cpu_count", lambda: 8)
+    assert lifecycle.threads_per_process(4) == 2
+    assert lifecycle.threads_per_process(16) == 1
+    monkeypatch.setenv("NLP_TORCH_THREADS", "3")
+    assert lifecycle.threads_per_process(4) == 3
+
+
+def test_init_process_loads_models_once_and_reports_rss(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls = []
+    monkeypatch.setattr(p, "_get_spacy_model", lambda: calls.append("spacy"))
+    monkeypatch.setattr(p, "_get_sentiment_pipeline", lambda: calls.append("sentiment"))
+    monkeypatch.setenv("NLP_TORCH_THREADS", "1")
+    # configure_threads sets these for the whole process; register them so teardown restores them
+    for var in ("OMP_NUM_THREADS", "MKL_NUM_THREADS"):
+        monkeypatch.setenv(var, "")
+        monkeypatch.delenv(var)
+
+    lifecycle.init_process(concurrency=2, role="test")
+    assert calls == ["spacy", "sentiment"]
+    assert os.environ["OMP_NUM_THREADS"] == "1"
+
+    monkeypatch.setenv("NLP_PRELOAD", "off")
+    lifecycle.init_process(concurrency=2, role="test")
+    assert calls == ["spacy", "sentiment"]
+    assert (lifecycle.current_rss_bytes() or 0) > 0
+
+
+def test_scheduler_sizes_threads_for_trigger_and_sweep(monkeypatch: pytest.MonkeyPatch) -> None:
+    from app.workers import scheduler
+
+    sized = []
+
+    class Stub:
+        renew_interval_s = 10.0
+
+        def __init__(self, *args: object, **kwargs: object) -> None:
+            pass
+
+        def __getattr__(self, name: str):
+            return lambda *args, **kwargs: self
+
+    def stop(_seconds: float) -> None:
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr(
+        scheduler.lifecycle, "init_process", lambda concurrency, role: sized.append((concurrency, role))
+    )
+    for name in ("EventTrigger", "LeaderLease", "BackgroundScheduler"):
+        monkeypatch.setattr(scheduler, name, Stub)
+    monkeypatch.setattr(scheduler.time, "sleep", stop)
+
+    scheduler.main()
+    assert sized == [(2, "scheduler")]
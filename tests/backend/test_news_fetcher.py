@@ -131,5 +131,3 @@ def test_rss_fetch_and_save(monkeypatch: pytest.MonkeyPatch) -> None:
         assert rows[0].source == "Reuters"
         assert rows[0].url == "https://reuters.example.com/a"
         assert rows[0].title.startswith("Fed signals possible rate cut")
-
-
@@ -17,7 +17,7 @@ import pytest  # noqa: E402
 from app.db.base import Base  # noqa: E402
 from app.db.session import SessionLocal, engine  # noqa: E402
 from app.models.ticker import Ticker  # noqa: E402
-from app.models.headline import Headline  # noqa: E402
+from app.models.headline import STATUS_SCORED, Headline  # noqa: E402
 from app.models.mention import Mention  # noqa: E402
 from app.models.risk_score import RiskScore  # noqa: E402
 from app.nlp import processor as p  # noqa: E402
@@ -26,6 +26,8 @@ from app.nlp import processor as p  # noqa: E402
 def setup_function(_: object) -> None:
     Base.metadata.drop_all(engine)
     Base.metadata.create_all(engine)
+    # The ticker index is a module-level TTL cache; earlier tests may have cached an empty one
+    p._ticker_index_cache = {}
 
 
 def test_detect_entities_fallback_uppercase() -> None:
@@ -96,3 +98,103 @@ def test_process_headline_creates_mentions_and_risk_scores(monkeypatch: pytest.M
         assert scores[0].sentiment == -0.4 and scores[0].urgency == 0.6
 
 
+def test_analyze_skips_scoring_without_tickers(monkeypatch: pytest.MonkeyPatch) -> None:
+    scored_texts: list = []
+
+    def fake_scores(texts):
+        scored_texts.extend(texts)
+        return [0.2 for _ in texts]
+
+    monkeypatch.setattr(p, "detect_entities", lambda text: ["AAPL"] if "AAPL" in text else [])
+    monkeypatch.setattr(p, "sentiment_scores", fake_scores)
+
+    with SessionLocal() as db:
+        db.add(Ticker(symbol="AAPL", name="Apple Inc."))
+        rows = [Headline(title="AAPL beats estimates"), Headline(title="Markets drift ahead of data")]
+        db.add_all(rows)
+        db.commit()
+        ids = [h.id for h in rows]
+
+        results = p.analyze_headlines(db, ids)
+        assert scored_texts == ["AAPL beats estimates"]
+        assert results[0]["sentiment"] == 0.2 and results[0]["urgency"] is not None
+        assert results[1]["sentiment"] is None and results[1]["urgency"] is None
+
+        # Market-wide mode scores everything
+        monkeypatch.setenv("NLP_SCORE_WITHOUT_TICKERS", "1")
+        scored_texts.clear()
+        results = p.analyze_headlines(db, ids)
+        assert len(scored_texts) == 2 and results[1]["sentiment"] == 0.2
+
+        # ...and stores a market-wide score for the ticker-less headline
+        p.persist_headline_scores(db, results)
+        market = db.query(RiskScore).filter(RiskScore.ticker_id.is_(None)).one()
+        assert market.headline_id == ids[1] and market.sentiment == 0.2 and market.composite is not None
+        assert db.query(RiskScore).count() == 2
+        assert db.query(Mention).count() == 1
+        # A market-wide score is a written score, not a skipped headline
+        assert db.get(Headline, ids[1]).status == STATUS_SCORED
+        assert p.result_status(results[1]) == STATUS_SCORED
+
+        single = Headline(title="Bonds rally as yields ease")
+        db.add(single)
+        db.commit()
+        assert p.process_headline(db, single.id)["status"] == STATUS_SCORED
+        db.refresh(single)
+        assert single.status == STATUS_SCORED
+
+
+def test_cascade_escalates_only_uncertain_headlines(monkeypatch: pytest.MonkeyPatch) -> None:
+    escalated: list = []
+
+    def fake_scores(texts):
+        escalated.extend(texts)
+        return [0.1 for _ in texts]
+
+    monkeypatch.setattr(p, "sentiment_scores", fake_scores)
+    score, confidence = p.lexicon_sentiment("Retailer files for bankruptcy")
+    assert score < -0.5 and confidence > 0.6
+    assert p.lexicon_sentiment("Company schedules earnings call") == (0.0, 0.0)
+    assert p.lexicon_sentiment("Lender not expected to default")[0] > 0
+
+    scores, tiers = p.cascade_sentiment_scores(
+        ["Retailer files for bankruptcy", "Company schedules earnings call"], threshold=0.6
+    )
+    assert tiers == [p.MODEL_LEXICON, p.MODEL_TRANSFORMER]
+    assert escalated == ["Company schedules earnings call"] and scores[1] == 0.1
+
+    monkeypatch.setenv("NLP_CASCADE", "1")
+    monkeypatch.setattr(p, "detect_entities", lambda text: ["AAPL"])
+    with SessionLocal() as db:
+        db.add(Ticker(symbol="AAPL", name="Apple Inc."))
+        h = Headline(title="AAPL supplier files for bankruptcy")
+        db.add(h)
+        db.commit()
+        p.process_headlines(db, [h.id])
+        assert db.query(RiskScore).one().model == p.MODEL_LEXICON
+
+
+def test_body_chunks_are_not_cascade_decisions_but_set_the_model(monkeypatch: pytest.MonkeyPatch) -> None:
+    from app.utils import metrics
+
+    def decisions() -> float:
+        return sum(
+            metrics.registry.get_sample_value("nlp_cascade_total", {"tier": tier}) or 0.0
+            for tier in (p.MODEL_LEXICON, p.MODEL_TRANSFORMER)
+        )
+
+    monkeypatch.setenv("NLP_CASCADE", "1")
+    monkeypatch.setattr(p, "detect_entities", lambda text: ["AAPL"])
+    monkeypatch.setattr(p, "sentiment_scores", lambda texts: [0.1 for _ in texts])
+    with SessionLocal() as db:
+        db.add(Ticker(symbol="AAPL", name="Apple Inc."))
+        body = ". ".join(f"The company scheduled call number {i} with analysts" + " x" * 60 for i in range(4))
+        h = Headline(title="AAPL supplier files for bankruptcy", body=body)
+        db.add(h)
+        db.commit()
+        before = decisions()
+        results = p.analyze_headlines(db, [h.id])
+        # One headline, one decision: the lexicon was confident about the title
+        assert decisions() - before == 1
+        # The transformer scored the body chunks that were blended in
+        assert results[0]["model"] == p.MODEL_TRANSFORMER
@@ -0,0 +1,165 @@
+import os
+import sys
+import types
+import asyncio
+
+# Ensure backend package is importable
+CURRENT_DIR = os.path.dirname(__file__)
+REPO_ROOT = os.path.abspath(os.path.join(CURRENT_DIR, "..", ".."))
+BACKEND_DIR = os.path.join(REPO_ROOT, "backend")
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
+
+# Configure test database BEFORE importing session
+os.environ["DATABASE_URL"] = "sqlite+pysqlite:///:memory:"
+
+import feedparser  # noqa: E402
+import pytest  # noqa: E402
+from sqlalchemy import select  # noqa: E402
+
+from app.db.base import Base  # noqa: E402
+from app.db.session import SessionLocal, engine  # noqa: E402
+from app.models.headline import Headline  # noqa: E402
+from app.models.risk_score import RiskScore  # noqa: E402
+from app.models.ticker import Ticker  # noqa: E402
+from app.nlp import processor as p  # noqa: E402
+from app.workers.pipeline import IngestPipeline, PipelineConfig  # noqa: E402
+
+
+def setup_function(_: object) -> None:
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    p._ticker_index_cache = {}
+
+
+def test_pipeline_single_cycle_ingests_and_scores(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("NEWSAPI_KEY", raising=False)
+
+    class ParsedFeed:
+        def __init__(self):
+            self.feed = types.SimpleNamespace(title="Wire")
+            self.entries = [
+                {"title": "AAPL plunges after guidance cut", "link": "https://wire.example.com/1"},
+                {"title": "AAPL plunges after guidance cut", "link": "https://wire.example.com/1"},
+                {"title": "Oil steady in quiet trade", "link": "https://wire.example.com/2"},
+            ]
+
+    monkeypatch.setattr(feedparser, "parse", lambda url: ParsedFeed())
+    monkeypatch.setattr(p, "detect_entities", lambda text: ["AAPL"] if "AAPL" in text else [])
+    monkeypatch.setattr(p, "sentiment_scores", lambda texts: [-0.5 for _ in texts])
+
+    with SessionLocal() as db:
+        db.add(Ticker(symbol="AAPL", name="Apple Inc."))
+        db.commit()
+
+    cfg = PipelineConfig(rss_feeds=["https://wire.example.com/rss"], batch_linger_s=0.05)
+    pipeline = IngestPipeline(cfg)
+    stats = asyncio.run(pipeline.run(max_cycles=1))
+
+    assert stats["stages"]["fetch"]["processed"] == 3
+    assert stats["stages"]["dedupe"]["processed"] == 2
+    assert stats["stages"]["persist_scores"]["processed"] == 2
+    assert all(depth == 0 for depth in stats["queues"].values())
+    assert pipeline._inserted_at == {}
+
+    with SessionLocal() as db:
+        assert db.query(Headline).count() == 2
+        scores = db.query(RiskScore).all()
+        assert len(scores) == 1
+        assert scores[0].sentiment == -0.5
+
+
+def test_pipeline_forgets_ids_the_processor_drops(monkeypatch: pytest.MonkeyPatch) -> None:
+    from app.workers import pipeline as pl
+
+    monkeypatch.delenv("NEWSAPI_KEY", raising=False)
+
+    class ParsedFeed:
+        def __init__(self):
+            self.feed = types.SimpleNamespace(title="Wire")
+            self.entries = [{"title": "Oil steady in quiet trade", "link": "https://wire.example.com/2"}]
+
+    monkeypatch.setattr(feedparser, "parse", lambda url: ParsedFeed())
+    monkeypatch.setattr(pl, "_analyze", lambda ids: [])
+
+    pipeline = IngestPipeline(PipelineConfig(rss_feeds=["https://wire.example.com/rss"], batch_linger_s=0.05))
+    stats = asyncio.run(pipeline.run(max_cycles=1))
+
+    assert stats["stages"]["persist"]["processed"] == 1
+    assert pipeline._inserted_at == {}
+
+
+def test_enrich_stage_cancels_fetches_past_budget(monkeypatch: pytest.MonkeyPatch) -> None:
+    from app.workers import pipeline as pl
+
+    monkeypatch.delenv("NEWSAPI_KEY", raising=False)
+
+    class ParsedFeed:
+        def __init__(self):
+            self.feed = types.SimpleNamespace(title="Wire")
+            self.entries = [{"title": "Oil steady in quiet trade", "link": "https://wire.example.com/2"}]
+
+    cancelled = []
+
+    async def slow_fetch(ids, fetcher=None):
+        try:
+            await asyncio.sleep(30)
+        except asyncio.CancelledError:
+            cancelled.extend(ids)
+            raise
+        return {}
+
+    monkeypatch.setattr(feedparser, "parse", lambda url: ParsedFeed())
+    monkeypatch.setattr(pl.article_fetcher, "fetch_missing_bodies", slow_fetch)
+
+    cfg = PipelineConfig(
+        rss_feeds=["https://wire.example.com/rss"], batch_linger_s=0.05, enrich_bodies=True, enrich_budget_s=0.1
+    )
+    stats = asyncio.run(IngestPipeline(cfg, fetcher=object()).run(max_cycles=1))
+
+    assert stats["stages"]["persist_scores"]["processed"] == 1
+    assert len(cancelled) == 1
+
+
+def test_enrich_stage_stores_bodies_before_scoring_even_when_the_store_is_slow(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    import time
+
+    from app.workers import pipeline as pl
+
+    monkeypatch.delenv("NEWSAPI_KEY", raising=False)
+
+    class ParsedFeed:
+        def __init__(self):
+            self.feed = types.SimpleNamespace(title="Wire")
+            self.entries = [{"title": "Oil steady in quiet trade", "link": "https://wire.example.com/2"}]
+
+    async def fetch(ids, fetcher=None):
+        return {hid: "Crude held its range as traders awaited inventory data." for hid in ids}
+
+    real_store = pl.article_fetcher.store_bodies
+
+    def slow_store(db, bodies):
+        time.sleep(0.3)
+        return real_store(db, bodies)
+
+    bodies_seen = []
+    real_analyze = p.analyze_headlines
+
+    def analyze(db, ids):
+        bodies_seen.extend(db.scalars(select(Headline.body).where(Headline.id.in_(ids))))
+        return real_analyze(db, ids)
+
+    monkeypatch.setattr(feedparser, "parse", lambda url: ParsedFeed())
+    monkeypatch.setattr(pl.article_fetcher, "fetch_missing_bodies", fetch)
+    monkeypatch.setattr(pl.article_fetcher, "store_bodies", slow_store)
+    monkeypatch.setattr(p, "analyze_headlines", analyze)
+
+    cfg = PipelineConfig(
+        rss_feeds=["https://wire.example.com/rss"], batch_linger_s=0.05, enrich_bodies=True, enrich_budget_s=0.1
+    )
+    stats = asyncio.run(IngestPipeline(cfg, fetcher=object()).run(max_cycles=1))
+
+    assert stats["stages"]["enrich"]["processed"] == 1
+    assert bodies_seen == ["Crude held its range as traders awaited inventory data."]
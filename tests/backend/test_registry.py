@@ -0,0 +1,109 @@
+import json
+import os
+import sys
+
+# Ensure backend package is importable
+CURRENT_DIR = os.path.dirname(__file__)
+REPO_ROOT = os.path.abspath(os.path.join(CURRENT_DIR, "..", ".."))
+BACKEND_DIR = os.path.join(REPO_ROOT, "backend")
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
+
+# Configure test database BEFORE importing session
+os.environ["DATABASE_URL"] = "sqlite+pysqlite:///:memory:"
+
+import pytest  # noqa: E402
+
+from app.db.base import Base  # noqa: E402
+from app.db.session import SessionLocal, engine  # noqa: E402
+from app.models.headline import Headline  # noqa: E402
+from app.models.risk_score import RiskScore  # noqa: E402
+from app.models.ticker import Ticker  # noqa: E402
+from app.nlp import processor as p  # noqa: E402
+from app.nlp import registry  # noqa: E402
+
+
+def setup_function(_: object) -> None:
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    p._ticker_index_cache = {}
+
+
+def _provision(root, entry: str, **info) -> str:
+    path = root / entry
+    path.mkdir()
+    (path / registry.MANIFEST).write_text(json.dumps(info))
+    return str(path)
+
+
+def test_resolve_prefers_configured_then_priority(tmp_path, monkeypatch: pytest.MonkeyPatch) -> None:
+    _provision(tmp_path, "tone", name="yiyanghkust/finbert-tone", version="abc123", priority=1)
+    _provision(tmp_path, "finbert", name="ProsusAI/finbert", version="4556d13", priority=0)
+    _provision(tmp_path, "ner", name="dslim/bert-base-NER", version="1", task="ner")
+    (tmp_path / "not-a-model").mkdir()
+
+    monkeypatch.delenv("NLP_SENTIMENT_MODEL", raising=False)
+    assert [s.name for s in registry.list_models(str(tmp_path))] == ["ProsusAI/finbert", "yiyanghkust/finbert-tone"]
+    assert registry.resolve(str(tmp_path)).version == "4556d13"
+
+    monkeypatch.setenv("NLP_SENTIMENT_MODEL", "yiyanghkust/finbert-tone")
+    assert registry.resolve(str(tmp_path)).version == "abc123"
+    monkeypatch.setenv("NLP_SENTIMENT_MODEL", "missing")
+    assert registry.resolve(str(tmp_path)) is None
+
+
+def test_registry_model_identity_is_recorded_on_scores(tmp_path, monkeypatch: pytest.MonkeyPatch) -> None:
+    _provision(tmp_path, "finbert", name="ProsusAI/finbert", version="4556d13")
+    monkeypatch.setenv("MODEL_REGISTRY_DIR", str(tmp_path))
+    monkeypatch.delenv("NLP_SENTIMENT_MODEL", raising=False)
+    monkeypatch.setattr(p, "pipeline", object())
+    monkeypatch.setattr(p, "_sentiment_pipeline", None)
+    monkeypatch.setattr(p, "_sentiment_model_identity", ("finbert", None))
+    loaded = []
+    monkeypatch.setattr(
+        registry,
+        "load_pipeline",
+        lambda spec: loaded.append(spec.path) or (lambda text, **kw: [{"label": "negative", "score": 0.9}]),
+    )
+    monkeypatch.setattr(p, "detect_entities", lambda text: ["AAPL"])
+
+    with SessionLocal() as db:
+        db.add(Ticker(symbol="AAPL", name="Apple Inc."))
+        h = Headline(title="AAPL plunges")
+        db.add(h)
+        db.commit()
+        p.process_headline(db, h.id)
+        score = db.query(RiskScore).one()
+        assert (score.model, score.model_version, score.sentiment) == ("ProsusAI/finbert", "4556d13", -0.9)
+    assert loaded == [str(tmp_path / "finbert")]
+
+
+def test_unusable_registry_is_reported_once_and_fails_worker_start(
+    tmp_path, monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+) -> None:
+    from app.workers import lifecycle
+
+    monkeypatch.setenv("MODEL_REGISTRY_DIR", str(tmp_path))
+    monkeypatch.setenv("NLP_SENTIMENT_MODEL", "missing")
+    monkeypatch.setattr(p, "pipeline", object())
+    monkeypatch.setattr(p, "_sentiment_pipeline", None)
+    monkeypatch.setattr(p, "_sentiment_load_error", None)
+    resolved = []
+    monkeypatch.setattr(registry, "resolve", lambda: resolved.append(1))
+
+    assert p._get_sentiment_pipeline() is None
+    assert p._get_sentiment_pipeline() is None
+    assert resolved == [1]
+    assert "MODEL_REGISTRY_DIR" in p.sentiment_load_error()
+    assert [r.levelname for r in caplog.records if r.name == "processor"] == ["ERROR"]
+
+    monkeypatch.setattr(p, "_get_spacy_model", lambda: None)
+    with pytest.raises(RuntimeError, match="sentiment model unavailable"):
+        lifecycle.load_models()
+
+
+def test_measure_cold_start_uses_injected_loader(tmp_path) -> None:
+    spec = registry.ModelSpec(name="m", version="1", path=str(tmp_path))
+    readings = iter([100 * 2**20, 150 * 2**20])
+    result = registry.measure_cold_start(spec, load=lambda s: (lambda texts: None), rss_bytes=lambda: next(readings))
+    assert result["rss_mib"] == 150.0 and result["rss_delta_mib"] == 50.0
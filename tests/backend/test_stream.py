@@ -0,0 +1,150 @@
+import asyncio
+import os
+import sys
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+from httpx import AsyncClient, ASGITransport
+
+
+# Ensure backend package is importable and DB is in-memory for tests
+CURRENT_DIR = os.path.dirname(__file__)
+REPO_ROOT = os.path.abspath(os.path.join(CURRENT_DIR, "..", ".."))
+BACKEND_DIR = os.path.join(REPO_ROOT, "backend")
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
+
+os.environ["DATABASE_URL"] = "sqlite+pysqlite:///:memory:"
+
+from app.api.v1.stream import sse_events  # noqa: E402
+from app.db.base import Base  # noqa: E402
+from app.db.session import SessionLocal, engine  # noqa: E402
+from app.main import app  # noqa: E402
+from app.models.headline import Headline  # noqa: E402
+from app.models.ticker import Ticker  # noqa: E402
+from app.nlp import processor as p  # noqa: E402
+from app.realtime.hub import RedisBridge, RiskHub, hub  # noqa: E402
+
+
+def setup_function(_: object) -> None:
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    p._ticker_index_cache = {}
+
+
+class _Request:
+    def __init__(self) -> None:
+        self.disconnected = False
+
+    async def is_disconnected(self) -> bool:
+        return self.disconnected
+
+
+@pytest.mark.asyncio
+async def test_hub_routes_by_symbol_and_bounds_slow_clients() -> None:
+    local = RiskHub()
+    aapl = local.subscribe(["aapl"], max_buffer=2)
+    both = local.subscribe(["AAPL", "MSFT"], max_buffer=10)
+    assert local.publish({"symbol": "MSFT", "n": 0}) == 1
+    for n in range(1, 6):
+        local.publish({"symbol": "AAPL", "n": n})
+    assert aapl.queue.qsize() == 2 and both.queue.qsize() == 6
+
+    # The slow subscriber learns what it missed, then gets the newest events
+    assert await aapl.next_event(0.1) == {"type": "lagged", "dropped": 3}
+    assert [(await aapl.next_event(0.1))["n"] for _ in range(2)] == [4, 5]
+    assert await aapl.next_event(0.01) is None
+
+    local.unsubscribe(aapl)
+    local.unsubscribe(both)
+    assert local.subscriber_count() == 0
+
+
+@pytest.mark.asyncio
+async def test_scores_publish_after_commit_only() -> None:
+    with SessionLocal() as db:
+        ticker = Ticker(symbol="AAPL", name="Apple Inc.")
+        db.add(ticker)
+        db.add_all([Headline(title="Apple recalls chargers"), Headline(title="Apple beats")])
+        db.commit()
+        sub = hub.subscribe(["AAPL"])
+        try:
+            # The symbol comes from the caller, not the (here empty) ticker index cache
+            p._add_score_rows(db, 1, "Apple recalls chargers", [(ticker.id, "AAPL")], -0.6, 0.7)
+            db.rollback()
+            p._add_score_rows(db, 2, "Apple beats", [(ticker.id, "AAPL")], 0.5, 0.2)
+            assert sub.queue.empty()
+            db.commit()
+            event = await sub.next_event(1.0)
+            assert await sub.next_event(0.01) is None
+        finally:
+            hub.unsubscribe(sub)
+    assert event["type"] == "risk" and event["symbol"] == "AAPL"
+    assert event["headline"] == {"id": 2, "title": "Apple beats"}
+    assert event["risk_percent"] is not None and isinstance(event["ts"], str)
+
+
+@pytest.mark.asyncio
+async def test_sse_stream_formats_events_and_unsubscribes() -> None:
+    request = _Request()
+    stream = sse_events(request, ["AAPL"])
+    assert await stream.__anext__() == "retry: 3000\n\n"
+    pending = asyncio.ensure_future(stream.__anext__())
+    await asyncio.sleep(0)
+    hub.publish({"type": "risk", "symbol": "AAPL", "risk_percent": 61.5})
+    assert await pending == 'event: risk\ndata: {"type":"risk","symbol":"AAPL","risk_percent":61.5}\n\n'
+    await stream.aclose()
+    assert hub.subscriber_count("AAPL") == 0
+
+
+@pytest.mark.asyncio
+async def test_stream_rejects_bad_symbol_lists() -> None:
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        assert (await ac.get("/v1/stream/risk", params={"symbols": " , "})).status_code == 400
+        too_many = ",".join(f"T{i}" for i in range(100))
+        assert (await ac.get("/v1/stream/risk", params={"symbols": too_many})).status_code == 400
+
+
+def test_websocket_receives_events_published_from_another_thread() -> None:
+    with TestClient(app) as client:
+        with client.websocket_connect("/v1/stream/risk?symbols=AAPL,MSFT") as ws:
+            deadline = time.monotonic() + 5
+            while hub.subscriber_count("MSFT") == 0 and time.monotonic() < deadline:
+                time.sleep(0.01)
+            hub.publish({"type": "risk", "symbol": "TSLA", "risk_percent": 10.0})
+            hub.publish({"type": "risk", "symbol": "MSFT", "risk_percent": 42.0})
+            assert ws.receive_json() == {"type": "risk", "symbol": "MSFT", "risk_percent": 42.0}
+    deadline = time.monotonic() + 5
+    while hub.subscriber_count() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert hub.subscriber_count() == 0
+
+
+@pytest.mark.asyncio
+async def test_redis_bridge_relays_messages_to_the_hub() -> None:
+    local = RiskHub()
+    sub = local.subscribe(["NVDA"])
+    bridge = RedisBridge(target=local)
+    bridge.handle_message(b'{"type":"risk","symbol":"NVDA","risk_percent":70.0}')
+    bridge.handle_message(b"not json")
+    assert await sub.next_event(0.1) == {"type": "risk", "symbol": "NVDA", "risk_percent": 70.0}
+    assert await sub.next_event(0.01) is None
+
+
+@pytest.mark.asyncio
+async def test_persisted_scores_publish_symbols_after_the_index_cache_is_dropped() -> None:
+    with SessionLocal() as db:
+        db.add(Ticker(symbol="AAPL", name="Apple Inc."))
+        db.add(Headline(title="AAPL recalls chargers"))
+        db.commit()
+        results = p.analyze_headlines(db, [1])
+        p._ticker_index_cache = {}
+        sub = hub.subscribe(["AAPL"])
+        try:
+            p.persist_headline_scores(db, results)
+            event = await sub.next_event(1.0)
+        finally:
+            hub.unsubscribe(sub)
+    assert event is not None and event["symbol"] == "AAPL"
@@ -0,0 +1,141 @@
+import os
+import sys
+
+# Ensure backend package is importable
+CURRENT_DIR = os.path.dirname(__file__)
+REPO_ROOT = os.path.abspath(os.path.join(CURRENT_DIR, "..", ".."))
+BACKEND_DIR = os.path.join(REPO_ROOT, "backend")
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
+
+# Configure test database BEFORE importing session
+os.environ["DATABASE_URL"] = "sqlite+pysqlite:///:memory:"
+
+import pytest  # noqa: E402
+
+from app.db.base import Base  # noqa: E402
+from app.db.session import SessionLocal, engine  # noqa: E402
+from app.ingest import events  # noqa: E402
+from app.ingest.news_fetcher import insert_headlines  # noqa: E402
+from app.models.headline import Headline  # noqa: E402
+from app.models.ticker import Ticker  # noqa: E402
+from app.nlp import processor as p  # noqa: E402
+from app.workers import trigger as t  # noqa: E402
+from app.workers.claims import claim_headline_batch  # noqa: E402
+
+
+def setup_function(_: object) -> None:
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    p._ticker_index_cache = {}
+
+
+def test_inserted_ids_are_scored_by_the_event_trigger(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("HEADLINE_EVENTS_BACKEND", "memory")
+    monkeypatch.setattr(p, "detect_entities", lambda text: ["AAPL"])
+    monkeypatch.setattr(p, "sentiment_scores", lambda texts: [0.3 for _ in texts])
+    latencies = []
+    original = t.observe_score_latency
+    monkeypatch.setattr(t, "observe_score_latency", lambda *a: latencies.extend(original(*a)) or latencies)
+
+    trigger = t.EventTrigger(subscriber=events.MemorySubscriber(), batch_size=8, linger_s=0.0)
+    try:
+        with SessionLocal() as db:
+            db.add(Ticker(symbol="AAPL", name="Apple Inc."))
+            db.commit()
+            ids = insert_headlines(db, [{"text": f"AAPL update {i}", "url": f"https://x.test/{i}"} for i in range(3)])
+
+        assert trigger.run_once(timeout_s=1.0) == 3
+        with SessionLocal() as db:
+            assert {h.status for h in db.query(Headline).filter(Headline.id.in_(ids))} == {"scored"}
+            # Nothing left for the fallback sweep
+            assert claim_headline_batch(db) == []
+        assert len(latencies) == 3 and all(s >= 0.0 for s in latencies)
+
+        # Ids already claimed elsewhere (e.g. by the sweep) are skipped
+        assert t.process_event_batch(ids) == {"claimed": 0}
+    finally:
+        trigger.stop()
+
+
+def test_memory_events_are_not_queued_without_a_subscriber(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("HEADLINE_EVENTS_BACKEND", "memory")
+    with SessionLocal() as db:
+        insert_headlines(db, [{"text": "Quiet session", "url": "https://x.test/q"}])
+    assert events._memory_queue is None
+
+
+def test_subscriber_is_abstract() -> None:
+    with pytest.raises(TypeError):
+        events.Subscriber()
+
+
+class _FakeNotify:
+    def __init__(self, payload: str) -> None:
+        self.payload = payload
+
+
+class _FakeCursor:
+    def __init__(self, conn: "_FakeConn") -> None:
+        self.conn = conn
+
+    def __enter__(self) -> "_FakeCursor":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        return None
+
+    def execute(self, sql: str) -> None:
+        self.conn.statements.append(sql)
+
+
+class _FakeConn:
+    def __init__(self, broken: bool = False) -> None:
+        self.autocommit = False
+        self.broken = broken
+        self.statements: list = []
+        self.notifies: list = []
+
+    def cursor(self) -> _FakeCursor:
+        return _FakeCursor(self)
+
+    def poll(self) -> None:
+        if self.broken:
+            raise RuntimeError("server closed the connection unexpectedly")
+
+
+class _FakeFairy:
+    def __init__(self, conn: _FakeConn) -> None:
+        self.driver_connection = conn
+        self.invalidated = False
+
+    def invalidate(self) -> None:
+        self.invalidated = True
+
+    def close(self) -> None:
+        pass
+
+
+def test_postgres_subscriber_reconnects_and_listens_again(monkeypatch: pytest.MonkeyPatch) -> None:
+    first, second = _FakeConn(broken=True), _FakeConn()
+    second.notifies.append(_FakeNotify("5,6"))
+    fairies = [_FakeFairy(first), None, _FakeFairy(second)]
+
+    class _Engine:
+        def raw_connection(self):
+            fairy = fairies.pop(0)
+            if fairy is None:
+                raise RuntimeError("connection refused")
+            return fairy
+
+    # Every connection is "readable"; real sockets are not needed
+    monkeypatch.setattr(events.select, "select", lambda r, w, x, timeout: (r, [], []))
+    sub = events.PostgresSubscriber(_Engine(), reconnect_base_s=0.01, reconnect_max_s=0.05)
+    dropped = sub._fairy
+    assert first.statements == ["LISTEN new_headlines"] and first.autocommit
+
+    assert sub.get(0.1, 10) == []  # connection drops mid-poll
+    assert dropped.invalidated
+    assert sub.get(0.1, 10) == []  # reconnect refused, backs off
+    assert sub.get(0.1, 10) == [5, 6]  # reconnected and listening again
+    assert second.statements == ["LISTEN new_headlines"]